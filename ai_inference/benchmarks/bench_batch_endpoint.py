@@ -0,0 +1,63 @@
+"""
+Compare per-item cost of ``POST /infer`` and ``POST /infer/batch``.
+
+Sends the same documents once as individual requests and once as batch
+requests, in-process, and reports the cost per document.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_batch_endpoint --documents 5000 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+from infrastructure.jwt_service import create_token
+from src.main import app
+
+
+async def main(documents: int, batch_size: int, concurrency: int):
+    logging.getLogger().setLevel(logging.WARNING)
+    token = create_token({"sub": "bench", "exp": datetime.utcnow() + timedelta(hours=1)})
+    headers = {"Authorization": f"Bearer {token}"}
+    texts = [f"document number {index}" for index in range(documents)]
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = iter(texts)
+
+        async def single_worker():
+            for text in remaining:
+                response = await client.post("/infer", headers=headers, json={"text": text})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(single_worker() for _ in range(concurrency)))
+        single = (time.perf_counter() - start) / documents
+
+        start = time.perf_counter()
+        for offset in range(0, documents, batch_size):
+            response = await client.post(
+                "/infer/batch",
+                headers=headers,
+                json={"texts": texts[offset : offset + batch_size]},
+            )
+            response.raise_for_status()
+        batch = (time.perf_counter() - start) / documents
+
+    print(f"single: {single * 1_000_000:,.1f} us per document")
+    print(f"batch:  {batch * 1_000_000:,.1f} us per document ({batch / single:.1%} of single)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.documents, args.batch_size, args.concurrency))
@@ -0,0 +1,112 @@
+"""
+Load test ``POST /infer`` at high concurrency.
+
+Compares the original route (a sync handler that verifies the token and
+runs the model on Starlette's threadpool) with the current async route
+(async auth dependency, model offloaded only when it blocks), reporting
+throughput and p50/p99 latency at each concurrency level.
+
+Each request sends a distinct text with ``Cache-Control: no-cache`` so the
+inference cache does not serve it.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_concurrency --requests 20000 --concurrency 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import httpx
+import jwt
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from benchmarks.harness import percentile
+from config.response_handler import ResponseHandler
+from config.settings import settings
+from infrastructure.jwt_service import create_token
+from src.routers.inference_router import router as inference_router
+from src.schema.dto.inference_dto import InferenceRequest, InferenceResponse
+
+
+def build_sync_app() -> FastAPI:
+    """The ``/infer`` route as it was before the async auth dependency."""
+    router = APIRouter(prefix="/infer")
+    auth_scheme = HTTPBearer()
+
+    @router.post("", response_model=InferenceResponse)
+    def infer(
+        request: InferenceRequest,
+        credentials: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    ):
+        try:
+            jwt.decode(
+                credentials.credentials, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+            )
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        return ResponseHandler.success(data=InferenceResponse(result=request.text[::-1]))
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def build_async_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(inference_router)
+    return app
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> Tuple[float, List[float]]:
+    token = create_token({"sub": "bench", "exp": datetime.utcnow() + timedelta(hours=1)})
+    headers = {"Authorization": f"Bearer {token}", "Cache-Control": "no-cache"}
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=None
+    ) as client:
+
+        async def worker():
+            for index in remaining:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/infer", headers=headers, json={"text": f"document {index}"}
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start), latencies
+
+
+async def main(requests: int, levels: List[int]):
+    logging.basicConfig(level=logging.WARNING)
+    print(f"{'route':>6} {'conc':>6} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for concurrency in levels:
+        for name, app in (("sync", build_sync_app()), ("async", build_async_app())):
+            await measure(app, min(requests, 1000), concurrency)  # warm up
+            rps, latencies = await measure(app, requests, concurrency)
+            print(
+                f"{name:>6} {concurrency:>6} {rps:>8,.0f} "
+                f"{statistics.median(latencies) * 1000:>8.2f} "
+                f"{percentile(latencies, 0.99) * 1000:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,56 @@
+"""
+Microbenchmark for JWT verification.
+
+Compares a full ``jwt.decode`` with ``decode_token`` on a cache hit for
+HS256, RS256 and EdDSA tokens. The cache hit cost is the same for every
+algorithm: one digest of the token and one dict lookup.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_jwt
+"""
+
+import argparse
+import time
+import timeit
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from infrastructure import jwt_service
+from infrastructure.jwt_service import VerifiedTokenCache
+
+
+def keys():
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ed_key = ed25519.Ed25519PrivateKey.generate()
+    return [
+        ("HS256", "secret", "secret"),
+        ("RS256", rsa_key, rsa_key.public_key()),
+        ("EdDSA", ed_key, ed_key.public_key()),
+    ]
+
+
+def per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1_000_000
+
+
+def main(number: int):
+    payload = {"sub": "bench-user", "exp": int(time.time()) + 3600}
+    print(f"{'algorithm':>9} {'jwt.decode us':>14} {'cache hit us':>13} {'speedup':>8}")
+    for algorithm, signing_key, verification_key in keys():
+        token = jwt.encode(payload, signing_key, algorithm=algorithm)
+        full = per_call_us(
+            lambda: jwt.decode(token, verification_key, algorithms=[algorithm]), number
+        )
+
+        jwt_service.token_cache = VerifiedTokenCache(max_entries=10000, ttl_seconds=300)
+        jwt_service.token_cache.set(jwt_service.token_cache.key(token), payload)
+        cached = per_call_us(lambda: jwt_service.decode_token(token), number)
+        print(f"{algorithm:>9} {full:>14.2f} {cached:>13.2f} {full / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    main(parser.parse_args().number)
@@ -0,0 +1,62 @@
+"""
+Measure the cost of metrics collection relative to ``POST /infer``.
+
+Times the exact instrumentation a single ``/infer`` request performs (two
+histogram timers, one histogram observation and one labelled counter
+increment) and compares it with the in-process mean request latency.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_metrics
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import timeit
+
+from benchmarks.bench_request_middleware import build_app, measure
+from infrastructure.jwt_service import JWT_DECODE_SECONDS
+from src.application.services.model_registry import INFERENCE_SECONDS
+from src.middleware.request_middleware import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    RequestLoggerMiddleware,
+)
+
+
+def instrumentation_per_request():
+    with JWT_DECODE_SECONDS.time():
+        pass
+    with INFERENCE_SECONDS.time():
+        pass
+    HTTP_REQUEST_SECONDS.observe(0.001)
+    HTTP_REQUESTS.labels(method="POST", status=200).inc()
+
+
+def main(iterations: int, requests: int, concurrency: int):
+    logging.basicConfig(level=logging.WARNING)
+
+    number = iterations
+    best = min(timeit.repeat(instrumentation_per_request, number=number, repeat=5))
+    metrics_ns = best / number * 1_000_000_000
+
+    app = build_app(RequestLoggerMiddleware)
+    asyncio.run(measure(app, min(requests, 500), concurrency))  # warm up
+    start = time.perf_counter()
+    rps = asyncio.run(measure(app, requests, 1))
+    request_ns = (time.perf_counter() - start) / requests * 1_000_000_000
+
+    print(f"metrics per request: {metrics_ns:,.0f} ns")
+    print(f"request latency:     {request_ns:,.0f} ns ({rps:,.0f} req/s sequential)")
+    print(f"overhead:            {metrics_ns / request_ns:.3%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    main(args.iterations, args.requests, args.concurrency)
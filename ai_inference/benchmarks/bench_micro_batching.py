@@ -0,0 +1,78 @@
+"""
+Load benchmark for the inference micro-batcher.
+
+Drives ``MicroBatcher`` with a simulated model whose cost is a fixed
+per-call overhead plus a small per-item cost, the shape of most real
+batched models, and reports throughput and p50/p99 latency for a grid of
+``max_batch_size`` / ``max_wait_ms`` settings.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_micro_batching --requests 4000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from starlette.concurrency import run_in_threadpool
+
+from benchmarks.harness import percentile
+from src.application.services.micro_batcher import MicroBatcher
+
+SETTINGS_GRID = [(1, 0.0), (8, 1.0), (32, 2.0), (64, 5.0), (128, 10.0)]
+
+
+def make_model(call_overhead_ms: float, per_item_ms: float):
+    def predict(texts: List[str]) -> List[str]:
+        time.sleep((call_overhead_ms + per_item_ms * len(texts)) / 1000)
+        return [text[::-1] for text in texts]
+
+    async def model(texts: List[str]) -> List[str]:
+        return await run_in_threadpool(predict, texts)
+
+    return model
+
+
+async def run(batcher: MicroBatcher, requests: int, concurrency: int):
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def client():
+        for index in remaining:
+            start = time.perf_counter()
+            await batcher.submit(f"document {index}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return requests / elapsed, latencies
+
+
+async def main(args):
+    model = make_model(args.call_overhead_ms, args.per_item_ms)
+    print(
+        f"model: {args.call_overhead_ms}ms per call + {args.per_item_ms}ms per item, "
+        f"{args.requests} requests at concurrency {args.concurrency}"
+    )
+    print(f"{'batch':>6} {'wait ms':>8} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for max_batch_size, max_wait_ms in SETTINGS_GRID:
+        batcher = MicroBatcher(model, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        rps, latencies = await run(batcher, args.requests, args.concurrency)
+        print(
+            f"{max_batch_size:>6} {max_wait_ms:>8.1f} {rps:>10,.0f} "
+            f"{statistics.median(latencies) * 1000:>8.2f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--call-overhead-ms", type=float, default=2.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.05)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,111 @@
+"""
+Overload test for admission control.
+
+Serves a route whose capacity is fixed (``--capacity`` concurrent slots of
+``--service-ms`` each) and offers it far more concurrent clients than it
+can serve, with and without ``AdmissionControlMiddleware``. Reports goodput
+and the latency of successful requests, plus how quickly shed requests
+were answered; shed clients wait for ``Retry-After`` before retrying.
+Without admission control every request queues, so latency grows with
+the number of clients; with it, admitted requests keep a bounded latency
+and the excess is rejected in well under a millisecond.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_overload --clients 1000 --seconds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.harness import percentile
+from infrastructure.loop_monitor import LoopLagMonitor
+from src.middleware.admission_middleware import AdmissionControlMiddleware, AdmissionController
+
+
+def build_app(capacity: int, service_ms: float, max_in_flight: Optional[int]) -> FastAPI:
+    app = FastAPI()
+    slots = asyncio.Semaphore(capacity)
+
+    @app.get("/work")
+    async def work():
+        async with slots:
+            await asyncio.sleep(service_ms / 1000)
+        return {"ok": True}
+
+    if max_in_flight:
+        controller = AdmissionController(
+            max_in_flight=max_in_flight,
+            max_latency_ms=0,
+            max_loop_lag_ms=0,
+            loop_monitor=LoopLagMonitor(),
+        )
+        app.add_middleware(AdmissionControlMiddleware, controller=controller)
+    return app
+
+
+async def run(app: FastAPI, clients: int, seconds: float):
+    ok: List[float] = []
+    shed: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    deadline = time.perf_counter() + seconds
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=None
+    ) as client:
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.get("/work")
+                elapsed = time.perf_counter() - start
+                if response.status_code == 200:
+                    ok.append(elapsed)
+                else:
+                    shed.append(elapsed)
+                    await asyncio.sleep(float(response.headers["retry-after"]))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+    return ok, shed, time.perf_counter() - start
+
+
+async def main(args):
+    logging.basicConfig(level=logging.WARNING)
+    capacity_rps = args.capacity / (args.service_ms / 1000)
+    print(
+        f"{args.clients} clients, capacity {args.capacity} x {args.service_ms}ms "
+        f"(~{capacity_rps:,.0f} req/s)"
+    )
+    print(
+        f"{'admission':>12} {'goodput/s':>10} {'ok p50 ms':>10} {'ok p99 ms':>10} "
+        f"{'ok p999 ms':>11} {'shed %':>7} {'shed p99 ms':>12}"
+    )
+    for name, max_in_flight in (("off", None), (f"max {args.max_in_flight}", args.max_in_flight)):
+        app = build_app(args.capacity, args.service_ms, max_in_flight)
+        ok, shed, elapsed = await run(app, args.clients, args.seconds)
+        total = len(ok) + len(shed)
+        print(
+            f"{name:>12} {len(ok) / elapsed:>10,.0f} "
+            f"{statistics.median(ok) * 1000:>10.1f} {percentile(ok, 0.99) * 1000:>10.1f} "
+            f"{percentile(ok, 0.999) * 1000:>11.1f} {len(shed) / total:>7.1%} "
+            f"{(percentile(shed, 0.99) * 1000 if shed else 0):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--capacity", type=int, default=8)
+    parser.add_argument("--service-ms", type=float, default=20)
+    parser.add_argument("--max-in-flight", type=int, default=32)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,89 @@
+"""
+Compare thread and process-pool model executors on a CPU-bound model.
+
+``BusyModel`` burns a fixed amount of pure-Python CPU per item, holding the
+GIL like a real in-process model would. The benchmark runs the same load
+through ``ThreadModelExecutor`` and ``ProcessModelExecutor`` and reports
+throughput, and checks a large batch round-trips through shared memory.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_process_pool --batches 64 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Sequence
+
+from src.application.services.inference_model import InferenceModel
+from src.application.services.model_executor import (
+    ProcessModelExecutor,
+    ThreadModelExecutor,
+)
+
+MODEL_PATH = "benchmarks.bench_process_pool:BusyModel"
+STUB_MODEL_PATH = "src.application.services.inference_model:ReverseTextModel"
+
+
+class BusyModel(InferenceModel):
+    name = "busy"
+    version = "1"
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        outputs = []
+        for text in texts:
+            acc = 0
+            for index in range(20_000):
+                acc += index * index
+            outputs.append(text[::-1])
+        return outputs
+
+
+async def throughput(executor, batches: int, batch_size: int) -> float:
+    batch = [f"document {index}" for index in range(batch_size)]
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.run(batch) for _ in range(batches)))
+    return batches * batch_size / (time.perf_counter() - start)
+
+
+async def main(batches: int, batch_size: int, workers: int):
+    workers = workers or os.cpu_count() or 1
+    thread_executor = ThreadModelExecutor(BusyModel())
+    process_executor = ProcessModelExecutor(MODEL_PATH, workers=workers, shm_threshold=0)
+    process_executor.start()
+    try:
+        thread_rps = await throughput(thread_executor, batches, batch_size)
+        process_rps = await throughput(process_executor, batches, batch_size)
+
+    finally:
+        process_executor.shutdown()
+
+    large = ["x" * 1024 + str(index) for index in range(8192)]
+    transfer_ms = {}
+    for label, threshold in (("pickled", 0), ("shared memory", 1024 * 1024)):
+        executor = ProcessModelExecutor(STUB_MODEL_PATH, workers=1, shm_threshold=threshold)
+        executor.start()
+        try:
+            await executor.run(large)  # warm up
+            start = time.perf_counter()
+            result = await executor.run(large)
+            transfer_ms[label] = (time.perf_counter() - start) * 1000
+            assert result == [text[::-1] for text in large]
+        finally:
+            executor.shutdown()
+
+    print(f"thread executor:            {thread_rps:,.0f} items/s")
+    print(f"process executor ({workers} procs): {process_rps:,.0f} items/s ({process_rps / thread_rps:.2f}x)")
+    for label, elapsed in transfer_ms.items():
+        print(f"8 MiB batch, {label}: {elapsed:.1f} ms round trip")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(main(args.batches, args.batch_size, args.workers))
@@ -0,0 +1,92 @@
+"""
+Compare requests per second on ``POST /infer`` with the legacy
+``BaseHTTPMiddleware`` request logger and the pure ASGI one.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_request_middleware --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from infrastructure.jwt_service import create_token
+from src.middleware.request_middleware import RequestLoggerMiddleware
+from src.routers.inference_router import router as inference_router
+
+logger = logging.getLogger("benchmarks.access")
+
+
+class LegacyRequestLoggerMiddleware(BaseHTTPMiddleware):
+    """The request logger as it was before the pure ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        duration = time.time() - start_time
+        timestamp = datetime.utcnow().isoformat()
+
+        logger.info(
+            f"[{timestamp}] {request.method} {request.url.path} - "
+            f"{response.status_code} - {duration:.4f}s"
+        )
+
+        return response
+
+
+def build_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware_class)
+    app.include_router(inference_router)
+    return app
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    """Send ``requests`` inference calls and return the achieved RPS."""
+
+    token = create_token({"sub": "bench", "exp": datetime.utcnow() + timedelta(hours=1)})
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            for _ in remaining:
+                response = await client.post("/infer", headers=headers, json={"text": "hello world"})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int, rounds: int):
+    # Keep the records cheap to drop so only middleware overhead is compared.
+    logging.basicConfig(level=logging.WARNING)
+
+    for name, middleware_class in (
+        ("BaseHTTPMiddleware", LegacyRequestLoggerMiddleware),
+        ("pure ASGI", RequestLoggerMiddleware),
+    ):
+        app = build_app(middleware_class)
+        await measure(app, min(requests, 500), concurrency)  # warm up
+        best = max([await measure(app, requests, concurrency) for _ in range(rounds)])
+        print(f"{name:>20}: {best:,.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rounds))
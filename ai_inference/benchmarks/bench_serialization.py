@@ -0,0 +1,88 @@
+"""
+Compare response envelope serialization paths.
+
+The old path runs ``jsonable_encoder`` over the envelope and then encodes
+the result with the stdlib ``json`` module via ``JSONResponse``; the new
+``FastJSONResponse`` encodes the envelope once with pydantic-core. Both
+must produce identical bytes, which is checked before timing.
+
+Payloads mirror the ``/infer``, ``/infer/batch`` and ``/jobs`` responses
+(the job DTO is defined here so the benchmark does not need the
+telephony service on the path).
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_serialization
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from config.response_handler import FastJSONResponse, ResponseHandler
+from src.schema.dto.inference_dto import BatchInferenceResponse, InferenceResponse
+
+
+class JobResponseDTO(BaseModel):
+    id: str
+    job_name: str
+    phone_number: str
+    status: str
+    schedule_time: datetime
+    created_at: datetime
+    updated_at: datetime
+
+
+def payloads():
+    now = datetime(2025, 5, 20, 12, 0, 0, 123456)
+    return [
+        ("infer", InferenceResponse(result="dlrow olleh")),
+        ("infer/batch x100", BatchInferenceResponse(results=[f"tnemucod {i}" for i in range(100)])),
+        (
+            "jobs",
+            JobResponseDTO(
+                id="5b0f8a9e-2f1c-4c4e-9a77-3f1d8c2b6e01",
+                job_name="Twilio Job",
+                phone_number="+1234567890",
+                status="scheduled",
+                schedule_time=now,
+                created_at=now,
+                updated_at=now,
+            ),
+        ),
+    ]
+
+
+def old_path(data) -> bytes:
+    content = jsonable_encoder(
+        {"success": True, "status_code": 200, "message": "Success", "data": data}
+    )
+    return JSONResponse(status_code=200, content=content).body
+
+
+def new_path(data) -> bytes:
+    return ResponseHandler.success(data=data).body
+
+
+def per_call_us(fn, data, number: int) -> float:
+    return min(timeit.repeat(lambda: fn(data), number=number, repeat=5)) / number * 1_000_000
+
+
+def main(number: int):
+    print(f"{'payload':>17} {'old us':>8} {'new us':>8} {'speedup':>8}")
+    for name, data in payloads():
+        assert old_path(data) == new_path(data), name
+        assert isinstance(ResponseHandler.success(data=data), FastJSONResponse)
+        old = per_call_us(old_path, data, number)
+        new = per_call_us(new_path, data, number)
+        print(f"{name:>17} {old:>8.2f} {new:>8.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5000)
+    main(parser.parse_args().number)
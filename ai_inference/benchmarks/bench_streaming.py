@@ -0,0 +1,105 @@
+"""
+Compare time-to-first-byte and peak memory of ``POST /infer`` and
+``POST /infer/stream`` for growing input sizes.
+
+The ASGI app is driven directly so the time of the first response body
+message can be observed; peak memory is traced with ``tracemalloc``.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.bench_streaming --sizes 1 8 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from infrastructure.jwt_service import create_token
+from src.main import app
+
+BODY_CHUNK = 64 * 1024
+
+
+async def call(path: str, body: bytes, content_type: bytes, token: str):
+    """Send one request and return (ttfb seconds, total seconds, peak bytes)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+        "headers": [
+            (b"authorization", f"Bearer {token}".encode()),
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    offsets = iter(range(0, len(body), BODY_CHUNK))
+    first_byte = None
+    finished = asyncio.Event()
+
+    async def receive():
+        offset = next(offsets, None)
+        if offset is None:
+            # Body fully sent: behave like a client that stays connected
+            # until the response is complete.
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        chunk = body[offset : offset + BODY_CHUNK]
+        return {
+            "type": "http.request",
+            "body": chunk,
+            "more_body": offset + BODY_CHUNK < len(body),
+        }
+
+    async def send(message):
+        nonlocal first_byte
+        if message["type"] == "http.response.body":
+            if first_byte is None:
+                first_byte = time.perf_counter()
+            if not message.get("more_body", False):
+                finished.set()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte - start, total, peak
+
+
+async def main(sizes):
+    logging.getLogger().setLevel(logging.WARNING)
+    token = create_token({"sub": "bench", "exp": datetime.utcnow() + timedelta(hours=1)})
+    print(f"{'MiB':>5} {'endpoint':>14} {'ttfb ms':>9} {'total ms':>9} {'peak MiB':>9}")
+    for size in sizes:
+        text = "a" * (size * 1024 * 1024)
+        raw = text.encode()
+        wrapped = json.dumps({"text": text}).encode()
+        for path, body, content_type in (
+            ("/infer", wrapped, b"application/json"),
+            ("/infer/stream", raw, b"text/plain"),
+        ):
+            ttfb, total, peak = await call(path, body, content_type, token)
+            print(
+                f"{size:>5} {path:>14} {ttfb * 1000:>9.1f} {total * 1000:>9.1f} "
+                f"{peak / 1024 / 1024:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 8, 32])
+    asyncio.run(main(parser.parse_args().sizes))
@@ -0,0 +1,73 @@
+"""
+Offline benchmark suite for the AI inference service.
+
+Drives ``POST /infer`` on the full application (middleware, auth, cache,
+micro-batcher and model) in process, with no network or Redis, and
+reports throughput and p50/p99/p999 latency per scenario:
+
+* ``infer``: a distinct text per request with ``Cache-Control: no-cache``,
+  so every request reaches the model.
+* ``infer_cached``: the same text every time, served by the result cache.
+
+Results can be saved as a baseline and later runs compared against it;
+the exit status is 1 when a scenario regresses by more than
+``--tolerance``.
+
+Run from the ``ai_inference`` directory:
+
+    python -m benchmarks.suite --concurrency 100 1000 --save-baseline baseline.json
+    python -m benchmarks.suite --concurrency 100 1000 --baseline baseline.json
+"""
+
+import os
+
+# Keep access logging and admission control out of the measurement.
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ADMISSION_MAX_IN_FLIGHT", "0")
+os.environ.setdefault("ADMISSION_MAX_LOOP_LAG_MS", "0")
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.harness import add_arguments, closed_loop, report, summarize
+from infrastructure.jwt_service import create_token
+from src.main import app
+
+
+async def run_infer(client: httpx.AsyncClient, requests: int, concurrency: int, cached: bool):
+    token = create_token({"sub": "bench", "exp": datetime.utcnow() + timedelta(hours=1)})
+    headers = {"Authorization": f"Bearer {token}"}
+    if not cached:
+        headers["Cache-Control"] = "no-cache"
+
+    async def call(index: int):
+        text = "cached document" if cached else f"document {index}"
+        response = await client.post("/infer", headers=headers, json={"text": text})
+        response.raise_for_status()
+
+    await closed_loop(call, min(requests, 500), concurrency)  # warm up
+    return await closed_loop(call, requests, concurrency)
+
+
+async def main(args) -> int:
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=None
+    ) as client:
+        for concurrency in args.concurrency:
+            for name, cached in (("infer", False), ("infer_cached", True)):
+                elapsed, latencies = await run_infer(client, args.requests, concurrency, cached)
+                results.append(summarize(f"{name}@{concurrency}", concurrency, elapsed, latencies))
+    return report(args, "ai_inference", results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    sys.exit(asyncio.run(main(parser.parse_args())))
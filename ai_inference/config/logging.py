@@ -1,24 +1,127 @@
-import os
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+from config.settings import settings
 
-def setup_logging():
-    """Set up logging for the application.
+# Attributes every LogRecord carries; anything else was passed via ``extra``.
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects.
+
+    Fields passed through ``extra`` are added to the object as-is.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep one in every ``sample_every`` DEBUG records per logger.
+
+    Records at INFO and above always pass.
+    """
+
+    def __init__(self, sample_every: int):
+        super().__init__()
+        self.sample_every = max(sample_every, 1)
+        self._counters: dict[str, int] = {}
 
-    The logging level is set to INFO, with a format of
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s".
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.sample_every == 1:
+            return True
+        seen = self._counters.get(record.name, 0)
+        self._counters[record.name] = seen + 1
+        return seen % self.sample_every == 0
 
-    Two handlers are used: a StreamHandler for output to the console, and a
-    FileHandler to write to a file in the "logs" directory (which is created
-    if it doesn't exist).
 
-    The log file is named "app.log" and is written to the "logs" directory.
+class _StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback out of the message field.
+
+    The message is merged with its args and the traceback rendered to text
+    before queueing, so the record is safe to hand to the listener thread.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+
+def setup_logging():
+    """Set up non-blocking, structured logging for the application.
+
+    Log calls only put the record on an in-memory queue; a QueueListener
+    thread formats the records as JSON and writes them to the console and to
+    a size-rotated file in the "logs" directory (which is created if it
+    doesn't exist). High-volume DEBUG records are sampled before they are
+    queued.
+
+    The level, file, rotation and sampling are configured through the
+    ``LOG_*`` settings. Calling this more than once has no effect.
     """
 
-    os.makedirs("logs", exist_ok=True)
+    global _listener
+    if _listener is not None:
+        return
+
+    log_dir = os.path.dirname(settings.LOG_FILE)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+
+    formatter = JsonFormatter()
+    file_handler = RotatingFileHandler(
+        settings.LOG_FILE,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(settings.LOG_DEBUG_SAMPLE_EVERY))
+
+    root = logging.getLogger()
+    root.setLevel(settings.LOG_LEVEL)
+    root.handlers = [queue_handler]
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler("logs/app.log"), logging.StreamHandler()],
+    _listener = QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -3,10 +3,31 @@ from typing import Any, Optional
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
 from config.exception_handler import BaseHTTPException
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized in a single pass by pydantic-core.
+
+    Pydantic models, datetimes, enums and UUIDs nested anywhere in the
+    content are encoded directly, without first being converted to plain
+    Python objects by ``jsonable_encoder``. Other unsupported values fall
+    back to ``jsonable_encoder``.
+
+    The output matches ``jsonable_encoder`` except that UTC datetimes end
+    in ``Z`` rather than ``+00:00`` and decimals are encoded as strings.
+    Timedeltas stay floats of seconds.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(
+            content, by_alias=True, timedelta_mode="float", fallback=jsonable_encoder
+        )
+
+
 class ResponseHandler:
     """
     Custom response handler for consistent API responses.
@@ -21,16 +42,14 @@ class ResponseHandler:
         """
         Standardized success response.
         """
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=jsonable_encoder(
-                {
-                    "success": True,
-                    "status_code": status_code,
-                    "message": message,
-                    "data": data,
-                }
-            ),
+            content={
+                "success": True,
+                "status_code": status_code,
+                "message": message,
+                "data": data,
+            },
         )
 
     @staticmethod
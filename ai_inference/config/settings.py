@@ -1,9 +1,63 @@
+from typing import Dict
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     JWT_SECRET: str = "mocksecret"
     JWT_ALGORITHM: str = "HS256"
+    JWT_PRIVATE_KEY_FILE: str = ""
+    JWT_PUBLIC_KEY_FILE: str = ""
+    JWT_JWKS_FILE: str = ""
+    JWT_JWKS_RELOAD_SECONDS: float = 10
+    JWT_KEY_ID: str = ""
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+    JWT_CACHE_TTL_SECONDS: float = 300
+
+    THREADPOOL_SIZE: int = 40
+
+    ADMISSION_MAX_IN_FLIGHT: int = 1000
+    ADMISSION_MAX_LATENCY_MS: float = 0
+    ADMISSION_MAX_LOOP_LAG_MS: float = 250
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    READINESS_CHECK_TIMEOUT: float = 1.0
+
+    LOOP_LAG_INTERVAL: float = 0.1
+    LOOP_LAG_WINDOW: int = 600
+    LOOP_SLOW_CALLBACK_MS: float = 100
+    LOOP_MAX_OFFENDERS: int = 50
+
+    ADMIN_TOKEN: str = ""
+
+    INFERENCE_MODEL: str = "src.application.services.inference_model:ReverseTextModel"
+    INFERENCE_MODELS: Dict[str, str] = {}
+    INFERENCE_EAGER_LOAD: bool = True
+    INFERENCE_WARMUP_BATCHES: int = 1
+    INFERENCE_SWAP_DRAIN_TIMEOUT: float = 30.0
+    INFERENCE_EXECUTOR: str = "thread"
+    INFERENCE_PROCESS_WORKERS: int = 0
+    INFERENCE_PROCESS_START_METHOD: str = "spawn"
+    INFERENCE_SHM_THRESHOLD_BYTES: int = 0
+    INFERENCE_INLINE_MAX_CHARS: int = 64 * 1024
+
+    INFERENCE_MAX_BATCH_SIZE: int = 32
+    INFERENCE_MAX_WAIT_MS: float = 2.0
+    INFERENCE_MAX_BATCH_REQUEST_ITEMS: int = 10000
+
+    INFERENCE_CACHE_ENABLED: bool = True
+    INFERENCE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    INFERENCE_CACHE_MAX_ITEM_BYTES: int = 1024 * 1024
+    INFERENCE_CACHE_TTL_SECONDS: float = 3600
+    INFERENCE_CACHE_REDIS_URL: str = ""
+
+    INFERENCE_STREAM_CHUNK_SIZE: int = 64 * 1024
+    INFERENCE_MAX_STREAM_INPUT_BYTES: int = 8 * 1024 * 1024
+
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "logs/app.log"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+    LOG_DEBUG_SAMPLE_EVERY: int = 100
 
     class Config:
         env_file = ".env"
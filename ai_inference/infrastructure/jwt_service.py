@@ -1,6 +1,253 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 import jwt
 from fastapi import HTTPException
+from jwt.algorithms import get_default_algorithms
 from config.settings import settings
+from infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+JWT_DECODE_SECONDS = registry.histogram(
+    "jwt_decode_seconds", "Time spent verifying and decoding JWTs."
+)
+JWT_DECODE_FAILURES = registry.counter(
+    "jwt_decode_failures_total", "Number of JWTs rejected as invalid."
+)
+JWT_CACHE_LOOKUPS = registry.counter(
+    "jwt_cache_lookups_total", "Verified-token cache lookups by result (hit or miss).", ("result",)
+)
+
+
+class KeySet:
+    """
+    Signing and verification keys for JWTs, parsed once and not on the
+    request path.
+
+    Verification keys come from the first configured source:
+
+    * ``JWT_JWKS_FILE``: a local JWKS document; the key is chosen by the
+      token's ``kid`` header. Once ``start`` is called the file is checked
+      every ``reload_interval`` seconds, off the event loop, and re-read if
+      it changed on disk. Keys added to the file are trusted, and keys
+      removed from it rejected, from the next check; ``on_change`` is called
+      whenever the keys change, so tokens verified with a removed key can be
+      dropped from any cache.
+    * ``JWT_PUBLIC_KEY_FILE``: a PEM public key for ``JWT_ALGORITHM``
+      (e.g. RS256 or EdDSA).
+    * ``JWT_SECRET``: the shared HMAC secret.
+
+    Tokens are signed with ``JWT_PRIVATE_KEY_FILE`` when it is set, and with
+    ``JWT_SECRET`` otherwise.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str,
+        private_key_file: str = "",
+        public_key_file: str = "",
+        jwks_file: str = "",
+        key_id: str = "",
+        reload_interval: float = 0,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        self.algorithm = algorithm
+        self.key_id = key_id
+        self.jwks_file = jwks_file
+        self.reload_interval = reload_interval
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self._jwks: Dict[str, Tuple[Any, str]] = {}
+        self._jwks_mtime: Optional[float] = None
+        self._jwks_digest: Optional[bytes] = None
+        self._task: Optional[asyncio.Task] = None
+
+        prepare = get_default_algorithms()[algorithm].prepare_key
+        self.signing_key = prepare(_read_file(private_key_file)) if private_key_file else secret
+        self.verification_key = (
+            prepare(_read_file(public_key_file)) if public_key_file else secret
+        )
+        if jwks_file:
+            self.reload()
+
+    def start(self):
+        """Start checking the JWKS file for changes on the running event loop."""
+        if self.jwks_file and self.reload_interval > 0 and self._task is None:
+            self._task = asyncio.ensure_future(self._watch())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def resolve(self, token: str) -> Tuple[Any, List[str]]:
+        """
+        Return the key and allowed algorithms for verifying ``token``.
+
+        Args:
+            token (str): The encoded JWT.
+
+        Returns:
+            Tuple[Any, List[str]]: The prepared key and the algorithms it may
+            be used with.
+
+        Raises:
+            jwt.exceptions.InvalidTokenError: If the token names a key that is
+                not in the key set.
+        """
+        if not self.jwks_file:
+            return self.verification_key, [self.algorithm]
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        entry = self._jwks.get(kid)
+        if entry is None:
+            raise jwt.InvalidKeyError(f"Unknown key id: {kid}")
+        key, algorithm = entry
+        return key, [algorithm]
+
+    def reload(self) -> bool:
+        """
+        Re-read the JWKS file if it changed on disk since it was last read.
+
+        This does blocking file I/O; on the event loop it is run in a thread
+        by ``start``.
+
+        Returns:
+            bool: True if the keys changed, in which case ``on_change`` was
+            called unless this was the first load; False if the file is
+            unchanged or cannot be read.
+        """
+        with self._lock:
+            try:
+                mtime = os.stat(self.jwks_file).st_mtime
+            except OSError as e:
+                logger.error("Cannot read JWKS file %s: %s", self.jwks_file, str(e))
+                return False
+            if mtime == self._jwks_mtime:
+                return False
+
+            document = _read_file(self.jwks_file)
+            digest = hashlib.blake2b(document, digest_size=16).digest()
+            replaced = self._jwks_digest is not None
+            changed = digest != self._jwks_digest
+            if changed:
+                keys = {}
+                for jwk in jwt.PyJWKSet.from_json(document.decode("utf-8")).keys:
+                    keys[jwk.key_id] = (jwk.key, jwk.algorithm_name)
+                self._jwks, self._jwks_digest = keys, digest
+                logger.info("Loaded %s keys from %s", len(keys), self.jwks_file)
+            self._jwks_mtime = mtime
+
+        if changed and replaced and self.on_change is not None:
+            self.on_change()
+        return changed
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await asyncio.to_thread(self.reload)
+            except Exception as e:
+                logger.exception("Cannot reload JWKS file %s: %s", self.jwks_file, str(e))
+
+
+class VerifiedTokenCache:
+    """
+    Bounded cache of decoded payloads for tokens that passed verification.
+
+    Entries are keyed by a digest of the token and expire at the token's
+    ``exp`` claim, or after ``ttl_seconds`` if that comes first, so a cached
+    token is never accepted past its expiry. When full, the oldest entry is
+    evicted. Cached payloads are shared between requests and must not be
+    modified.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[bytes, Tuple[dict, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def set(self, key: bytes, payload: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        while len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (payload, expires_at)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+_key_set: Optional[KeySet] = None
+
+token_cache = VerifiedTokenCache(
+    max_entries=settings.JWT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.JWT_CACHE_TTL_SECONDS,
+)
+
+
+def get_key_set() -> KeySet:
+    """
+    Return the process-wide key set, loading the configured keys on first use.
+
+    Returns:
+        KeySet: The key set built from the ``JWT_*`` settings.
+    """
+    global _key_set
+    if _key_set is None:
+        _key_set = KeySet(
+            algorithm=settings.JWT_ALGORITHM,
+            secret=settings.JWT_SECRET,
+            private_key_file=settings.JWT_PRIVATE_KEY_FILE,
+            public_key_file=settings.JWT_PUBLIC_KEY_FILE,
+            jwks_file=settings.JWT_JWKS_FILE,
+            key_id=settings.JWT_KEY_ID,
+            reload_interval=settings.JWT_JWKS_RELOAD_SECONDS,
+            on_change=_clear_token_cache,
+        )
+    return _key_set
+
+
+def _clear_token_cache():
+    # Tokens verified with a key that was removed must be verified again.
+    token_cache.clear()
 
 
 def create_token(payload: dict) -> str:
@@ -14,14 +261,18 @@ def create_token(payload: dict) -> str:
     Returns:
         str: The encoded JWT as a string.
     """
-
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    key_set = get_key_set()
+    headers = {"kid": key_set.key_id} if key_set.key_id else None
+    return jwt.encode(payload, key_set.signing_key, algorithm=key_set.algorithm, headers=headers)
 
 
 def decode_token(token: str) -> dict:
     """
     Decode a JSON Web Token (JWT) to extract the payload.
 
+    Tokens that were verified before and have not expired are served from
+    the verified-token cache without being decoded again.
+
     Args:
         token (str): The encoded JWT as a string.
 
@@ -30,11 +281,22 @@ def decode_token(token: str) -> dict:
               such as 'sub' (subject) and 'exp' (expiration time).
 
     Raises:
-        jwt.exceptions.DecodeError: If the token cannot be decoded.
-        jwt.exceptions.ExpiredSignatureError: If the token has expired.
-        jwt.exceptions.InvalidTokenError: If the token is invalid for other reasons.
+        HTTPException: With status 401 if the token is malformed, expired,
+            signed with an unknown key or otherwise invalid.
     """
+    cache_key = token_cache.key(token)
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        JWT_CACHE_LOOKUPS.labels(result="hit").inc()
+        return payload
+
+    JWT_CACHE_LOOKUPS.labels(result="miss").inc()
     try:
-        return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        with JWT_DECODE_SECONDS.time():
+            key, algorithms = get_key_set().resolve(token)
+            payload = jwt.decode(token, key, algorithms=algorithms)
     except:
+        JWT_DECODE_FAILURES.inc()
         raise HTTPException(status_code=401, detail="Invalid token")
+    token_cache.set(cache_key, payload)
+    return payload
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import settings
+from infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+LOOP_STALLS = registry.counter(
+    "event_loop_stalls_total",
+    "Number of times a callback or task blocked the event loop past the slow threshold.",
+)
+LOOP_STALL_SECONDS = registry.histogram(
+    "event_loop_stall_seconds", "Observed duration of event-loop stalls."
+)
+
+# Frames from these directories are skipped when naming where a stall happened
+_LIBRARY_PATHS = tuple(
+    {sysconfig.get_paths()[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")}
+)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _location(frame: traceback.FrameSummary) -> str:
+    return f"{os.path.relpath(frame.filename)}:{frame.lineno} in {frame.name}"
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag and finds the code that blocks the loop.
+
+    Lag is measured by timing how late a periodic sleep wakes up: a loop
+    that is busy running callbacks resumes the sampler late, and the
+    overshoot is the delay every other ready callback experienced too.
+    ``lag`` is the most recent sample and ``max_lag`` the largest since the
+    last call to ``reset_max``; the last ``window`` samples are kept for
+    percentiles.
+
+    With ``slow_threshold`` set, a watchdog thread posts a probe callback to
+    the loop every quarter of the threshold. A probe that is not run within
+    the threshold means one callback or task step is holding the loop, so
+    the watchdog captures the loop thread's stack while it is still
+    blocked. Stalls are grouped by task and innermost application frame;
+    the ``max_offenders`` groups with the most blocked time are kept. Stall
+    durations are measured from the probe, so they can fall short of the
+    real blocking time by up to a quarter of the threshold. Nothing runs
+    per callback, so the monitor can stay on in production.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        window: int = 600,
+        slow_threshold: float = 0.0,
+        max_offenders: int = 50,
+    ):
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.samples: deque = deque(maxlen=window)
+        self.slow_threshold = slow_threshold
+        self.max_offenders = max_offenders
+        self.stalls = 0
+        self.offenders: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self):
+        """Start sampling, and watching for stalls, on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        if self.slow_threshold and self._watchdog is None:
+            self._stopping = threading.Event()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(asyncio.get_running_loop(), threading.get_ident(), self._stopping),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self):
+        self._stopping.set()
+        self._watchdog = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset_max(self) -> float:
+        """
+        Return the largest lag seen since the previous call and reset it.
+
+        Returns:
+            float: The maximum lag in seconds.
+        """
+        max_lag, self.max_lag = self.max_lag, self.lag
+        return max_lag
+
+    def report(self, limit: int = 10) -> dict:
+        """
+        Summarize recent lag and the code that blocked the loop the longest.
+
+        Args:
+            limit (int): The number of offenders to include.
+
+        Returns:
+            dict: Lag percentiles over the sample window in milliseconds, the
+            number of stalls, and the top offenders by total blocked time,
+            each with the stack of its longest stall.
+        """
+        ordered = sorted(self.samples)
+        with self._lock:
+            offenders = sorted(
+                self.offenders.values(), key=lambda offender: offender["total_seconds"], reverse=True
+            )[:limit]
+            offenders = [dict(offender) for offender in offenders]
+        return {
+            "lag_ms": {
+                "current": round(self.lag * 1000, 3),
+                "p50": round(_percentile(ordered, 0.5) * 1000, 3),
+                "p90": round(_percentile(ordered, 0.9) * 1000, 3),
+                "p99": round(_percentile(ordered, 0.99) * 1000, 3),
+                "max": round((ordered[-1] if ordered else 0.0) * 1000, 3),
+                "samples": len(ordered),
+                "window_seconds": round(len(ordered) * self.interval, 1),
+            },
+            "slow_threshold_ms": self.slow_threshold * 1000,
+            "stalls": self.stalls,
+            "offenders": offenders,
+        }
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(time.perf_counter() - expected, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+            self.samples.append(self.lag)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, thread_id: int, stopping: threading.Event):
+        period = self.slow_threshold / 4
+        while not stopping.wait(period):
+            probe = threading.Event()
+            sent = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(probe.set)
+            except RuntimeError:
+                return  # The loop is closed
+            if probe.wait(self.slow_threshold):
+                continue
+
+            frame = sys._current_frames().get(thread_id)
+            stack = traceback.extract_stack(frame) if frame is not None else traceback.StackSummary()
+            task = asyncio.current_task(loop)
+            del frame
+            while not probe.wait(period):
+                if stopping.is_set() or loop.is_closed():
+                    return
+            self._record(task, stack, time.perf_counter() - sent)
+
+    def _record(self, task: Optional[asyncio.Task], stack: traceback.StackSummary, duration: float):
+        coro = task.get_coro() if task is not None else None
+        task_name = getattr(coro, "__qualname__", None) or "callback"
+        frames = [frame for frame in stack if not frame.filename.startswith(_LIBRARY_PATHS)]
+        location = _location(frames[-1]) if frames else (_location(stack[-1]) if stack else "unknown")
+        lines = [line.rstrip("\n") for line in stack.format()]
+
+        LOOP_STALLS.inc()
+        LOOP_STALL_SECONDS.observe(duration)
+        logger.warning(
+            "Event loop blocked for %.0f ms by %s at %s\n%s",
+            duration * 1000,
+            task_name,
+            location,
+            "\n".join(lines),
+        )
+
+        key = (task_name, location)
+        with self._lock:
+            self.stalls += 1
+            offender = self.offenders.get(key)
+            if offender is None:
+                if len(self.offenders) >= self.max_offenders:
+                    smallest = min(self.offenders, key=lambda k: self.offenders[k]["total_seconds"])
+                    del self.offenders[smallest]
+                offender = self.offenders[key] = {
+                    "task": task_name,
+                    "location": location,
+                    "count": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "last_seen": None,
+                    "stack": [],
+                }
+            offender["count"] += 1
+            offender["total_seconds"] = round(offender["total_seconds"] + duration, 6)
+            offender["last_seen"] = datetime.utcnow().isoformat()
+            if duration >= offender["max_seconds"]:
+                offender["max_seconds"] = round(duration, 6)
+                offender["stack"] = lines
+
+
+loop_monitor = LoopLagMonitor(
+    interval=settings.LOOP_LAG_INTERVAL,
+    window=settings.LOOP_LAG_WINDOW,
+    slow_threshold=settings.LOOP_SLOW_CALLBACK_MS / 1000,
+    max_offenders=settings.LOOP_MAX_OFFENDERS,
+)
+registry.gauge(
+    "event_loop_lag_seconds",
+    "Most recent delay between a scheduled and actual event-loop wakeup.",
+    lambda: loop_monitor.lag,
+)
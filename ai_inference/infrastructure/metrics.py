@@ -0,0 +1,267 @@
+import inspect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple, Union
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+GaugeCallback = Callable[[], Union[float, Awaitable[float]]]
+
+
+def _format_labels(labels: LabelKey, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in pairs
+    )
+    return "{" + rendered + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Sharded(ABC):
+    """
+    Base class for metrics aggregated in per-thread shards.
+
+    Each thread only ever writes to its own shard, so recording a sample
+    needs no lock; shards are summed when the metric is collected.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[list] = []
+
+    @abstractmethod
+    def _new_shard(self) -> list:
+        """Return an empty shard for the calling thread."""
+
+    def _shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._new_shard()
+            self._shards.append(shard)
+            return shard
+
+
+class _CounterChild(_Sharded):
+    def _new_shard(self) -> list:
+        return [0.0]
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter by ``amount``."""
+        self._shard()[0] += amount
+
+    def value(self) -> float:
+        return sum(shard[0] for shard in list(self._shards))
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "_HistogramChild"):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _HistogramChild(_Sharded):
+    def __init__(self, buckets: Tuple[float, ...]):
+        super().__init__()
+        self.buckets = buckets
+
+    def _new_shard(self) -> list:
+        # One slot per bucket, one for +Inf, then the running sum.
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value: float) -> None:
+        """Record a single sample."""
+        shard = self._shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def time(self) -> _Timer:
+        """Context manager that observes the elapsed wall time in seconds."""
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for shard in list(self._shards):
+            for index in range(len(counts)):
+                counts[index] += shard[index]
+            total += shard[-1]
+        return counts, total
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: Dict[LabelKey, object] = {}
+        if not labelnames:
+            self._default = self._child(())
+
+    @abstractmethod
+    def _new_child(self):
+        """Return the child metric for a new combination of label values."""
+
+    def _child(self, key: LabelKey):
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def labels(self, **labels: str):
+        """Return the child metric for the given label values."""
+        return self._child(tuple((name, str(labels[name])) for name in self.labelnames))
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    async def collect(self) -> List[str]:
+        lines = self.header()
+        for key, child in list(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(child.value())}")
+        return lines
+
+
+class Histogram(_Metric):
+    """A latency histogram with cumulative buckets, a sum and a count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return self._default.time()
+
+    async def collect(self) -> List[str]:
+        lines = self.header()
+        for key, child in list(self._children.items()):
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = _format_labels(key, [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """A value computed by a callback when the metrics are scraped."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: GaugeCallback):
+        self.callback = callback
+        super().__init__(name, documentation)
+
+    def _new_child(self):
+        return None
+
+    async def collect(self) -> List[str]:
+        value = self.callback()
+        if inspect.isawaitable(value):
+            value = await value
+        return self.header() + [f"{self.name} {_format_value(value)}"]
+
+
+class MetricsRegistry:
+    """Holds every metric of the process and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: GaugeCallback) -> Gauge:
+        """Register a gauge, replacing any previous callback of the same name."""
+        gauge = Gauge(name, documentation, callback)
+        self._metrics[name] = gauge
+        return gauge
+
+    async def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            try:
+                lines.extend(await metric.collect())
+            except Exception as e:
+                lines.append(f"# {metric.name} collection failed: {e}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,79 @@
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheTier:
+    """
+    Shared cache tier backed by Redis.
+
+    Errors are logged and treated as cache misses, so an unavailable Redis
+    never fails a request. ``redis`` is an optional dependency and is only
+    imported when this tier is configured.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str = "inference:"):
+        from redis.asyncio import Redis
+
+        self.redis = Redis.from_url(url, decode_responses=True)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    async def ping(self) -> None:
+        """
+        Check that Redis is reachable.
+
+        Raises:
+            Exception: Whatever the Redis client raised.
+        """
+        await self.redis.ping()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a single key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached value, or None on a miss or error.
+        """
+        try:
+            return await self.redis.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Redis cache get failed: %s", str(e))
+            return None
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Look up several keys with a single round trip.
+
+        Args:
+            keys (List[str]): The cache keys.
+
+        Returns:
+            List[Optional[str]]: The cached values in key order, None for misses.
+        """
+        try:
+            return await self.redis.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.warning("Redis cache mget failed: %s", str(e))
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict) -> None:
+        """
+        Store several values with a single pipelined round trip.
+
+        Args:
+            items (dict): Cache keys mapped to their values.
+        """
+        if not items:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(self.prefix + key, value, ex=int(self.ttl_seconds) or None)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis cache set failed: %s", str(e))
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Tuple
+
+from config.settings import settings
+from src.application.services.inference_service import model_registry
+from src.middleware.admission_middleware import AdmissionController
+
+
+async def check_dependency(check: Callable[[], Awaitable[Any]]) -> str:
+    """
+    Run a dependency check, bounded by ``READINESS_CHECK_TIMEOUT``.
+
+    Args:
+        check (Callable[[], Awaitable[Any]]): Raises if the dependency is unavailable.
+
+    Returns:
+        str: ``"ok"``, or ``"error: <reason>"`` if the check failed or timed out.
+    """
+    try:
+        await asyncio.wait_for(check(), timeout=settings.READINESS_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return "error: timeout"
+    except Exception as e:
+        return f"error: {type(e).__name__}"
+    return "ok"
+
+
+async def readiness_report(admission: AdmissionController) -> Tuple[bool, dict]:
+    """
+    Report whether this instance should receive traffic.
+
+    The instance is ready when admission control would admit a request and
+    every eagerly loaded model is warm. The Redis cache tier is optional
+    (an unavailable cache only causes misses), so it is reported but does
+    not affect readiness.
+
+    Args:
+        admission (AdmissionController): The admission controller of the app.
+
+    Returns:
+        Tuple[bool, dict]: Whether the instance is ready, and the report.
+    """
+    dependencies = {}
+    if model_registry.cache_shared is not None:
+        dependencies["redis_cache"] = await check_dependency(model_registry.cache_shared.ping)
+
+    models_ready = model_registry.ready()
+    stats = admission.stats()
+    ready = models_ready and stats["shedding"] is None
+    return ready, {
+        "status": "ready" if ready else "not_ready",
+        **stats,
+        "queue_depth": model_registry.queue_depth(),
+        "models_ready": models_ready,
+        "dependencies": dependencies,
+    }
@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from infrastructure.metrics import registry
+from infrastructure.redis_cache import RedisCacheTier
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = registry.counter(
+    "inference_cache_lookups_total",
+    "Inference cache lookups by result (local, shared, coalesced or miss).",
+    ("result",),
+)
+
+
+class LRUCache:
+    """
+    In-process LRU cache bounded by the approximate size of its values.
+
+    Entries older than ``ttl_seconds`` are treated as misses and dropped on
+    access. Values larger than ``max_item_bytes`` are never stored.
+    """
+
+    def __init__(self, max_bytes: int, max_item_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.ttl_seconds = ttl_seconds
+        self.bytes = 0
+        self._entries: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at and expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        size = sys.getsizeof(value) + sys.getsizeof(key)
+        if size > self.max_item_bytes or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        self._entries[key] = (value, expires_at, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self.bytes -= size
+
+
+def hit_ratio() -> float:
+    """
+    Return the share of inference cache lookups that did not need a model call.
+
+    Returns:
+        float: Hits divided by all lookups, or 0.0 before the first lookup.
+    """
+    counts = {
+        result: CACHE_LOOKUPS.labels(result=result).value()
+        for result in ("local", "shared", "coalesced", "miss")
+    }
+    total = sum(counts.values())
+    return (total - counts["miss"]) / total if total else 0.0
+
+
+class InferenceCache:
+    """
+    Two-tier cache of inference results with single-flight de-duplication.
+
+    Keys are a digest of the model identity and the input text, so results
+    of different models or model versions never collide. Lookups hit the
+    in-process LRU first and the optional shared Redis tier second. While a
+    result is being computed, identical requests wait for that computation
+    instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local: LRUCache,
+        shared: Optional[RedisCacheTier] = None,
+    ):
+        self.namespace = namespace
+        self.local = local
+        self.shared = shared
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def key(self, text: str) -> str:
+        """
+        Build the cache key for an input text.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            str: A hex digest of the model identity and the text.
+        """
+        digest = hashlib.blake2b(self.namespace.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def stats(self) -> dict:
+        """
+        Return a summary of the cache state.
+
+        Returns:
+            dict: Entry count, memory use and hit ratio.
+        """
+        return {
+            "entries": len(self.local),
+            "bytes": self.local.bytes,
+            "max_bytes": self.local.max_bytes,
+            "hit_ratio": round(hit_ratio(), 4),
+            "shared_tier": self.shared is not None,
+        }
+
+    async def get_or_compute(
+        self, text: str, compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Return the cached result for ``text``, computing it at most once.
+
+        Args:
+            text (str): The input text.
+            compute (Callable[[], Awaitable[str]]): Produces the result on a miss.
+
+        Returns:
+            str: The inference result.
+        """
+        key = self.key(text)
+        value = self.local.get(key)
+        if value is not None:
+            CACHE_LOOKUPS.labels(result="local").inc()
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            # The fill runs as its own task, so a caller disconnecting does not
+            # cancel the computation other callers are waiting on.
+            inflight = asyncio.ensure_future(self._fill(key, compute))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda task: self._fill_done(key, task))
+        else:
+            CACHE_LOOKUPS.labels(result="coalesced").inc()
+        return await asyncio.shield(inflight)
+
+    async def _fill(self, key: str, compute: Callable[[], Awaitable[str]]) -> str:
+        value = await self.shared.get(key) if self.shared else None
+        if value is not None:
+            CACHE_LOOKUPS.labels(result="shared").inc()
+        else:
+            CACHE_LOOKUPS.labels(result="miss").inc()
+            value = await compute()
+            if self.shared:
+                await self.shared.set_many({key: value})
+        self.local.set(key, value)
+        return value
+
+    def _fill_done(self, key: str, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every waiter went away.
+            task.exception()
+
+    async def get_or_compute_many(
+        self,
+        texts: List[str],
+        compute: Callable[[List[str]], Awaitable[List[str]]],
+    ) -> List[str]:
+        """
+        Return cached results for a batch, computing all misses in one call.
+
+        Duplicate texts within the batch are computed once.
+
+        Args:
+            texts (List[str]): The input texts.
+            compute (Callable[[List[str]], Awaitable[List[str]]]): Produces the
+                results for a list of missed texts, in order.
+
+        Returns:
+            List[str]: The inference results, in input order.
+        """
+        keys = [self.key(text) for text in texts]
+        found: Dict[str, str] = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                found[key] = value
+        CACHE_LOOKUPS.labels(result="local").inc(sum(1 for key in keys if key in found))
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing and self.shared:
+            for key, value in zip(missing, await self.shared.get_many(missing)):
+                if value is not None:
+                    found[key] = value
+                    self.local.set(key, value)
+            CACHE_LOOKUPS.labels(result="shared").inc(
+                sum(1 for key in missing if key in found)
+            )
+            missing = [key for key in missing if key not in found]
+
+        if missing:
+            CACHE_LOOKUPS.labels(result="miss").inc(len(missing))
+            text_by_key = dict(zip(keys, texts))
+            results = await compute([text_by_key[key] for key in missing])
+            computed = dict(zip(missing, results))
+            for key, value in computed.items():
+                self.local.set(key, value)
+            if self.shared:
+                await self.shared.set_many(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
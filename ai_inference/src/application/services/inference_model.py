@@ -0,0 +1,130 @@
+import hashlib
+import importlib
+import inspect
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Sequence, Type
+
+
+class InferenceModel(ABC):
+    """
+    Base class for inference models.
+
+    Models take and return lists so implementations can vectorize over the
+    whole batch (e.g. one NumPy or tensor operation per call) instead of
+    looping over single inputs.
+
+    Models are assumed to block, and are run off the event loop. Models
+    whose calls take only microseconds can set ``blocking = False`` to be
+    called directly on the event loop instead.
+    """
+
+    name: str = "model"
+    version: str = "0"
+    blocking: bool = True
+
+    @abstractmethod
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """
+        Run the model on a batch of texts.
+
+        Args:
+            texts (Sequence[str]): The input texts to be processed.
+
+        Returns:
+            List[str]: One output per input, in input order.
+        """
+
+    @classmethod
+    def warmup_inputs(cls, count: int) -> List[str]:
+        """
+        Return synthetic inputs used to warm the model up after loading.
+
+        Models whose first calls are slow (lazy initialisation, JIT
+        compilation, cache allocation) should return inputs shaped like real
+        traffic.
+
+        Args:
+            count (int): The number of inputs to return.
+
+        Returns:
+            List[str]: The warmup inputs.
+        """
+        return [f"warmup input {index}" for index in range(count)]
+
+    def fingerprint(self) -> str:
+        """
+        Return a digest identifying what this instance computes.
+
+        The fingerprint is part of the result cache namespace. The default
+        digests the file that defines the model class, so cached results
+        survive restarts but not code changes. Models that load weights from
+        elsewhere should return a digest or revision of those weights, so a
+        reload that picks up new weights never serves results of the old ones.
+
+        Returns:
+            str: A short, stable identifier of the loaded model.
+        """
+        with open(inspect.getfile(type(self)), "rb") as source:
+            return hashlib.blake2b(source.read(), digest_size=8).hexdigest()
+
+    def stream(self, text: str, chunk_size: int) -> Iterator[str]:
+        """
+        Run the model on a single text, yielding the output in chunks.
+
+        The default implementation computes the whole output and slices it;
+        models that can produce output incrementally should override this so
+        the full output is never held in memory.
+
+        Args:
+            text (str): The input text to be processed.
+            chunk_size (int): The maximum number of characters per chunk.
+
+        Yields:
+            str: Consecutive chunks of the output.
+        """
+        result = self.predict([text])[0]
+        for start in range(0, len(result), chunk_size):
+            yield result[start : start + chunk_size]
+
+
+class ReverseTextModel(InferenceModel):
+    """Stub model that returns each input text reversed."""
+
+    name = "reverse-text"
+    version = "1"
+    blocking = False
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        return [text[::-1] for text in texts]
+
+    def stream(self, text: str, chunk_size: int) -> Iterator[str]:
+        for end in range(len(text), 0, -chunk_size):
+            yield text[max(end - chunk_size, 0) : end][::-1]
+
+
+def model_class(path: str) -> Type[InferenceModel]:
+    """
+    Import a model class from a ``"package.module:ClassName"`` path.
+
+    Args:
+        path (str): The import path of the model class.
+
+    Returns:
+        Type[InferenceModel]: The model class.
+    """
+    module_name, _, class_name = path.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def load_model(path: str) -> InferenceModel:
+    """
+    Import and instantiate a model from a ``"package.module:ClassName"`` path.
+
+    Args:
+        path (str): The import path of the model class.
+
+    Returns:
+        InferenceModel: A new instance of the model.
+    """
+    return model_class(path)()
@@ -1,12 +1,148 @@
-def perform_inference(text: str) -> str:
+from typing import AsyncIterator, List, Optional
+
+from config.settings import settings
+from infrastructure.metrics import registry
+from infrastructure.redis_cache import RedisCacheTier
+from src.application.services.inference_cache import LRUCache, hit_ratio
+from src.application.services.inference_model import model_class
+from src.application.services.model_registry import LoadedModel, ModelRegistry
+
+
+def _create_registry() -> ModelRegistry:
+    default = model_class(settings.INFERENCE_MODEL).name
+    shared = None
+    if settings.INFERENCE_CACHE_REDIS_URL:
+        shared = RedisCacheTier(
+            settings.INFERENCE_CACHE_REDIS_URL,
+            ttl_seconds=settings.INFERENCE_CACHE_TTL_SECONDS,
+        )
+    return ModelRegistry(
+        models={default: settings.INFERENCE_MODEL, **settings.INFERENCE_MODELS},
+        default=default,
+        eager=settings.INFERENCE_EAGER_LOAD,
+        warmup_batches=settings.INFERENCE_WARMUP_BATCHES,
+        drain_timeout=settings.INFERENCE_SWAP_DRAIN_TIMEOUT,
+        cache_local=LRUCache(
+            max_bytes=settings.INFERENCE_CACHE_MAX_BYTES,
+            max_item_bytes=settings.INFERENCE_CACHE_MAX_ITEM_BYTES,
+            ttl_seconds=settings.INFERENCE_CACHE_TTL_SECONDS,
+        ),
+        cache_shared=shared,
+        max_batch_size=settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait_ms=settings.INFERENCE_MAX_WAIT_MS,
+    )
+
+
+model_registry: ModelRegistry = _create_registry()
+registry.gauge(
+    "inference_cache_bytes",
+    "Approximate memory held by the in-process inference cache.",
+    lambda: model_registry.cache_local.bytes,
+)
+registry.gauge(
+    "inference_cache_entries",
+    "Number of entries in the in-process inference cache.",
+    lambda: len(model_registry.cache_local),
+)
+registry.gauge(
+    "inference_cache_hit_ratio",
+    "Share of inference cache lookups served without computing.",
+    hit_ratio,
+)
+
+
+async def get_model(model: Optional[str] = None, version: Optional[str] = None) -> LoadedModel:
     """
-    Perform inference on the given text by reversing it.
+    Return a ready model, loading it if it is not loaded yet.
+
+    Args:
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
+
+    Returns:
+        LoadedModel: The current instance of the model.
+
+    Raises:
+        ModelNotFoundError: If no such model or version is registered.
+    """
+
+    return await model_registry.get(model, version)
+
+
+async def infer_text(
+    text: str,
+    use_cache: bool = True,
+    model: Optional[str] = None,
+    version: Optional[str] = None,
+) -> str:
+    """
+    Perform inference on a single text through the result cache and the
+    model's micro-batcher.
 
     Args:
         text (str): The input text to be processed.
+        use_cache (bool): Whether the result cache may be used for this call.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
 
     Returns:
-        str: The reversed version of the input text.
+        str: The model output for the input text.
+
+    Raises:
+        ModelNotFoundError: If no such model or version is registered.
+    """
+
+    async with model_registry.use(model, version) as loaded:
+        if not (use_cache and settings.INFERENCE_CACHE_ENABLED):
+            return await loaded.batcher.submit(text)
+        return await loaded.cache.get_or_compute(text, lambda: loaded.batcher.submit(text))
+
+
+async def infer_texts(
+    texts: List[str],
+    use_cache: bool = True,
+    model: Optional[str] = None,
+    version: Optional[str] = None,
+) -> List[str]:
+    """
+    Perform inference on a batch of texts, computing only cache misses with
+    a single model call.
+
+    Args:
+        texts (List[str]): The input texts to be processed.
+        use_cache (bool): Whether the result cache may be used for this call.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
+
+    Returns:
+        List[str]: The model output for each input text, in input order.
+
+    Raises:
+        ModelNotFoundError: If no such model or version is registered.
+    """
+
+    async with model_registry.use(model, version) as loaded:
+        if not (use_cache and settings.INFERENCE_CACHE_ENABLED):
+            return await loaded.run(texts)
+        return await loaded.cache.get_or_compute_many(texts, loaded.run)
+
+
+async def stream_inference(
+    text: str, model: Optional[str] = None, version: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Perform inference on a single text, yielding the output in chunks of at
+    most ``INFERENCE_STREAM_CHUNK_SIZE`` characters.
+
+    Args:
+        text (str): The input text to be processed.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
+
+    Yields:
+        str: Consecutive chunks of the model output.
     """
 
-    return text[::-1]
+    async with model_registry.use(model, version) as loaded:
+        async for chunk in loaded.stream(text, settings.INFERENCE_STREAM_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+from infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATCH_SIZE = registry.histogram(
+    "inference_batch_size",
+    "Number of requests served by one batched model call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent calls into batched calls of a list-in, list-out coroutine.
+
+    The first item submitted after a flush starts a timer of ``max_wait_ms``;
+    the pending items are flushed as one batch when the timer fires or as soon
+    as ``max_batch_size`` items are pending, whichever comes first. Batches
+    run as separate tasks, so new items keep being collected while a batch
+    is computed. If a batch task is cancelled, its callers' awaits are
+    cancelled too.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted items not yet passed to the batch function."""
+        return len(self._pending)
+
+    async def submit(self, item: T) -> R:
+        """
+        Submit a single item and wait for its result.
+
+        Args:
+            item (T): The input to be processed.
+
+        Returns:
+            R: The result produced for this item by the batch function.
+
+        Raises:
+            Exception: Whatever the batch function raised for the batch the
+                item was part of.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: List[Tuple[T, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        BATCH_SIZE.observe(len(items))
+        try:
+            results = await self.batch_fn(items)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for {len(items)} inputs"
+                )
+        except asyncio.CancelledError:
+            # Cancelled, e.g. at shutdown: callers must not wait forever
+            for _, future in batch:
+                future.cancel()
+            raise
+        except BaseException as e:
+            logger.exception("Batched call failed for %s items: %s", len(items), str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
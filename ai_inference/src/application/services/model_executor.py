@@ -0,0 +1,315 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from config.settings import settings
+from src.application.services.inference_model import InferenceModel, load_model
+
+logger = logging.getLogger(__name__)
+
+# Model instance of a pool worker process, loaded once by ``_init_worker``.
+_worker_model: Optional[InferenceModel] = None
+
+
+def rss_bytes(pid: str = "self") -> Optional[int]:
+    """
+    Return the resident memory of a process, or None where ``/proc`` is unavailable.
+
+    Args:
+        pid (str): The process id, or ``"self"`` for the current process.
+
+    Returns:
+        Optional[int]: The resident set size in bytes.
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _pack(texts: Sequence[str]) -> Tuple[SharedMemory, List[int]]:
+    """
+    Copy texts into a new shared memory block as one UTF-8 encoded string.
+
+    Returns the block and the character length of each text; the byte size
+    of the payload is appended as the last element.
+    """
+    data = "".join(texts).encode("utf-8")
+    block = SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[: len(data)] = data
+    return block, [len(text) for text in texts] + [len(data)]
+
+
+def _unpack(name: str, lengths: List[int], unlink: bool) -> List[str]:
+    """Decode texts written by ``_pack`` from the named shared memory block."""
+    block = SharedMemory(name=name)
+    try:
+        view = block.buf[: lengths[-1]]
+        try:
+            # Decode straight from the mapped buffer, without copying it first.
+            joined = str(view, "utf-8")
+        finally:
+            view.release()
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+    texts = []
+    offset = 0
+    for length in lengths[:-1]:
+        texts.append(joined[offset : offset + length])
+        offset += length
+    return texts
+
+
+def _init_worker(model_path: str):
+    global _worker_model
+    _worker_model = load_model(model_path)
+
+
+def _worker_ping() -> int:
+    return os.getpid()
+
+
+def _worker_fingerprint() -> str:
+    return _worker_model.fingerprint()
+
+
+def _worker_predict(texts: List[str]) -> List[str]:
+    return _worker_model.predict(texts)
+
+
+def _worker_predict_shared(name: str, lengths: List[int], threshold: int):
+    outputs = _worker_model.predict(_unpack(name, lengths, unlink=False))
+    if sum(len(text) for text in outputs) < threshold:
+        return None, outputs
+    block, out_lengths = _pack(outputs)
+    block.close()
+    return block.name, out_lengths
+
+
+class ModelExecutor(ABC):
+    """
+    Runs batched model calls on behalf of the inference service.
+    """
+
+    def start(self):
+        """Prepare the executor; called once at application startup."""
+
+    def shutdown(self):
+        """Release the executor's resources; called at application shutdown."""
+
+    def memory_bytes(self) -> Optional[int]:
+        """
+        Return the memory held by processes dedicated to this executor.
+
+        Returns:
+            Optional[int]: Resident bytes of the executor's own processes, or
+            None when the model lives in the server process.
+        """
+        return None
+
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """
+        Return the fingerprint of the model this executor runs.
+
+        Returns:
+            str: The model's ``InferenceModel.fingerprint``.
+        """
+
+    @abstractmethod
+    async def run(self, texts: List[str]) -> List[str]:
+        """
+        Run the model on a batch of texts.
+
+        Args:
+            texts (List[str]): The input texts to be processed.
+
+        Returns:
+            List[str]: One output per input, in input order.
+        """
+
+    async def stream(self, text: str, chunk_size: int) -> AsyncIterator[str]:
+        """
+        Run the model on a single text, yielding the output in chunks.
+
+        The default implementation runs the model through ``run`` and slices
+        the complete output.
+
+        Args:
+            text (str): The input text to be processed.
+            chunk_size (int): The maximum number of characters per chunk.
+
+        Yields:
+            str: Consecutive chunks of the output.
+        """
+        result = (await self.run([text]))[0]
+        for start in range(0, len(result), chunk_size):
+            yield result[start : start + chunk_size]
+
+
+class ThreadModelExecutor(ModelExecutor):
+    """
+    Runs the model in Starlette's threadpool, inside the server process.
+
+    Suitable for models that are cheap or release the GIL. Models that do
+    not block are called directly on the event loop, skipping the thread
+    hop, unless the inputs total ``inline_max_chars`` characters or more:
+    even a cheap model takes too long on the loop for large inputs. The
+    threadpool size is set by ``THREADPOOL_SIZE``.
+    """
+
+    def __init__(self, model: InferenceModel, inline_max_chars: int = 0):
+        self.model = model
+        self.inline_max_chars = inline_max_chars
+
+    def _inline(self, size: int) -> bool:
+        return not self.model.blocking and (
+            not self.inline_max_chars or size < self.inline_max_chars
+        )
+
+    def fingerprint(self) -> str:
+        return self.model.fingerprint()
+
+    async def run(self, texts: List[str]) -> List[str]:
+        if self._inline(sum(len(text) for text in texts)):
+            return self.model.predict(texts)
+        return await run_in_threadpool(self.model.predict, texts)
+
+    async def stream(self, text: str, chunk_size: int) -> AsyncIterator[str]:
+        chunks = self.model.stream(text, chunk_size)
+        if self._inline(len(text)):
+            for chunk in chunks:
+                yield chunk
+            return
+        async for chunk in iterate_in_threadpool(chunks):
+            yield chunk
+
+
+class ProcessModelExecutor(ModelExecutor):
+    """
+    Runs the model in a warm pool of worker processes.
+
+    Each worker loads the model once when it starts, so CPU-bound models
+    scale across cores instead of contending for the server's GIL.
+
+    When ``shm_threshold`` is positive, batches whose total text length
+    reaches it are passed through shared memory in both directions instead
+    of being pickled through the pool's pipes. Packing happens off the event
+    loop. For plain ``str`` batches pickling is usually as fast, so this is
+    off by default; it pays off when the pipe, not encoding, is the
+    bottleneck.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        workers: int,
+        shm_threshold: int,
+        start_method: str = "spawn",
+    ):
+        self.model_path = model_path
+        self.workers = workers or os.cpu_count() or 1
+        self.shm_threshold = shm_threshold
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pids: List[int] = []
+        self._fingerprint: Optional[str] = None
+
+    def start(self):
+        """
+        Start the worker processes and wait until each has loaded the model.
+
+        This blocks for as long as the model takes to load, so it is run in
+        the threadpool while the model loads, never on the event loop.
+        """
+        if self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(self.model_path,),
+        )
+        pings = [self._pool.submit(_worker_ping) for _ in range(self.workers)]
+        self._pids = sorted({ping.result() for ping in pings})
+        self._fingerprint = self._pool.submit(_worker_fingerprint).result()
+        logger.info(
+            "Started %s inference worker processes for %s", len(self._pids), self.model_path
+        )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._pids = []
+            self._fingerprint = None
+
+    def memory_bytes(self) -> Optional[int]:
+        sizes = [rss_bytes(str(pid)) for pid in self._pids]
+        if not sizes or None in sizes:
+            return None
+        return sum(sizes)
+
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            raise RuntimeError(f"Worker processes for {self.model_path} are not running")
+        return self._fingerprint
+
+    async def run(self, texts: List[str]) -> List[str]:
+        if self._pool is None:
+            raise RuntimeError(f"Worker processes for {self.model_path} are not running")
+        loop = asyncio.get_running_loop()
+
+        if not self.shm_threshold or sum(len(text) for text in texts) < self.shm_threshold:
+            return await loop.run_in_executor(self._pool, _worker_predict, texts)
+
+        block, lengths = await run_in_threadpool(_pack, texts)
+        try:
+            name, payload = await loop.run_in_executor(
+                self._pool, _worker_predict_shared, block.name, lengths, self.shm_threshold
+            )
+        finally:
+            block.close()
+            block.unlink()
+
+        if name is None:
+            return payload
+        return await run_in_threadpool(_unpack, name, payload, True)
+
+
+def create_executor(model_path: str) -> ModelExecutor:
+    """
+    Build the model executor selected by ``INFERENCE_EXECUTOR``.
+
+    A thread executor loads the model immediately; a process pool executor
+    loads it in each worker when ``start`` is called.
+
+    Args:
+        model_path (str): The ``"package.module:ClassName"`` path of the model.
+
+    Returns:
+        ModelExecutor: A thread executor (``"thread"``) or a process pool
+        executor (``"process"``) for the model.
+    """
+    if settings.INFERENCE_EXECUTOR == "process":
+        return ProcessModelExecutor(
+            model_path=model_path,
+            workers=settings.INFERENCE_PROCESS_WORKERS,
+            shm_threshold=settings.INFERENCE_SHM_THRESHOLD_BYTES,
+            start_method=settings.INFERENCE_PROCESS_START_METHOD,
+        )
+    return ThreadModelExecutor(
+        load_model(model_path), inline_max_chars=settings.INFERENCE_INLINE_MAX_CHARS
+    )
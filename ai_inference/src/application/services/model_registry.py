@@ -0,0 +1,403 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from starlette.concurrency import run_in_threadpool
+
+from infrastructure.metrics import registry
+from infrastructure.redis_cache import RedisCacheTier
+from src.application.services.inference_cache import InferenceCache, LRUCache
+from src.application.services.inference_model import InferenceModel, model_class
+from src.application.services.micro_batcher import MicroBatcher
+from src.application.services.model_executor import ModelExecutor, create_executor, rss_bytes
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_SECONDS = registry.histogram(
+    "inference_seconds", "Time spent running the inference model."
+)
+MODEL_LOAD_SECONDS = registry.histogram(
+    "model_load_seconds",
+    "Cold-start time of a model, from load start until it is warm.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120),
+)
+
+
+class ModelNotFoundError(LookupError):
+    """Raised when a request names a model or version that is not registered."""
+
+
+class LoadedModel:
+    """
+    One version of a named model, loaded into its own executor.
+
+    Each loaded model has its own micro-batcher and result cache namespace,
+    and counts the requests using it so it can be retired without dropping
+    any of them. The model class is imported while loading, off the event
+    loop, so ``version`` and ``cache`` are only set once ``load`` has
+    started the executor. The cache namespace includes the model's
+    fingerprint, so a reload that picks up new weights starts from an
+    empty cache.
+    """
+
+    LOADING = "loading"
+    WARMING = "warming"
+    READY = "ready"
+    RETIRED = "retired"
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        cache_local: LRUCache,
+        cache_shared: Optional[RedisCacheTier],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self.name = name
+        self.path = path
+        self.version: Optional[str] = None
+        self.state = self.LOADING
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.memory_bytes: Optional[int] = None
+        self.in_flight = 0
+        self.executor: Optional[ModelExecutor] = None
+        self.batcher: MicroBatcher[str, str] = MicroBatcher(
+            self.run, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+        )
+        self.cache: Optional[InferenceCache] = None
+        self._cache_local = cache_local
+        self._cache_shared = cache_shared
+        self._max_batch_size = max_batch_size
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def load(self, warmup_batches: int):
+        """
+        Load the model into a new executor and warm it up.
+
+        Importing the model class and loading it run off the event loop. The
+        reported memory is the resident size of the executor's worker
+        processes, or the growth of the server process while loading when the
+        model runs in-process (approximate if other work allocates at the same
+        time).
+
+        Args:
+            warmup_batches (int): The number of synthetic batches to run
+                before the model is reported ready.
+        """
+        rss_before = rss_bytes()
+        start = time.perf_counter()
+
+        def start_executor() -> Tuple[Type[InferenceModel], str]:
+            cls = model_class(self.path)
+            self.executor = create_executor(self.path)
+            self.executor.start()
+            return cls, self.executor.fingerprint()
+
+        cls, fingerprint = await run_in_threadpool(start_executor)
+        self.load_seconds = time.perf_counter() - start
+        self.version = cls.version
+        self.cache = InferenceCache(
+            namespace=f"{cls.name}:{cls.version}:{fingerprint}",
+            local=self._cache_local,
+            shared=self._cache_shared,
+        )
+
+        self.state = self.WARMING
+        start = time.perf_counter()
+        for _ in range(warmup_batches):
+            await self.run(cls.warmup_inputs(self._max_batch_size))
+        self.warmup_seconds = time.perf_counter() - start
+
+        self.memory_bytes = self.executor.memory_bytes()
+        if self.memory_bytes is None and rss_before is not None:
+            self.memory_bytes = max((rss_bytes() or rss_before) - rss_before, 0)
+        self.state = self.READY
+        MODEL_LOAD_SECONDS.observe(self.load_seconds + self.warmup_seconds)
+        logger.info(
+            "Model %s version %s ready in %.3fs",
+            self.name,
+            self.version,
+            self.load_seconds + self.warmup_seconds,
+        )
+
+    async def run(self, texts: List[str]) -> List[str]:
+        """
+        Run the model on a batch of texts with a single executor call.
+
+        Args:
+            texts (List[str]): The input texts to be processed.
+
+        Returns:
+            List[str]: One output per input, in input order.
+        """
+        with INFERENCE_SECONDS.time():
+            return await self.executor.run(texts)
+
+    def stream(self, text: str, chunk_size: int) -> AsyncIterator[str]:
+        return self.executor.stream(text, chunk_size)
+
+    def acquire(self):
+        self.in_flight += 1
+        self._idle.clear()
+
+    def release(self):
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+    async def retire(self, drain_timeout: float):
+        """
+        Stop accepting new work, wait for in-flight requests and shut down.
+
+        Args:
+            drain_timeout (float): The longest time to wait for in-flight
+                requests before shutting the executor down anyway.
+        """
+        self.state = self.RETIRED
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Retiring model %s version %s with %s requests still in flight",
+                self.name,
+                self.version,
+                self.in_flight,
+            )
+        if self.executor is not None:
+            await run_in_threadpool(self.executor.shutdown)
+
+    def status(self) -> dict:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "state": self.state,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "memory_bytes": self.memory_bytes,
+            "in_flight": self.in_flight,
+        }
+
+
+class ModelRegistry:
+    """
+    Named, versioned inference models with lazy or eager loading.
+
+    A model is loaded the first time it is requested, or at startup when
+    ``eager`` is set; concurrent requests for a model that is still loading
+    wait for that one load. ``swap`` loads and warms a new instance next to
+    the current one, then replaces it in a single assignment: requests that
+    already hold the old instance finish on it, new requests get the new
+    one, and the old instance is shut down once it is idle. Swaps of the
+    same model run one at a time, so every replaced instance is retired.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, str],
+        default: str,
+        eager: bool,
+        warmup_batches: int,
+        drain_timeout: float,
+        cache_local: LRUCache,
+        cache_shared: Optional[RedisCacheTier],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self.paths = dict(models)
+        self.default = default
+        self.eager = eager
+        self.warmup_batches = warmup_batches
+        self.drain_timeout = drain_timeout
+        self.cache_local = cache_local
+        self.cache_shared = cache_shared
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._models: Dict[str, LoadedModel] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._pending: Dict[str, LoadedModel] = {}
+        self._errors: Dict[str, str] = {}
+        self._swap_locks: Dict[str, asyncio.Lock] = {}
+        self._startup: Optional[asyncio.Task] = None
+
+    async def get(self, name: Optional[str] = None, version: Optional[str] = None) -> LoadedModel:
+        """
+        Return the current instance of a model, loading it if needed.
+
+        Args:
+            name (Optional[str]): The model name; the default model if omitted.
+            version (Optional[str]): The required version, if any.
+
+        Returns:
+            LoadedModel: The ready model.
+
+        Raises:
+            ModelNotFoundError: If the model is not registered, or its current
+                version is not ``version``.
+        """
+        name = name or self.default
+        if name not in self.paths:
+            raise ModelNotFoundError(f"Unknown model: {name}")
+
+        model = self._models.get(name)
+        while model is None:
+            await self._load(name)
+            model = self._models.get(name)
+
+        if version is not None and model.version != version:
+            raise ModelNotFoundError(
+                f"Model {name} is at version {model.version}, not {version}"
+            )
+        return model
+
+    @asynccontextmanager
+    async def use(
+        self, name: Optional[str] = None, version: Optional[str] = None
+    ) -> AsyncIterator[LoadedModel]:
+        """
+        Hold a model for the duration of a request.
+
+        A held model is not shut down by a swap until it is released.
+
+        Args:
+            name (Optional[str]): The model name; the default model if omitted.
+            version (Optional[str]): The required version, if any.
+
+        Yields:
+            LoadedModel: The ready model.
+        """
+        model = await self.get(name, version)
+        model.acquire()
+        try:
+            yield model
+        finally:
+            model.release()
+
+    async def _load(self, name: str):
+        task = self._loading.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._load_new(name, self.paths[name]))
+            self._loading[name] = task
+            task.add_done_callback(lambda _: self._loading.pop(name, None))
+        await asyncio.shield(task)
+
+    async def _load_new(self, name: str, path: str) -> LoadedModel:
+        model = LoadedModel(
+            name,
+            path,
+            cache_local=self.cache_local,
+            cache_shared=self.cache_shared,
+            max_batch_size=self.max_batch_size,
+            max_wait_ms=self.max_wait_ms,
+        )
+        self._pending[name] = model
+        try:
+            await model.load(self.warmup_batches)
+        except Exception as e:
+            logger.exception("Failed to load model %s from %s: %s", name, path, str(e))
+            self._errors[name] = str(e)
+            if model.executor is not None:
+                await run_in_threadpool(model.executor.shutdown)
+            raise
+        finally:
+            self._pending.pop(name, None)
+        self._errors.pop(name, None)
+        self._models[name] = model
+        return model
+
+    async def swap(self, name: str, path: Optional[str] = None) -> LoadedModel:
+        """
+        Load a new instance of a model and atomically make it current.
+
+        Args:
+            name (str): The model name.
+            path (Optional[str]): The import path of the new model class; the
+                registered path if omitted.
+
+        Returns:
+            LoadedModel: The new, ready instance.
+
+        Raises:
+            ModelNotFoundError: If the model is not registered.
+        """
+        if name not in self.paths:
+            raise ModelNotFoundError(f"Unknown model: {name}")
+
+        async with self._swap_locks.setdefault(name, asyncio.Lock()):
+            if name in self._loading:
+                await asyncio.shield(self._loading[name])
+
+            path = path or self.paths[name]
+            old = self._models.get(name)
+            new = await self._load_new(name, path)
+            self.paths[name] = path
+            if old is not None:
+                logger.info(
+                    "Swapped model %s from version %s to %s", name, old.version, new.version
+                )
+                await old.retire(self.drain_timeout)
+            return new
+
+    def start(self):
+        """
+        Begin loading every model in the background when loading is eager.
+        """
+        if self.eager and self._startup is None:
+            self._startup = asyncio.ensure_future(self.load_all())
+
+    async def load_all(self):
+        results = await asyncio.gather(
+            *(self.get(name) for name in self.paths), return_exceptions=True
+        )
+        loaded = sum(1 for result in results if not isinstance(result, BaseException))
+        logger.info("Loaded %s of %s models", loaded, len(self.paths))
+
+    async def shutdown(self):
+        """Retire every loaded model."""
+        if self._startup is not None and not self._startup.done():
+            self._startup.cancel()
+        models, self._models = list(self._models.values()), {}
+        await asyncio.gather(*(model.retire(self.drain_timeout) for model in models))
+
+    def ready(self) -> bool:
+        """
+        Return True once every model that is loaded eagerly is warm.
+
+        Returns:
+            bool: Whether the service can take traffic without cold starts.
+        """
+        if not self.eager:
+            return True
+        return all(
+            name in self._models and self._models[name].state == LoadedModel.READY
+            for name in self.paths
+        )
+
+    def queue_depth(self) -> int:
+        """
+        Return the number of requests waiting for a batch across all models.
+
+        Returns:
+            int: Items submitted to the micro-batchers but not yet running.
+        """
+        return sum(model.batcher.pending for model in self._models.values())
+
+    def status(self) -> List[dict]:
+        """
+        Return the state, cold-start latency and memory of every model.
+
+        Returns:
+            List[dict]: One entry per registered model.
+        """
+        statuses = []
+        for name, path in self.paths.items():
+            model = self._models.get(name) or self._pending.get(name)
+            status = model.status() if model else {"name": name, "state": "not_loaded"}
+            if name in self._errors:
+                status["error"] = self._errors[name]
+            statuses.append({**status, "path": path, "default": name == self.default})
+        return statuses
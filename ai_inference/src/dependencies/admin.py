@@ -0,0 +1,38 @@
+import secrets
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from config.settings import settings
+
+admin_scheme = HTTPBearer(auto_error=False)
+
+
+async def require_admin_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(admin_scheme),
+) -> None:
+    """
+    Allow a request only if it carries ``ADMIN_TOKEN`` as its bearer token.
+
+    Admin endpoints expose internals such as stack traces, so they do not
+    exist until ``ADMIN_TOKEN`` is set.
+
+    Args:
+        credentials (Optional[HTTPAuthorizationCredentials]): The bearer token
+            of the request, if any.
+
+    Raises:
+        HTTPException: 404 if ``ADMIN_TOKEN`` is not set, 401 if the token is
+            missing or does not match.
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,28 @@
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from infrastructure.jwt_service import decode_token
+
+auth_scheme = HTTPBearer()
+
+
+async def require_token(
+    credentials: HTTPAuthorizationCredentials = Depends(auth_scheme),
+) -> dict:
+    """
+    Verify the request's bearer token and return its claims.
+
+    Runs on the event loop: verification is a dict lookup for tokens that
+    were seen before and a short CPU-bound check otherwise, both cheaper
+    than a hop to the threadpool.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials): The bearer token of the request.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        HTTPException: If the token is missing or invalid.
+    """
+    return decode_token(credentials.credentials)
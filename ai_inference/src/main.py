@@ -1,7 +1,18 @@
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import Depends, FastAPI, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from config.logging import setup_logging
+from config.settings import settings
+from infrastructure.jwt_service import get_key_set
+from infrastructure.loop_monitor import loop_monitor
+from infrastructure.metrics import CONTENT_TYPE_LATEST, registry
 from src.routers.inference_router import router as inference_router
+from src.routers.model_router import router as model_router
+from src.application.services.health_service import readiness_report
+from src.application.services.inference_service import model_registry
+from src.dependencies.admin import require_admin_token
+from src.middleware.admission_middleware import AdmissionControlMiddleware, AdmissionController
 from src.middleware.request_middleware import RequestLoggerMiddleware
 
 setup_logging()
@@ -17,9 +28,25 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+admission = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+    max_latency_ms=settings.ADMISSION_MAX_LATENCY_MS,
+    max_loop_lag_ms=settings.ADMISSION_MAX_LOOP_LAG_MS,
+    loop_monitor=loop_monitor,
+    retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS,
+)
+registry.gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being handled.",
+    lambda: admission.in_flight,
+)
+
 # Add request logging middleware
 app.add_middleware(RequestLoggerMiddleware)
 
+# Shed requests with 503 under overload, before they are logged or routed
+app.add_middleware(AdmissionControlMiddleware, controller=admission)
+
 # CORS config
 app.add_middleware(
     CORSMiddleware,
@@ -29,8 +56,73 @@ app.add_middleware(
 )
 
 app.include_router(inference_router)
+app.include_router(model_router)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    Size the threadpool used for blocking work, start watching the JWKS file
+    for key changes, and start loading and warming the models in the
+    background; ``/health`` reports ready once they are warm.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    loop_monitor.start()
+    get_key_set().start()
+    model_registry.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await model_registry.shutdown()
+    await get_key_set().stop()
+    await loop_monitor.stop()
 
 
 @app.get("/health")
-def health_check():
-    return {"status": "ok"}
+async def health_check():
+    """
+    Report whether the service is ready, with the state, cold-start latency
+    and memory of each model.
+
+    Responds with 503 until every eagerly loaded model is warm.
+    """
+    ready = model_registry.ready()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ok" if ready else "starting", "models": model_registry.status()},
+    )
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Report whether this instance should receive traffic.
+
+    Includes in-flight requests, micro-batcher queue depth, event-loop lag,
+    request latency and dependency status. Responds with 503 while models
+    are warming up or admission control is shedding load.
+    """
+    ready, report = await readiness_report(admission)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=report,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Expose process metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(await registry.render(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/admin/loop", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def loop_report(limit: int = Query(10, ge=1, le=100)):
+    """
+    Report event-loop lag percentiles and the code that blocked the loop
+    for longest, with the stack of each offender's longest stall. Only
+    available with ``ADMIN_TOKEN`` set, to requests that send it.
+    """
+    return loop_monitor.report(limit)
@@ -0,0 +1,125 @@
+import json
+import time
+from typing import Iterable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.loop_monitor import LoopLagMonitor
+from infrastructure.metrics import registry
+
+HTTP_REQUESTS_SHED = registry.counter(
+    "http_requests_shed_total",
+    "Number of HTTP requests rejected by admission control, by reason.",
+    ("reason",),
+)
+
+OVERLOADED_BODY = json.dumps(
+    {
+        "success": False,
+        "status_code": 503,
+        "message": "Service overloaded, retry later",
+        "data": None,
+    }
+).encode("utf-8")
+
+
+class AdmissionController:
+    """
+    Decides whether the service can take another HTTP request.
+
+    A request is rejected when any configured limit is exceeded (a limit of
+    0 disables it):
+
+    * ``max_in_flight``: requests currently being handled.
+    * ``max_loop_lag_ms``: the most recent event-loop lag sample.
+    * ``max_latency_ms``: the moving average of request latency. This is
+      only enforced while requests are in flight, so the average recovers
+      from the latency of requests admitted once the backlog has drained.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_latency_ms: float,
+        max_loop_lag_ms: float,
+        loop_monitor: LoopLagMonitor,
+        retry_after_seconds: int = 1,
+        exempt_paths: Iterable[str] = ("/health", "/ready", "/metrics", "/admin/loop"),
+        latency_smoothing: float = 0.1,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_latency = max_latency_ms / 1000
+        self.max_loop_lag = max_loop_lag_ms / 1000
+        self.loop_monitor = loop_monitor
+        self.retry_after_seconds = retry_after_seconds
+        self.exempt_paths = frozenset(exempt_paths)
+        self.latency_smoothing = latency_smoothing
+        self.in_flight = 0
+        self.latency = 0.0
+
+    def rejection_reason(self) -> Optional[str]:
+        """
+        Return why a new request would be rejected, or None to admit it.
+
+        Returns:
+            Optional[str]: ``"concurrency"``, ``"loop_lag"``, ``"latency"`` or None.
+        """
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "concurrency"
+        if self.max_loop_lag and self.loop_monitor.lag > self.max_loop_lag:
+            return "loop_lag"
+        if self.max_latency and self.in_flight and self.latency > self.max_latency:
+            return "latency"
+        return None
+
+    def observe(self, seconds: float):
+        self.latency += self.latency_smoothing * (seconds - self.latency)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "latency_ms": round(self.latency * 1000, 3),
+            "loop_lag_ms": round(self.loop_monitor.lag * 1000, 3),
+            "shedding": self.rejection_reason(),
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    Pure ASGI middleware that sheds HTTP requests with 503 under overload.
+
+    Rejected requests are answered immediately, before the body is read or
+    any route code runs, with a ``Retry-After`` header so well-behaved
+    clients and load balancers back off. Health, readiness, metrics and
+    event-loop report endpoints are never shed.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(OVERLOADED_BODY)).encode("latin-1")),
+            (b"retry-after", str(controller.retry_after_seconds).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        controller = self.controller
+        if scope["type"] != "http" or scope["path"] in controller.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        reason = controller.rejection_reason()
+        if reason is not None:
+            HTTP_REQUESTS_SHED.labels(reason=reason).inc()
+            await send({"type": "http.response.start", "status": 503, "headers": self._headers})
+            await send({"type": "http.response.body", "body": OVERLOADED_BODY})
+            return
+
+        controller.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.in_flight -= 1
+            controller.observe(time.perf_counter() - start)
@@ -1,38 +1,223 @@
+import json
+import logging
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from infrastructure.jwt_service import decode_token, create_token
-from src.schema.dto.inference_dto import InferenceRequest, InferenceResponse, InferenceTokenResponse
-from src.application.services.inference_service import perform_inference
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi.responses import StreamingResponse
+from infrastructure.jwt_service import create_token
+from src.schema.dto.inference_dto import (
+    BatchInferenceRequest,
+    BatchInferenceResponse,
+    InferenceRequest,
+    InferenceResponse,
+    InferenceTokenResponse,
+)
+from src.application.services.inference_service import (
+    get_model,
+    infer_text,
+    infer_texts,
+    stream_inference,
+)
+from src.application.services.model_registry import ModelNotFoundError
+from config.exception_handler import BaseHTTPException
 from config.response_handler import ResponseHandler
+from config.settings import settings
+from src.dependencies.auth import require_token
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/infer", tags=["Inference"])
-auth_scheme = HTTPBearer()
 
 
-@router.post("", response_model=InferenceResponse)
-def infer(
+async def _read_text_body(request: Request, max_bytes: int) -> str:
+    """
+    Read a raw UTF-8 request body chunk by chunk into a single buffer.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        max_bytes (int): The largest body accepted.
+
+    Returns:
+        str: The decoded body.
+
+    Raises:
+        BaseHTTPException: If the body is larger than ``max_bytes`` or is not
+            valid UTF-8.
+    """
+    too_large = BaseHTTPException(
+        message=f"Request body exceeds {max_bytes} bytes",
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    )
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        raise BaseHTTPException(message="Request body must be UTF-8 text")
+
+
+def _use_cache(cache_control: Optional[str]) -> bool:
+    """
+    Return False when the client opted out of cached results with
+    ``Cache-Control: no-cache`` or ``no-store``.
+    """
+    if not cache_control:
+        return True
+    directives = {part.strip().lower() for part in cache_control.split(",")}
+    return not directives & {"no-cache", "no-store"}
+
+
+def _model_not_found(error: ModelNotFoundError) -> BaseHTTPException:
+    return BaseHTTPException(message=str(error), status_code=status.HTTP_404_NOT_FOUND)
+
+
+async def _ndjson_lines(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """
+    Frame output chunks as NDJSON lines, ending with a ``done`` line.
+    """
+    try:
+        async for chunk in chunks:
+            yield (json.dumps({"chunk": chunk}) + "\n").encode("utf-8")
+    except Exception as e:
+        logger.exception("Streaming inference failed: %s", str(e))
+        yield (json.dumps({"error": "Inference failed"}) + "\n").encode("utf-8")
+        return
+    yield b'{"done": true}\n'
+
+
+@router.post(
+    "",
+    response_model=InferenceResponse,
+    dependencies=[Depends(require_token)],
+)
+async def infer(
     request: InferenceRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    cache_control: Optional[str] = Header(None),
+    model: Optional[str] = Query(None),
+    version: Optional[str] = Query(None),
 ):
     """
     Perform inference on the given text by reversing it.
 
+    Results are served from the inference cache when possible; send
+    ``Cache-Control: no-cache`` to bypass it. Concurrent requests that miss
+    the cache are coalesced into batched model calls by the inference
+    micro-batcher.
+
     Args:
         request (InferenceRequest): The input text to be processed.
-        credentials (HTTPAuthorizationCredentials): The JWT token to authorize the request.
+        cache_control (Optional[str]): The Cache-Control request header.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
 
     Returns:
         InferenceResponse: The reversed version of the input text.
 
     Raises:
         HTTPException: If the token is invalid.
+        BaseHTTPException: If the model or version is not registered.
     """
-    decode_token(credentials.credentials)
-    result = perform_inference(request.text)
+    try:
+        result = await infer_text(
+            request.text, use_cache=_use_cache(cache_control), model=model, version=version
+        )
+    except ModelNotFoundError as e:
+        raise _model_not_found(e)
     return ResponseHandler.success(data=InferenceResponse(result=result))
 
 
+@router.post(
+    "/batch",
+    response_model=BatchInferenceResponse,
+    dependencies=[Depends(require_token)],
+)
+async def infer_batch(
+    request: BatchInferenceRequest,
+    cache_control: Optional[str] = Header(None),
+    model: Optional[str] = Query(None),
+    version: Optional[str] = Query(None),
+):
+    """
+    Perform inference on a list of texts with a single authenticated call.
+
+    The token is verified once and every text missing from the inference
+    cache is passed to the model in one call, so per-item cost is only the
+    model work itself. Send ``Cache-Control: no-cache`` to bypass the cache.
+
+    Args:
+        request (BatchInferenceRequest): The input texts to be processed.
+        cache_control (Optional[str]): The Cache-Control request header.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
+
+    Returns:
+        BatchInferenceResponse: The reversed version of each input text, in input order.
+
+    Raises:
+        HTTPException: If the token is invalid.
+        BaseHTTPException: If the model or version is not registered.
+    """
+    try:
+        results = await infer_texts(
+            request.texts, use_cache=_use_cache(cache_control), model=model, version=version
+        )
+    except ModelNotFoundError as e:
+        raise _model_not_found(e)
+    return ResponseHandler.success(data=BatchInferenceResponse(results=results))
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_token)],
+)
+async def infer_stream(
+    request: Request,
+    model: Optional[str] = Query(None),
+    version: Optional[str] = Query(None),
+):
+    """
+    Perform inference on a raw text body and stream the result as NDJSON.
+
+    The request body is read as plain UTF-8 text (no JSON envelope) and
+    buffered whole, up to ``INFERENCE_MAX_STREAM_INPUT_BYTES``, because the
+    model needs the complete input. The output is sent as it is produced,
+    one ``{"chunk": ...}`` line per chunk of at most
+    ``INFERENCE_STREAM_CHUNK_SIZE`` characters, followed by ``{"done": true}``.
+    If the model fails mid-stream an ``{"error": ...}`` line is sent instead.
+
+    Args:
+        request (Request): The request whose body is the input text.
+        model (Optional[str]): The model name; the default model if omitted.
+        version (Optional[str]): The required model version, if any.
+
+    Returns:
+        StreamingResponse: The chunked ``application/x-ndjson`` response.
+
+    Raises:
+        HTTPException: If the token is invalid.
+        BaseHTTPException: If the body is too large or not UTF-8, or if the
+            model or version is not registered.
+    """
+    try:
+        # Resolve the model up front so an unknown one is a 404, not an error line.
+        await get_model(model, version)
+    except ModelNotFoundError as e:
+        raise _model_not_found(e)
+    text = await _read_text_body(request, settings.INFERENCE_MAX_STREAM_INPUT_BYTES)
+    return StreamingResponse(
+        _ndjson_lines(stream_inference(text, model=model, version=version)),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("/token", response_model=InferenceTokenResponse)
 def create_infer_token():
     """
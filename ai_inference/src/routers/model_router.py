@@ -0,0 +1,64 @@
+import logging
+
+from fastapi import APIRouter, Depends, status
+
+from config.exception_handler import BaseHTTPException
+from config.response_handler import ResponseHandler
+from src.application.services.inference_service import model_registry
+from src.application.services.model_registry import ModelNotFoundError
+from src.dependencies.admin import require_admin_token
+from src.dependencies.auth import require_token
+from src.schema.dto.model_dto import ModelListResponse, ModelStatusResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/models", tags=["Models"])
+
+
+@router.get("", response_model=ModelListResponse, dependencies=[Depends(require_token)])
+async def list_models():
+    """
+    List the registered models with their state, cold-start latency and memory.
+
+    Returns:
+        ModelListResponse: One entry per registered model.
+    """
+    models = [ModelStatusResponse(**model) for model in model_registry.status()]
+    return ResponseHandler.success(data=ModelListResponse(models=models))
+
+
+@router.post(
+    "/{name}/reload",
+    response_model=ModelStatusResponse,
+    dependencies=[Depends(require_admin_token)],
+)
+async def reload_model(name: str):
+    """
+    Load and warm a fresh instance of a model, then swap it in atomically.
+    Requires ``ADMIN_TOKEN``, since every call loads and warms a model.
+
+    Requests already running on the previous instance finish on it; the
+    previous instance is shut down once they have. Use this to pick up new
+    model weights or a new model version without a restart.
+
+    Args:
+        name (str): The name of the model to reload.
+
+    Returns:
+        ModelStatusResponse: The state of the new instance.
+
+    Raises:
+        BaseHTTPException: If the model is not registered or fails to load.
+    """
+    try:
+        await model_registry.swap(name)
+    except ModelNotFoundError as e:
+        raise BaseHTTPException(message=str(e), status_code=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.exception("Reloading model %s failed: %s", name, str(e))
+        raise BaseHTTPException(
+            message=f"Failed to load model {name}",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    model = next(model for model in model_registry.status() if model["name"] == name)
+    return ResponseHandler.success(data=ModelStatusResponse(**model))
@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from config.settings import settings
 
 
 class InferenceRequest(BaseModel):
@@ -9,5 +13,15 @@ class InferenceResponse(BaseModel):
     result: str
 
 
+class BatchInferenceRequest(BaseModel):
+    texts: List[str] = Field(
+        ..., min_length=1, max_length=settings.INFERENCE_MAX_BATCH_REQUEST_ITEMS
+    )
+
+
+class BatchInferenceResponse(BaseModel):
+    results: List[str]
+
+
 class InferenceTokenResponse(BaseModel):
     token: str
\ No newline at end of file
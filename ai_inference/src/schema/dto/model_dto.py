@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ModelStatusResponse(BaseModel):
+    name: str
+    path: str
+    default: bool
+    state: str
+    version: Optional[str] = None
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    memory_bytes: Optional[int] = None
+    in_flight: int = 0
+    error: Optional[str] = None
+
+
+class ModelListResponse(BaseModel):
+    models: List[ModelStatusResponse]
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure.loop_monitor import LoopLagMonitor, loop_monitor
+from infrastructure.metrics import registry
+from src.main import admission, app
+from src.middleware.admission_middleware import AdmissionControlMiddleware, AdmissionController
+
+
+def build_app(controller: AdmissionController) -> FastAPI:
+    slow_app = FastAPI()
+
+    @slow_app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    @slow_app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    slow_app.add_middleware(AdmissionControlMiddleware, controller=controller)
+    return slow_app
+
+
+def test_requests_over_the_concurrency_limit_are_shed():
+    """Test requests beyond max_in_flight get a fast 503 while health checks pass."""
+    controller = AdmissionController(
+        max_in_flight=1, max_latency_ms=0, max_loop_lag_ms=0, loop_monitor=LoopLagMonitor()
+    )
+
+    async def run():
+        transport = httpx.ASGITransport(app=build_app(controller))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.ensure_future(client.get("/slow"))
+            await asyncio.sleep(0.02)
+            shed, health = await client.get("/slow"), await client.get("/health")
+            return await first, shed, health
+
+    first, shed, health = asyncio.run(run())
+    assert first.status_code == 200
+    assert shed.status_code == 503 and shed.headers["retry-after"] == "1"
+    assert shed.json()["success"] is False
+    assert health.status_code == 200
+    assert controller.in_flight == 0
+
+
+def test_ready_reports_load_and_dependencies():
+    """Test /ready reports in-flight requests, queue depth and loop lag once models are warm."""
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        response = client.get("/ready")
+        while response.status_code == 503 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            response = client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready" and body["shedding"] is None
+    assert {"in_flight", "queue_depth", "loop_lag_ms", "dependencies"} <= body.keys()
+
+
+def test_test_instances_leave_process_gauges_alone():
+    """Test building a controller or monitor does not replace the gauges of the running app."""
+    names = ("http_requests_in_flight", "event_loop_lag_seconds")
+    gauges = {name: registry._metrics[name] for name in names}
+    controller = AdmissionController(
+        max_in_flight=1, max_latency_ms=0, max_loop_lag_ms=0, loop_monitor=LoopLagMonitor()
+    )
+    controller.in_flight = 5
+    admission.in_flight, loop_monitor.lag = 2, 0.25
+
+    try:
+        assert {name: registry._metrics[name] for name in names} == gauges
+        assert gauges["http_requests_in_flight"].callback() == 2
+        assert gauges["event_loop_lag_seconds"].callback() == 0.25
+    finally:
+        admission.in_flight, loop_monitor.lag = 0, 0.0
@@ -1,5 +1,7 @@
+import json
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
+from config.settings import settings
 from src.main import app
 from infrastructure.jwt_service import create_token
 
@@ -54,3 +56,49 @@ def test_inference_auth_failure_expired_token():
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Invalid token"
+
+
+def test_batch_inference_success():
+    """Test batch inference returns one result per input, in order."""
+    response = client.post(
+        "/infer/batch",
+        headers={"Authorization": f"Bearer {valid_token}"},
+        json={"texts": ["hello", "world"]},
+    )
+    assert response.status_code == 200
+    assert response.json().get("data") == {"results": ["olleh", "dlrow"]}
+
+
+def test_batch_inference_rejects_empty_batch():
+    """Test batch inference validates that at least one text is sent."""
+    response = client.post(
+        "/infer/batch",
+        headers={"Authorization": f"Bearer {valid_token}"},
+        json={"texts": []},
+    )
+    assert response.status_code == 422
+
+
+def test_stream_inference_success():
+    """Test streaming inference returns NDJSON chunks and a done marker."""
+    response = client.post(
+        "/infer/stream",
+        headers={"Authorization": f"Bearer {valid_token}"},
+        content="hello",
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert "".join(line.get("chunk", "") for line in lines) == "olleh"
+    assert lines[-1] == {"done": True}
+
+
+def test_stream_inference_rejects_bodies_over_the_buffer_limit(monkeypatch):
+    """Test stream bodies larger than INFERENCE_MAX_STREAM_INPUT_BYTES are refused with 413."""
+    monkeypatch.setattr(settings, "INFERENCE_MAX_STREAM_INPUT_BYTES", 4)
+    response = client.post(
+        "/infer/stream",
+        headers={"Authorization": f"Bearer {valid_token}"},
+        content="hello",
+    )
+    assert response.status_code == 413
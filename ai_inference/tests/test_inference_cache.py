@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from src.main import app
+from infrastructure.jwt_service import create_token
+from src.application.services.inference_cache import CACHE_LOOKUPS, InferenceCache, LRUCache
+from src.application.services.inference_service import model_registry
+
+client = TestClient(app)
+
+valid_token = create_token(
+    {"sub": "test-user", "exp": datetime.utcnow() + timedelta(hours=1)}
+)
+
+
+def make_cache(max_bytes: int = 1024 * 1024) -> InferenceCache:
+    return InferenceCache(
+        namespace="test:1",
+        local=LRUCache(max_bytes=max_bytes, max_item_bytes=max_bytes, ttl_seconds=60),
+    )
+
+
+def test_concurrent_identical_requests_compute_once():
+    """Test single-flight: identical concurrent misses share one computation."""
+    cache = make_cache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "olleh"
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_compute("hello", compute) for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == ["olleh"] * 5
+    assert len(calls) == 1
+    assert cache.local.get(cache.key("hello")) == "olleh"
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget():
+    """Test the local tier stays within its byte budget, evicting LRU entries."""
+    local = LRUCache(max_bytes=300, max_item_bytes=300, ttl_seconds=0)
+    local.set("a", "x" * 50)
+    local.set("b", "y" * 50)
+    local.get("a")
+    local.set("c", "z" * 50)
+    assert local.bytes <= 300
+    assert local.get("b") is None
+    assert local.get("a") is not None
+
+
+def test_batch_computes_only_unique_misses():
+    """Test batches reuse cached results and compute duplicates once."""
+    cache = make_cache()
+    computed = []
+
+    async def compute(texts):
+        computed.append(list(texts))
+        return [text[::-1] for text in texts]
+
+    async def run():
+        await cache.get_or_compute_many(["ab"], compute)
+        return await cache.get_or_compute_many(["ab", "cd", "cd"], compute)
+
+    assert asyncio.run(run()) == ["ba", "dc", "dc"]
+    assert computed == [["ab"], ["cd"]]
+
+
+def test_cache_can_be_bypassed_per_request():
+    """Test Cache-Control: no-cache neither reads nor fills the cache."""
+    headers = {"Authorization": f"Bearer {valid_token}"}
+    client.post("/infer", headers=headers, json={"text": "cached"})
+
+    def lookups():
+        return {
+            result: CACHE_LOOKUPS.labels(result=result).value()
+            for result in ("local", "shared", "coalesced", "miss")
+        }
+
+    before, entries = lookups(), len(model_registry.cache_local)
+    responses = [
+        client.post(
+            "/infer", headers={**headers, "Cache-Control": "no-cache"}, json={"text": text}
+        )
+        for text in ("cached", "bypass")
+    ]
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert responses[1].json().get("data") == {"result": "ssapyb"}
+    assert lookups() == before
+    assert len(model_registry.cache_local) == entries
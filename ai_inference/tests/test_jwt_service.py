@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from fastapi import HTTPException
+from jwt.algorithms import OKPAlgorithm
+
+from infrastructure import jwt_service
+from infrastructure.jwt_service import KeySet, VerifiedTokenCache, create_token, decode_token
+
+
+def test_decode_token_served_from_cache(monkeypatch):
+    """Test a token seen before is verified from the cache without decoding it again."""
+    token = create_token({"sub": "cached-user", "exp": int(time.time()) + 3600})
+    assert decode_token(token)["sub"] == "cached-user"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token was decoded again")
+
+    monkeypatch.setattr(jwt_service.jwt, "decode", fail)
+    assert decode_token(token)["sub"] == "cached-user"
+
+
+def test_cached_token_expires_with_exp_claim():
+    """Test cached tokens expire with their exp claim and the cache stays within max_entries."""
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=3600)
+    cache.set(b"expired", {"exp": time.time() - 1})
+    cache.set(b"valid", {"exp": time.time() + 60})
+    cache.set(b"newest", {"exp": time.time() + 60})
+
+    assert cache.get(b"expired") is None
+    assert cache.get(b"valid") is not None
+    assert len(cache) == 2
+
+
+def write_jwks(jwks_file, *keys):
+    jwks = []
+    for kid, key in keys:
+        jwk = json.loads(OKPAlgorithm.to_jwk(key.public_key()))
+        jwks.append({**jwk, "kid": kid, "alg": "EdDSA"})
+    jwks_file.write_text(json.dumps({"keys": jwks}))
+    # Make sure the change is visible even within the filesystem's mtime resolution.
+    stamp = time.time() + len(keys)
+    os.utime(jwks_file, (stamp, stamp))
+
+
+def test_jwks_key_rotation_by_kid(tmp_path):
+    """Test keys added to the JWKS file are trusted, and removed ones rejected, after a reload."""
+    jwks_file = tmp_path / "jwks.json"
+    old_key, new_key = Ed25519PrivateKey.generate(), Ed25519PrivateKey.generate()
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=3600)
+    write_jwks(jwks_file, ("old", old_key))
+    key_set = KeySet(
+        algorithm="EdDSA", secret="", jwks_file=str(jwks_file), on_change=cache.clear
+    )
+
+    old_token = jwt.encode({"sub": "user"}, old_key, algorithm="EdDSA", headers={"kid": "old"})
+    new_token = jwt.encode({"sub": "user"}, new_key, algorithm="EdDSA", headers={"kid": "new"})
+    with pytest.raises(jwt.InvalidKeyError):
+        key_set.resolve(new_token)
+
+    write_jwks(jwks_file, ("old", old_key), ("new", new_key))
+    assert key_set.reload()
+    key, algorithms = key_set.resolve(new_token)
+    assert jwt.decode(new_token, key, algorithms=algorithms)["sub"] == "user"
+
+    cache.set(b"old", {"sub": "user"})
+    os.utime(jwks_file, (time.time() + 10, time.time() + 10))
+    assert not key_set.reload()
+    assert cache.get(b"old") is not None
+
+    write_jwks(jwks_file, ("new", new_key))
+    assert key_set.reload()
+    assert cache.get(b"old") is None
+    with pytest.raises(jwt.InvalidKeyError):
+        key_set.resolve(old_token)
+
+
+def test_jwks_file_is_watched_off_the_event_loop(tmp_path):
+    """Test a started key set picks up a changed JWKS file from a worker thread."""
+    jwks_file = tmp_path / "jwks.json"
+    key = Ed25519PrivateKey.generate()
+    write_jwks(jwks_file, ("old", key))
+    reloaded_on = []
+    key_set = KeySet(
+        algorithm="EdDSA",
+        secret="",
+        jwks_file=str(jwks_file),
+        reload_interval=0.01,
+        on_change=lambda: reloaded_on.append(threading.get_ident()),
+    )
+    token = jwt.encode({"sub": "user"}, key, algorithm="EdDSA", headers={"kid": "new"})
+
+    async def run():
+        key_set.start()
+        write_jwks(jwks_file, ("new", key))
+        for _ in range(100):
+            if reloaded_on:
+                break
+            await asyncio.sleep(0.01)
+        await key_set.stop()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert reloaded_on and loop_thread not in reloaded_on
+    key_set.resolve(token)
+
+
+def test_decode_token_rejects_unknown_key():
+    """Test a token signed with an unknown key is rejected with 401."""
+    token = jwt.encode({"sub": "user"}, "another-secret", algorithm="HS256")
+    with pytest.raises(HTTPException) as error:
+        decode_token(token)
+    assert error.value.status_code == 401
@@ -0,0 +1,91 @@
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener
+
+from config.logging import DebugSamplingFilter, JsonFormatter, _StructuredQueueHandler
+
+
+class ListHandler(logging.Handler):
+    """Handler that keeps every formatted record in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",), name="test", **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_adds_extra_fields():
+    """Test records render as JSON with the standard fields and every ``extra`` field."""
+    entry = json.loads(JsonFormatter().format(make_record(request_id="abc", latency_ms=1.5)))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test"
+    assert entry["message"] == "hello world"
+    assert entry["request_id"] == "abc" and entry["latency_ms"] == 1.5
+    assert "timestamp" in entry and "args" not in entry and "exc_info" not in entry
+
+
+def test_json_formatter_renders_exceptions():
+    """Test the traceback of a logged exception is rendered into the payload."""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record(logging.ERROR, "failed", None)
+        record.exc_info = sys.exc_info()
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_debug_sampling_keeps_one_in_n_and_never_drops_info():
+    """Test DEBUG records are sampled per logger while INFO and above always pass."""
+    sampler = DebugSamplingFilter(3)
+
+    debug = [sampler.filter(make_record(logging.DEBUG)) for _ in range(7)]
+    other = [sampler.filter(make_record(logging.DEBUG, name="other")) for _ in range(2)]
+    info = [sampler.filter(make_record(level)) for level in (logging.INFO, logging.ERROR) * 5]
+
+    assert debug == [True, False, False, True, False, False, True]
+    assert other == [True, False]
+    assert all(info)
+
+
+def test_queue_handler_keeps_extras_across_the_listener_thread():
+    """Test records queued by the handler reach the listener with extras and traceback intact."""
+    log_queue = queue.SimpleQueue()
+    output = ListHandler()
+    output.setFormatter(JsonFormatter())
+    listener = QueueListener(log_queue, output)
+    logger = logging.getLogger("test.queue")
+    logger.propagate = False
+    logger.addHandler(_StructuredQueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+
+    listener.start()
+    try:
+        logger.info("job %s done", "j1", extra={"job_id": "j1", "attempt": 2})
+        try:
+            raise RuntimeError("worker died")
+        except RuntimeError:
+            logger.exception("job failed", extra={"job_id": "j2"})
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+        logger.propagate = True
+
+    done, failed = (json.loads(line) for line in output.lines)
+    assert done["message"] == "job j1 done"
+    assert done["job_id"] == "j1" and done["attempt"] == 2
+    assert failed["job_id"] == "j2"
+    assert "RuntimeError: worker died" in failed["exc_info"]
+    assert failed["message"] == "job failed"
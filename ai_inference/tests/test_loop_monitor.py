@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from config.settings import settings
+from infrastructure.jwt_service import create_token
+from infrastructure.loop_monitor import LoopLagMonitor
+from src.main import app
+
+valid_token = create_token({"sub": "admin"})
+
+
+def block_the_loop(seconds: float):
+    time.sleep(seconds)
+
+
+def test_stalls_are_reported_with_the_blocking_stack():
+    """Test a task that blocks the loop is reported with its location and stack."""
+    monitor = LoopLagMonitor(interval=0.01, slow_threshold=0.05)
+
+    async def offender():
+        block_the_loop(0.2)
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await offender()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    asyncio.run(run())
+    report = monitor.report()
+
+    assert report["stalls"] == 1
+    assert report["lag_ms"]["max"] >= 100
+    assert report["lag_ms"]["samples"] > 0
+    (stall,) = report["offenders"]
+    assert stall["task"].endswith("run")
+    assert stall["location"].endswith("in block_the_loop")
+    assert stall["count"] == 1 and 0.1 <= stall["max_seconds"] <= 0.25
+    assert any("block_the_loop(0.2)" in line for line in stall["stack"])
+
+
+def test_short_callbacks_are_not_stalls():
+    """Test callbacks under the threshold only show up as lag."""
+    monitor = LoopLagMonitor(interval=0.01, slow_threshold=0.1)
+
+    async def run():
+        monitor.start()
+        for _ in range(5):
+            block_the_loop(0.01)
+            await asyncio.sleep(0.02)
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert monitor.report()["stalls"] == 0
+
+
+def test_loop_report_is_off_without_an_admin_token(monkeypatch):
+    """Test /admin/loop does not exist while ADMIN_TOKEN is unset, even for user tokens."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    response = TestClient(app).get(
+        "/admin/loop", headers={"Authorization": f"Bearer {valid_token}"}
+    )
+    assert response.status_code == 404
+
+
+def test_loop_report_rejects_other_tokens(monkeypatch):
+    """Test /admin/loop answers 401 without a token, with a user token and with a wrong one."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    client = TestClient(app)
+    responses = [
+        client.get("/admin/loop"),
+        client.get("/admin/loop", headers={"Authorization": f"Bearer {valid_token}"}),
+        client.get("/admin/loop", headers={"Authorization": "Bearer guess"}),
+    ]
+    assert [response.status_code for response in responses] == [401, 401, 401]
+
+
+def test_loop_report_requires_the_admin_token(monkeypatch):
+    """Test /admin/loop reports lag percentiles to callers sending ADMIN_TOKEN."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    with TestClient(app) as client:
+        response = client.get("/admin/loop?limit=5", headers={"Authorization": "Bearer secret"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["lag_ms"]) >= {"p50", "p90", "p99", "max"}
+    assert isinstance(body["offenders"], list)
@@ -0,0 +1,42 @@
+import asyncio
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from src.main import app
+from infrastructure.jwt_service import create_token
+from infrastructure.metrics import MetricsRegistry
+
+client = TestClient(app)
+
+valid_token = create_token(
+    {"sub": "test-user", "exp": datetime.utcnow() + timedelta(hours=1)}
+)
+
+
+def test_metrics_endpoint_exposes_hot_paths():
+    """Test /metrics reports inference, JWT and request metrics."""
+    client.post(
+        "/infer",
+        headers={"Authorization": f"Bearer {valid_token}"},
+        json={"text": "hello"},
+    )
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "inference_seconds_count" in response.text
+    assert "jwt_decode_seconds_bucket" in response.text
+    assert 'http_requests_total{method="POST",status="200"}' in response.text
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram samples land in cumulative buckets with sum and count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    text = asyncio.run(registry.render())
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert "latency_seconds_sum 5.55" in text
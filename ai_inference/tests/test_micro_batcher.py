@@ -0,0 +1,58 @@
+import asyncio
+
+from src.application.services.micro_batcher import MicroBatcher
+
+
+def test_concurrent_submits_share_one_batch():
+    """Test concurrent requests are resolved by a single batched call."""
+    calls = []
+
+    async def model(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    async def run():
+        batcher = MicroBatcher(model, max_batch_size=8, max_wait_ms=5)
+        return await asyncio.gather(*(batcher.submit(t) for t in ["a", "b", "c"]))
+
+    assert asyncio.run(run()) == ["A", "B", "C"]
+    assert calls == [["a", "b", "c"]]
+
+
+def test_batch_errors_reach_every_caller():
+    """Test an exception in the batch function is raised for each caller."""
+
+    async def model(texts):
+        raise RuntimeError("model crashed")
+
+    async def run():
+        batcher = MicroBatcher(model, max_batch_size=2, max_wait_ms=5)
+        return await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cancelled_batch_cancels_waiting_callers():
+    """Test callers waiting on a batch that is cancelled do not hang."""
+    started = asyncio.Event()
+
+    async def model(texts):
+        started.set()
+        await asyncio.sleep(10)
+        return texts
+
+    async def run():
+        batcher = MicroBatcher(model, max_batch_size=2, max_wait_ms=5)
+        callers = [asyncio.ensure_future(batcher.submit(t)) for t in ["a", "b"]]
+        await started.wait()
+        for task in list(batcher._running):
+            task.cancel()
+        return await asyncio.wait_for(
+            asyncio.gather(*callers, return_exceptions=True), timeout=1
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
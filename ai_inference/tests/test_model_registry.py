@@ -0,0 +1,264 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config.settings import settings
+from infrastructure.jwt_service import create_token
+from src.application.services.inference_cache import LRUCache
+from src.application.services.inference_model import InferenceModel
+from src.application.services.model_executor import (
+    ProcessModelExecutor,
+    ThreadModelExecutor,
+    _pack,
+    _unpack,
+)
+from src.application.services.model_registry import ModelNotFoundError, ModelRegistry
+from src.main import app
+
+
+class GatedModel(InferenceModel):
+    """Model whose calls block until the test opens the gate."""
+
+    name = "gated"
+    version = "1"
+    gate = threading.Event()
+
+    def predict(self, texts):
+        GatedModel.gate.wait(5)
+        return [text.upper() for text in texts]
+
+
+class WeightsModel(InferenceModel):
+    """Model whose output depends on the revision of weights it loaded."""
+
+    name = "weights"
+    revision = 1
+    loaded_on = []
+
+    def __init__(self):
+        WeightsModel.loaded_on.append(threading.get_ident())
+        self.revision = WeightsModel.revision
+
+    def fingerprint(self):
+        return f"rev-{self.revision}"
+
+    def predict(self, texts):
+        return [f"{text}@{self.revision}" for text in texts]
+
+
+def make_registry(eager=False):
+    return ModelRegistry(
+        models={
+            "gated": f"{GatedModel.__module__}:GatedModel",
+            "weights": f"{WeightsModel.__module__}:WeightsModel",
+        },
+        default="gated",
+        eager=eager,
+        warmup_batches=0,
+        drain_timeout=5,
+        cache_local=LRUCache(max_bytes=1024, max_item_bytes=1024, ttl_seconds=0),
+        cache_shared=None,
+        max_batch_size=4,
+        max_wait_ms=0,
+    )
+
+
+def test_model_is_loaded_lazily_and_versioned():
+    """Test the first request loads the model and a wrong version is rejected."""
+
+    async def run():
+        registry = make_registry()
+        assert registry.status()[0]["state"] == "not_loaded"
+        model = await registry.get()
+        assert model.state == "ready" and model.load_seconds is not None
+        with pytest.raises(ModelNotFoundError):
+            await registry.get("gated", version="2")
+        with pytest.raises(ModelNotFoundError):
+            await registry.get("missing")
+
+    GatedModel.gate.set()
+    asyncio.run(run())
+
+
+def test_swap_lets_in_flight_requests_finish_on_the_old_model():
+    """Test a hot swap serves new requests from the new instance without dropping old ones."""
+
+    async def infer(registry):
+        async with registry.use() as model:
+            return await model.run(["a"])
+
+    async def run():
+        registry = make_registry()
+        GatedModel.gate.set()
+        old = await registry.get()
+
+        GatedModel.gate.clear()
+        request = asyncio.ensure_future(infer(registry))
+        await asyncio.sleep(0.05)
+        swap = asyncio.ensure_future(registry.swap("gated"))
+        await asyncio.sleep(0.05)
+
+        assert (await registry.get()) is not old
+        assert old.state == "retired" and old.in_flight == 1 and not swap.done()
+
+        GatedModel.gate.set()
+        assert await request == ["A"]
+        await swap
+        assert old.in_flight == 0
+        await registry.shutdown()
+
+    asyncio.run(run())
+
+
+def test_concurrent_swaps_retire_every_replaced_instance():
+    """Test concurrent reloads of one model run in turn and retire each instance they replace."""
+
+    async def run():
+        registry = make_registry()
+        GatedModel.gate.set()
+        first = await registry.get()
+        second, third = await asyncio.gather(registry.swap("gated"), registry.swap("gated"))
+        current = await registry.get()
+        await registry.shutdown()
+        return first, second, third, current
+
+    first, second, third, current = asyncio.run(run())
+    assert len({id(first), id(second), id(third)}) == 3
+    assert current is third
+    assert first.state == second.state == "retired"
+
+
+def test_reloaded_weights_do_not_hit_results_cached_for_the_old_ones():
+    """Test a reload with new weights starts a new cache namespace, loaded off the event loop."""
+
+    async def infer(registry):
+        model = await registry.get("weights")
+        return await model.cache.get_or_compute("a", lambda: model.batcher.submit("a"))
+
+    async def run():
+        registry = make_registry()
+        WeightsModel.revision = 1
+        before = await infer(registry)
+        WeightsModel.revision = 2
+        await registry.swap("weights")
+        after = await infer(registry)
+        await registry.shutdown()
+        return before, after, threading.get_ident()
+
+    before, after, loop_thread = asyncio.run(run())
+    assert (before, after) == ("a@1", "a@2")
+    assert loop_thread not in WeightsModel.loaded_on
+
+
+def test_health_reports_models_once_warm():
+    """Test /health reports ready with the cold-start time and memory of each model."""
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        response = client.get("/health")
+        while response.status_code == 503 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            response = client.get("/health")
+
+    assert response.status_code == 200
+    model = response.json()["models"][0]
+    assert model["state"] == "ready"
+    assert model["load_seconds"] is not None and "memory_bytes" in model
+
+
+def test_reload_requires_the_admin_token(monkeypatch):
+    """Test user tokens can list models but only ADMIN_TOKEN can reload one."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    user = {"Authorization": f"Bearer {create_token({'sub': 'user'})}"}
+    with TestClient(app) as client:
+        listed = client.get("/models", headers=user)
+        name = listed.json()["data"]["models"][0]["name"]
+        denied = client.post(f"/models/{name}/reload", headers=user)
+        missing = client.post("/models/missing/reload", headers={"Authorization": "Bearer secret"})
+
+    assert listed.status_code == 200
+    assert denied.status_code == 401
+    assert missing.status_code == 404
+
+
+def test_incomplete_model_fails_when_instantiated():
+    """Test a model class without predict is rejected when created, not on its first request."""
+
+    class NoPredictModel(InferenceModel):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        NoPredictModel()
+
+
+def test_process_executor_is_not_started_by_a_request():
+    """Test a request to a process executor that is not running fails instead of spawning workers."""
+    executor = ProcessModelExecutor(
+        "src.application.services.inference_model:ReverseTextModel", workers=1, shm_threshold=0
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(executor.run(["abc"]))
+    assert executor._pool is None
+
+
+def shm_blocks():
+    """Names of the shared memory blocks that currently exist."""
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def test_pack_round_trips_multibyte_text():
+    """Test texts packed into shared memory come back split at character, not byte, offsets."""
+    texts = ["héllo", "", "wörld ✓"]
+    block, lengths = _pack(texts)
+    block.close()
+
+    assert _unpack(block.name, lengths, unlink=True) == texts
+    assert block.name.lstrip("/") not in shm_blocks()
+
+
+def test_process_executor_passes_large_batches_through_shared_memory():
+    """Test batches above the threshold round-trip through workers and leave no segment behind."""
+    executor = ProcessModelExecutor(
+        "src.application.services.inference_model:ReverseTextModel", workers=1, shm_threshold=8
+    )
+    before = shm_blocks()
+
+    async def run():
+        return await executor.run(["héllo", "wörld ✓"]), await executor.run(["ab", "c"])
+
+    executor.start()
+    try:
+        shared, pickled = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert shared == ["olléh", "✓ dlröw"]
+    assert pickled == ["ba", "c"]
+    assert shm_blocks() == before
+
+
+def test_large_inputs_of_non_blocking_models_leave_the_event_loop():
+    """Test a non-blocking model runs inline for small batches and in the threadpool for large ones."""
+
+    class ThreadRecordingModel(InferenceModel):
+        blocking = False
+        threads = []
+
+        def predict(self, texts):
+            self.threads.append(threading.get_ident())
+            return list(texts)
+
+    executor = ThreadModelExecutor(ThreadRecordingModel(), inline_max_chars=100)
+
+    async def run():
+        await executor.run(["x" * 10] * 9)
+        await executor.run(["x" * 10] * 10)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert ThreadRecordingModel.threads[0] == loop_thread
+    assert ThreadRecordingModel.threads[1] != loop_thread
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.middleware import request_middleware
+from src.middleware.request_middleware import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    RequestLoggerMiddleware,
+)
+
+LOGGER = request_middleware.logger.name
+
+
+def make_app(status=None, error=None):
+    """ASGI app that answers with ``status`` or raises ``error``."""
+
+    async def app(scope, receive, send):
+        if error is not None:
+            raise error
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def call(app, method="GET", path="/things"):
+    """Drive one HTTP request through the middleware and return the messages sent."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path}
+    asyncio.run(RequestLoggerMiddleware(app)(scope, receive, send))
+    return sent
+
+
+def observed() -> int:
+    counts, _ = HTTP_REQUEST_SECONDS.labels().snapshot()
+    return sum(counts)
+
+
+def test_status_comes_from_the_response_start_message(caplog):
+    """Test the logged and counted status is the one the app sent, with the body passed through."""
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    before = HTTP_REQUESTS.labels(method="PUT", status=201).value()
+
+    sent = call(make_app(status=201), method="PUT")
+
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+    assert HTTP_REQUESTS.labels(method="PUT", status=201).value() == before + 1
+    (record,) = [record for record in caplog.records if record.name == LOGGER]
+    assert record.status_code == 201 and record.method == "PUT" and record.path == "/things"
+
+
+def test_downstream_errors_are_recorded_as_500(caplog):
+    """Test a request whose app raises is counted and logged as a 500 and the error re-raised."""
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    before = HTTP_REQUESTS.labels(method="DELETE", status=500).value()
+
+    with pytest.raises(RuntimeError):
+        call(make_app(error=RuntimeError("boom")), method="DELETE")
+
+    assert HTTP_REQUESTS.labels(method="DELETE", status=500).value() == before + 1
+    (record,) = [record for record in caplog.records if record.name == LOGGER]
+    assert record.status_code == 500
+
+
+def test_request_log_is_skipped_above_info(caplog):
+    """Test no access-log record is built when the logger is above INFO, but metrics still are."""
+    caplog.set_level(logging.WARNING, logger=LOGGER)
+    before = HTTP_REQUESTS.labels(method="GET", status=204).value()
+
+    call(make_app(status=204))
+
+    assert HTTP_REQUESTS.labels(method="GET", status=204).value() == before + 1
+    assert not [record for record in caplog.records if record.name == LOGGER]
+
+
+def test_latency_is_observed_once_per_request():
+    """Test each request adds exactly one latency sample, including failed ones."""
+    before = observed()
+
+    call(make_app(status=200))
+    call(make_app(status=404))
+    with pytest.raises(ValueError):
+        call(make_app(error=ValueError("bad")))
+
+    assert observed() == before + 3
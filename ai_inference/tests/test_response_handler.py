@@ -0,0 +1,51 @@
+import enum
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pydantic import BaseModel, Field
+
+from config.response_handler import ResponseHandler
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Item(BaseModel):
+    item_id: uuid.UUID = Field(alias="itemId")
+    color: Color
+    created_at: datetime
+
+
+def test_success_envelope_renders_models_datetimes_enums_and_uuids():
+    """Test the success envelope encodes nested models and special types like jsonable_encoder."""
+    item_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    created_at = datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)
+    response = ResponseHandler.success(
+        message="Created",
+        data={
+            "item": Item(itemId=item_id, color=Color.RED, created_at=created_at),
+            "naive": datetime(2026, 10, 19, 12, 30),
+            "color": Color.RED,
+            "elapsed": timedelta(seconds=1.5),
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {
+        "success": True,
+        "status_code": 200,
+        "message": "Created",
+        "data": {
+            "item": {
+                "itemId": "12345678-1234-5678-1234-567812345678",
+                "color": "red",
+                "created_at": "2026-10-19T12:30:00Z",
+            },
+            "naive": "2026-10-19T12:30:00",
+            "color": "red",
+            "elapsed": 1.5,
+        },
+    }
@@ -0,0 +1,147 @@
+"""
+Shared load-generation, reporting and baseline helpers for the benchmark suite.
+
+A scenario result is a plain dict with the scenario name, request count,
+concurrency, throughput and p50/p99/p999 latency in milliseconds. Results
+can be saved as a JSON baseline and later runs compared against it.
+"""
+
+import asyncio
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def closed_loop(
+    call: Callable[[int], Awaitable[None]], requests: int, concurrency: int
+) -> Tuple[float, List[float]]:
+    """
+    Run ``requests`` calls from ``concurrency`` workers, each starting its
+    next call as soon as the previous one finishes.
+
+    Args:
+        call (Callable[[int], Awaitable[None]]): Performs request number ``i``.
+        requests (int): The total number of calls.
+        concurrency (int): The number of concurrent workers.
+
+    Returns:
+        Tuple[float, List[float]]: The elapsed seconds and per-call latencies.
+    """
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for index in remaining:
+            start = time.perf_counter()
+            await call(index)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def summarize(name: str, concurrency: int, elapsed: float, latencies: List[float]) -> dict:
+    return {
+        "name": name,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "throughput": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "p999_ms": round(percentile(latencies, 0.999) * 1000, 3),
+    }
+
+
+def print_results(results: List[dict]):
+    print(
+        f"{'scenario':>18} {'conc':>6} {'count':>8} {'ops/s':>10} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'p999 ms':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['name']:>18} {result['concurrency']:>6} {result['requests']:>8} "
+            f"{result['throughput']:>10,.0f} {result['p50_ms']:>9.2f} "
+            f"{result['p99_ms']:>9.2f} {result['p999_ms']:>9.2f}"
+        )
+
+
+def save_baseline(path: str, service: str, results: List[dict]):
+    baseline = {
+        "service": service,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result["name"]: result for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+    print(f"saved baseline to {path}")
+
+
+def compare(path: str, results: List[dict], tolerance: float) -> List[str]:
+    """
+    Compare results with a saved baseline.
+
+    A scenario regresses when its throughput drops, or its p99 latency
+    rises, by more than ``tolerance`` (a fraction) relative to the baseline.
+
+    Args:
+        path (str): The baseline file written by ``save_baseline``.
+        results (List[dict]): The results of this run.
+        tolerance (float): The allowed relative change, e.g. ``0.1`` for 10%.
+
+    Returns:
+        List[str]: A description of each regression; empty if none.
+    """
+    with open(path) as file:
+        baseline: Dict[str, dict] = json.load(file)["results"]
+
+    regressions = []
+    print(f"\n{'scenario':>18} {'ops/s vs base':>14} {'p99 vs base':>12}")
+    for result in results:
+        base: Optional[dict] = baseline.get(result["name"])
+        if base is None:
+            print(f"{result['name']:>18} {'(no baseline)':>14}")
+            continue
+        throughput = result["throughput"] / base["throughput"] - 1
+        p99 = result["p99_ms"] / base["p99_ms"] - 1
+        print(f"{result['name']:>18} {throughput:>+14.1%} {p99:>+12.1%}")
+        if throughput < -tolerance:
+            regressions.append(f"{result['name']}: throughput {throughput:+.1%}")
+        if p99 > tolerance:
+            regressions.append(f"{result['name']}: p99 latency {p99:+.1%}")
+    return regressions
+
+
+def add_arguments(parser, concurrency: int = 100, requests: int = 5000):
+    parser.add_argument("--requests", type=int, default=requests)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[concurrency])
+    parser.add_argument("--save-baseline", metavar="FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+
+
+def report(args, service: str, results: List[dict]) -> int:
+    """
+    Print results, save or compare a baseline, and return the exit status.
+
+    Returns:
+        int: 1 if any scenario regressed against ``--baseline``, else 0.
+    """
+    print_results(results)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, service, results)
+    if args.baseline:
+        regressions = compare(args.baseline, results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,162 @@
+"""
+Offline benchmark suite for the telephony job scheduler.
+
+Runs against a temporary SQLite database with no Redis: ``POST /jobs``
+only writes the job and its outbox events, and the outbox relay, scheduler
+tick and worker are not started. Reports throughput and p50/p99/p999
+latency per scenario:
+
+* ``jobs``: ``POST /jobs`` on the full application in process, at each
+  ``--concurrency`` level.
+* ``ws_fanout``: ``--messages`` broadcasts, one at a time, to each of
+  ``--connections`` WebSocket clients on ``/ws/jobs`` served by uvicorn on
+  a local port; latency is measured per delivered message, from broadcast
+  to receipt, and throughput in deliveries per second.
+
+Results can be saved as a baseline and later runs compared against it;
+the exit status is 1 when a scenario regresses by more than
+``--tolerance``.
+
+Run from the ``telephony_job_scheduler`` directory:
+
+    python -m benchmarks.suite --concurrency 50 --connections 100 1000 --save-baseline baseline.json
+    python -m benchmarks.suite --concurrency 50 --connections 100 1000 --baseline baseline.json
+"""
+
+import os
+import tempfile
+
+# Use a throwaway database; keep access logging and admission control out
+# of the measurement.
+_database = os.path.join(tempfile.mkdtemp(prefix="bench-"), "jobs.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_database}")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ADMISSION_MAX_IN_FLIGHT", "0")
+os.environ.setdefault("ADMISSION_MAX_LOOP_LAG_MS", "0")
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import uvicorn
+from websockets.asyncio.client import connect
+
+from benchmarks.harness import add_arguments, closed_loop, report, summarize
+from infrastructure.database.db import Base, engine
+from src.main import app
+from src.routers.websocket import connection_manager
+
+
+async def run_jobs(client: httpx.AsyncClient, requests: int, concurrency: int):
+    schedule_time = (datetime.utcnow() + timedelta(days=1)).isoformat()
+
+    async def call(index: int):
+        response = await client.post(
+            "/jobs",
+            json={
+                "job_name": f"bench {index}",
+                "phone_number": "+1234567890",
+                "schedule_time": schedule_time,
+            },
+        )
+        response.raise_for_status()
+
+    await closed_loop(call, min(requests, 200), concurrency)  # warm up
+    return await closed_loop(call, requests, concurrency)
+
+
+async def run_ws_fanout(port: int, connections: int, messages: int):
+    latencies: List[float] = []
+    clients = [
+        await connect(f"ws://127.0.0.1:{port}/ws/jobs") for _ in range(connections)
+    ]
+    while sum(len(conns) for conns in connection_manager.active_connections.values()) < connections:
+        await asyncio.sleep(0.01)
+
+    # One broadcast at a time: the next is sent once every client has the
+    # previous one, so latency is the fan-out time rather than queueing.
+    delivered = asyncio.Event()
+    pending = 0
+
+    async def receive(websocket):
+        nonlocal pending
+        received = 0
+        while received < messages:
+            message = json.loads(await websocket.recv())
+            if "sent_at" not in message:
+                continue  # The snapshot sent on connect
+            received += 1
+            latencies.append(time.perf_counter() - message["sent_at"])
+            pending -= 1
+            if not pending:
+                delivered.set()
+
+    receivers = [asyncio.create_task(receive(websocket)) for websocket in clients]
+    start = time.perf_counter()
+    for index in range(messages):
+        pending = connections
+        delivered.clear()
+        await connection_manager.broadcast(
+            {
+                "job_status": {"job_id": str(index), "status": "scheduled"},
+                "sent_at": time.perf_counter(),
+            }
+        )
+        await delivered.wait()
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*receivers)
+
+    for websocket in clients:
+        await websocket.close()
+    while connection_manager.active_connections:
+        await asyncio.sleep(0.01)
+    return elapsed, latencies
+
+
+async def main(args) -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=None
+    ) as client:
+        for concurrency in args.concurrency:
+            elapsed, latencies = await run_jobs(client, args.requests, concurrency)
+            results.append(summarize(f"jobs@{concurrency}", concurrency, elapsed, latencies))
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, lifespan="off", log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        for connections in args.connections:
+            elapsed, latencies = await run_ws_fanout(port, connections, args.messages)
+            results.append(
+                summarize(f"ws_fanout@{connections}", connections, elapsed, latencies)
+            )
+    finally:
+        server.should_exit = True
+        await serving
+        await engine.dispose()
+        shutil.rmtree(os.path.dirname(_database), ignore_errors=True)
+    return report(args, "telephony_job_scheduler", results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser, concurrency=50, requests=2000)
+    parser.add_argument("--connections", type=int, nargs="+", default=[100])
+    parser.add_argument("--messages", type=int, default=200)
+    sys.exit(asyncio.run(main(parser.parse_args())))
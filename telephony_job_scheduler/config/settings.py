@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +12,62 @@ class AppSettings(BaseSettings):
     REDIS_HOST: str = "host.docker.internal"
     REDIS_PORT: int = 6379
 
+    QUEUE_BACKEND: Literal["redis", "memory"] = "redis"
+    QUEUE_SNAPSHOT_PATH: str = ""
+    QUEUE_SNAPSHOT_INTERVAL: float = 5.0
+
+    SCHEDULER_TICK_INTERVAL: float = 1.0
+    SCHEDULER_LEASE_TTL_MS: int = 5000
+    SCHEDULER_BATCH_SIZE: int = 500
+
+    WORKER_DRAIN_TIMEOUT: float = 20.0
+
+    JOB_STATS_RECONCILE_INTERVAL: float = 300.0
+    JOB_STATS_STREAM_INTERVAL: float = 1.0
+
+    JOB_ARCHIVE_AFTER_SECONDS: float = 24 * 60 * 60
+    JOB_ARCHIVE_BATCH_SIZE: int = 500
+    JOB_ARCHIVE_INTERVAL: float = 60.0
+    JOB_ARCHIVE_RETENTION_DAYS: int = 0
+
+    JOB_STATE_RECENT_SIZE: int = 1000
+    JOB_STATE_RECENT_SECONDS: float = 600.0
+    JOB_STATE_MAX_ACTIVE: int = 100000
+
+    CAMPAIGN_STORAGE_DIR: str = "campaigns"
+    CAMPAIGN_DISPATCH_WINDOW: int = 1000
+    CAMPAIGN_DISPATCH_INTERVAL: float = 1.0
+
+    WS_PING_INTERVAL: float = 20.0
+    WS_PING_TIMEOUT: float = 20.0
+    WS_PER_MESSAGE_DEFLATE: bool = True
+    WS_MAX_CONNECTIONS: int = 10000
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_IDLE_TIMEOUT: float = 0
+
+    ADMISSION_MAX_IN_FLIGHT: int = 1000
+    ADMISSION_MAX_LATENCY_MS: float = 0
+    ADMISSION_MAX_LOOP_LAG_MS: float = 250
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    READINESS_CHECK_TIMEOUT: float = 1.0
+
+    LOOP_LAG_INTERVAL: float = 0.1
+    LOOP_LAG_WINDOW: int = 600
+    LOOP_SLOW_CALLBACK_MS: float = 100
+    LOOP_MAX_OFFENDERS: int = 50
+
+    ADMIN_TOKEN: str = ""
+
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_POLL_INTERVAL: float = 0.5
+    OUTBOX_CLAIM_SECONDS: float = 30.0
+
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "logs/app.log"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+    LOG_DEBUG_SAMPLE_EVERY: int = 100
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
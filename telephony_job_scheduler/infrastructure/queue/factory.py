@@ -0,0 +1,31 @@
+from typing import Optional
+
+from config.settings import app_settings
+from infrastructure.queue.job_queue import JobQueue
+
+_queue: Optional[JobQueue] = None
+
+
+def get_queue() -> JobQueue:
+    """Return the process-wide job queue for the configured ``QUEUE_BACKEND``
+
+    ``redis`` shares jobs between instances through Redis; ``memory`` keeps
+    them in an in-process heap for single-node deployments.
+
+    Returns:
+        JobQueue: the shared queue instance
+    """
+    global _queue
+    if _queue is None:
+        if app_settings.QUEUE_BACKEND == "memory":
+            from infrastructure.queue.memory_queue import InMemoryQueue
+
+            _queue = InMemoryQueue(
+                snapshot_path=app_settings.QUEUE_SNAPSHOT_PATH,
+                snapshot_interval=app_settings.QUEUE_SNAPSHOT_INTERVAL,
+            )
+        else:
+            from infrastructure.redis.redis_queue import RedisQueue
+
+            _queue = RedisQueue()
+    return _queue
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from typing import Protocol, Sequence, Tuple
+
+
+def to_score(moment: datetime) -> float:
+    """Convert a datetime into a queue ordering score.
+
+    Naive datetimes are treated as UTC, matching how jobs are stored.
+
+    Args:
+        moment (datetime): the datetime to convert
+
+    Returns:
+        float: the POSIX timestamp of the datetime
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class JobQueue(Protocol):
+    """The operations the scheduler, worker and outbox relay need from a job queue.
+
+    Jobs wait in a scheduled set ordered by their due time and are moved onto
+    a FIFO ready queue once due; the worker dequeues from the ready queue.
+    """
+
+    async def start(self) -> None:
+        """Prepare the queue for use; called once on application startup."""
+
+    async def close(self) -> None:
+        """Release the queue's resources; called once on application shutdown."""
+
+    async def ping(self) -> None:
+        """Raise if the queue is unavailable."""
+
+    async def enqueue(self, job_data: dict) -> None:
+        """Push a job onto the tail of the ready queue."""
+
+    async def schedule(self, job_data: dict, run_at: datetime) -> None:
+        """Park a job in the scheduled set until ``run_at``."""
+
+    async def push_many(
+        self, ready: Sequence[dict], scheduled: Sequence[Tuple[dict, datetime]]
+    ) -> None:
+        """Enqueue and schedule a batch of jobs in as few operations as possible."""
+
+    async def promote_due(self, now: datetime, batch_size: int) -> int:
+        """Move up to ``batch_size`` jobs due at ``now`` onto the ready queue."""
+
+    async def dequeue(self) -> dict | None:
+        """Pop the job at the head of the ready queue, or None if it is empty."""
+
+    async def wait(self, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for a job to become available."""
+
+    async def ready_depth(self) -> int:
+        """Return the number of jobs waiting on the ready queue."""
+
+    async def scheduled_depth(self) -> int:
+        """Return the number of jobs parked in the scheduled set."""
@@ -0,0 +1,268 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from infrastructure.queue.job_queue import to_score
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryQueue:
+    """An in-process job queue for single-node deployments.
+
+    Scheduled jobs are kept in a heap ordered by due time and ready jobs in
+    a deque, so scheduling and dispatch involve no network round trips.
+    Due jobs are promoted when the worker dequeues, and ``wait`` sleeps
+    until the earliest scheduled job is due or a new job arrives, so no
+    scheduler tick is needed.
+
+    The queue lives in process memory. Set ``snapshot_path`` to write it to
+    disk every ``snapshot_interval`` seconds and on shutdown, and to restore
+    it on startup. A snapshot is stale after a crash, so on startup the
+    application passes the jobs that should be queued to ``reconcile``,
+    which drops finished jobs and adds the ones accepted since.
+    """
+
+    def __init__(self, snapshot_path: str = "", snapshot_interval: float = 5.0):
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self._ready: Deque[dict] = deque()
+        self._scheduled: List[Tuple[float, int, dict]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dirty = False
+        self._snapshot_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Restore the last snapshot and start periodic snapshotting, if configured"""
+        if not self.snapshot_path:
+            return
+        if os.path.exists(self.snapshot_path):
+            await asyncio.to_thread(self._restore)
+        if self._snapshot_task is None:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def close(self) -> None:
+        """Stop periodic snapshotting and write a final snapshot"""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        if self.snapshot_path:
+            await self.snapshot()
+
+    def reconcile(self, jobs: Sequence[Tuple[dict, datetime]]) -> int:
+        """Make the queue hold exactly the given jobs, each once
+
+        Queued jobs that are not given are dropped and given jobs that are
+        not queued are scheduled at their due time; queued jobs keep their
+        place.
+
+        Args:
+            jobs (Sequence[Tuple[dict, datetime]]): the jobs that should be
+                queued, with the time each becomes due
+
+        Returns:
+            int: the number of jobs added
+        """
+        expected = {job_data["id"]: (job_data, run_at) for job_data, run_at in jobs}
+        queued = set()
+
+        def keep(job_data: dict) -> bool:
+            job_id = job_data["id"]
+            if job_id not in expected or job_id in queued:
+                return False
+            queued.add(job_id)
+            return True
+
+        self._ready = deque(job_data for job_data in self._ready if keep(job_data))
+        self._scheduled = [entry for entry in self._scheduled if keep(entry[2])]
+        heapq.heapify(self._scheduled)
+        missing = [job for job_id, job in expected.items() if job_id not in queued]
+        for job_data, run_at in missing:
+            heapq.heappush(self._scheduled, (to_score(run_at), next(self._sequence), job_data))
+        self._changed()
+        return len(missing)
+
+    async def ping(self) -> None:
+        """The queue is in process, so it is always available"""
+
+    def _changed(self):
+        self._dirty = True
+        self._wakeup.set()
+
+    async def enqueue(self, job_data: dict) -> None:
+        """Push a job onto the tail of the ready queue
+
+        Args:
+            job_data (dict): a dictionary containing job data
+
+        Returns:
+            None
+        """
+        self._ready.append(job_data)
+        self._changed()
+
+    async def schedule(self, job_data: dict, run_at: datetime) -> None:
+        """Park a job in the scheduled heap until it becomes due
+
+        Args:
+            job_data (dict): a dictionary containing job data
+            run_at (datetime): the time at which the job becomes due
+
+        Returns:
+            None
+        """
+        heapq.heappush(self._scheduled, (to_score(run_at), next(self._sequence), job_data))
+        self._changed()
+
+    async def push_many(
+        self, ready: Sequence[dict], scheduled: Sequence[Tuple[dict, datetime]]
+    ) -> None:
+        """Enqueue and schedule a batch of jobs
+
+        Args:
+            ready (Sequence[dict]): jobs to push onto the ready queue, in order
+            scheduled (Sequence[Tuple[dict, datetime]]): jobs to park in the
+                scheduled heap, with the time each becomes due
+
+        Returns:
+            None
+        """
+        self._ready.extend(ready)
+        for job_data, run_at in scheduled:
+            heapq.heappush(
+                self._scheduled, (to_score(run_at), next(self._sequence), job_data)
+            )
+        if ready or scheduled:
+            self._changed()
+
+    def _promote(self, now: float, limit: Optional[int] = None) -> int:
+        promoted = 0
+        while self._scheduled and self._scheduled[0][0] <= now:
+            if limit is not None and promoted >= limit:
+                break
+            self._ready.append(heapq.heappop(self._scheduled)[2])
+            promoted += 1
+        if promoted:
+            self._dirty = True
+        return promoted
+
+    async def promote_due(self, now: datetime, batch_size: int) -> int:
+        """Move a batch of due jobs from the scheduled heap onto the ready queue
+
+        Args:
+            now (datetime): jobs scheduled at or before this time are promoted
+            batch_size (int): the maximum number of jobs to promote
+
+        Returns:
+            int: the number of jobs promoted
+        """
+        return self._promote(to_score(now), batch_size)
+
+    async def dequeue(self) -> dict | None:
+        """Promote every due job, then pop the head of the ready queue
+
+        Returns:
+            dict | None: a dictionary containing job data or None if no job is due
+        """
+        self._promote(time.time())
+        if not self._ready:
+            return None
+        self._dirty = True
+        return self._ready.popleft()
+
+    async def wait(self, timeout: float) -> None:
+        """Wait until a job is due or arrives, for at most ``timeout`` seconds
+
+        Args:
+            timeout (float): the maximum number of seconds to wait
+
+        Returns:
+            None
+        """
+        if self._ready:
+            return
+        if self._scheduled:
+            timeout = min(timeout, max(self._scheduled[0][0] - time.time(), 0.0))
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def ready_depth(self) -> int:
+        """Return the number of jobs waiting on the ready queue
+
+        Returns:
+            int: the length of the ready queue
+        """
+        return len(self._ready)
+
+    async def scheduled_depth(self) -> int:
+        """Return the number of jobs parked in the scheduled heap
+
+        Returns:
+            int: the size of the scheduled heap
+        """
+        return len(self._scheduled)
+
+    async def snapshot(self) -> None:
+        """Write the queue to ``snapshot_path``
+
+        The state is copied on the event loop and serialized and written in
+        a thread. The file is replaced atomically, so a crash mid-write
+        leaves the previous snapshot intact.
+
+        Returns:
+            None
+        """
+        state = {
+            "ready": list(self._ready),
+            "scheduled": [[score, job_data] for score, _, job_data in self._scheduled],
+        }
+        self._dirty = False
+        await asyncio.to_thread(self._write, state)
+
+    def _write(self, state: dict):
+        temporary = f"{self.snapshot_path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.snapshot_path)
+
+    def _restore(self):
+        with open(self.snapshot_path) as file:
+            state = json.load(file)
+        self._ready.extend(state["ready"])
+        for score, job_data in state["scheduled"]:
+            self._scheduled.append((score, next(self._sequence), job_data))
+        heapq.heapify(self._scheduled)
+        logger.info(
+            "Restored %s ready and %s scheduled jobs from %s",
+            len(state["ready"]),
+            len(state["scheduled"]),
+            self.snapshot_path,
+        )
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            if not self._dirty:
+                continue
+            try:
+                await self.snapshot()
+            except Exception as e:
+                self._dirty = True
+                logger.exception("Queue snapshot failed: %s", str(e))
@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+# Renews the lease if we already hold it, otherwise tries to take it.
+ACQUIRE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+# Deletes the lease only if it is still held by the caller.
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLease:
+    def __init__(self, redis: Redis, name: str, ttl_ms: int):
+        self.redis = redis
+        self.name = name
+        self.ttl_ms = ttl_ms
+        self.token = uuid4().hex
+        self._acquire = redis.register_script(ACQUIRE_LEASE_SCRIPT)
+        self._release = redis.register_script(RELEASE_LEASE_SCRIPT)
+
+    async def acquire(self) -> bool:
+        """Acquire the lease, or extend it if this instance already holds it
+
+        Returns:
+            bool: True if this instance is the lease holder
+        """
+        held = await self._acquire(keys=[self.name], args=[self.token, self.ttl_ms])
+        return bool(held)
+
+    async def release(self) -> None:
+        """Release the lease if this instance holds it
+
+        Returns:
+            None
+        """
+        await self._release(keys=[self.name], args=[self.token])
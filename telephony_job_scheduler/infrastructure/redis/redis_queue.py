@@ -1,14 +1,51 @@
+import asyncio
 import json
+from datetime import datetime
+from typing import Sequence, Tuple
 
 from redis.asyncio import Redis
 
 from config.settings import app_settings
+from infrastructure.queue.job_queue import to_score
+
+# Moves up to ARGV[2] members with a score <= ARGV[1] from the scheduled
+# sorted set (KEYS[1]) onto the tail of the ready list (KEYS[2]) atomically.
+PROMOTE_DUE_JOBS_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #due == 0 then
+    return 0
+end
+redis.call('ZREM', KEYS[1], unpack(due))
+redis.call('RPUSH', KEYS[2], unpack(due))
+return #due
+"""
 
 
 class RedisQueue:
     def __init__(self, queue_name: str = "job_queue"):
         self.queue_name = queue_name
-        self.redis = Redis(host=app_settings.REDIS_HOST, decode_responses=True)
+        self.scheduled_name = f"{queue_name}:scheduled"
+        self.redis = Redis(
+            host=app_settings.REDIS_HOST,
+            port=app_settings.REDIS_PORT,
+            decode_responses=True,
+        )
+        self._promote_due = self.redis.register_script(PROMOTE_DUE_JOBS_SCRIPT)
+
+    async def start(self) -> None:
+        """Nothing to prepare: Redis holds the queue state"""
+
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+
+    async def ping(self) -> None:
+        """Check that Redis answers
+
+        Raises:
+            redis.exceptions.RedisError: if Redis is unreachable
+        """
+        await self.redis.ping()
 
     async def enqueue(self, job_data: dict) -> None:
         """Enqueue a job to the Redis queue
@@ -21,6 +58,78 @@ class RedisQueue:
         """
         await self.redis.rpush(self.queue_name, json.dumps(job_data))
 
+    async def schedule(self, job_data: dict, run_at: datetime) -> None:
+        """Park a job in the scheduled set until it becomes due
+
+        The job is moved onto the ready queue by the scheduler tick once
+        ``run_at`` has passed.
+
+        Args:
+            job_data (dict): a dictionary containing job data
+            run_at (datetime): the time at which the job becomes due
+
+        Returns:
+            None
+        """
+        await self.redis.zadd(self.scheduled_name, {json.dumps(job_data): to_score(run_at)})
+
+    async def push_many(
+        self, ready: Sequence[dict], scheduled: Sequence[Tuple[dict, datetime]]
+    ) -> None:
+        """Enqueue and schedule a batch of jobs in a single pipeline
+
+        Args:
+            ready (Sequence[dict]): jobs to push onto the ready queue, in order
+            scheduled (Sequence[Tuple[dict, datetime]]): jobs to park in the
+                scheduled set, with the time each becomes due
+
+        Returns:
+            None
+        """
+        if not ready and not scheduled:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        if scheduled:
+            pipe.zadd(
+                self.scheduled_name,
+                {json.dumps(job_data): to_score(run_at) for job_data, run_at in scheduled},
+            )
+        if ready:
+            pipe.rpush(self.queue_name, *(json.dumps(job_data) for job_data in ready))
+        await pipe.execute()
+
+    async def promote_due(self, now: datetime, batch_size: int) -> int:
+        """Move a batch of due jobs from the scheduled set onto the ready queue
+
+        Args:
+            now (datetime): jobs scheduled at or before this time are promoted
+            batch_size (int): the maximum number of jobs to promote
+
+        Returns:
+            int: the number of jobs promoted
+        """
+        promoted = await self._promote_due(
+            keys=[self.scheduled_name, self.queue_name],
+            args=[to_score(now), batch_size],
+        )
+        return int(promoted)
+
+    async def ready_depth(self) -> int:
+        """Return the number of jobs waiting on the ready queue
+
+        Returns:
+            int: the length of the ready queue
+        """
+        return await self.redis.llen(self.queue_name)
+
+    async def scheduled_depth(self) -> int:
+        """Return the number of jobs parked in the scheduled set
+
+        Returns:
+            int: the size of the scheduled set
+        """
+        return await self.redis.zcard(self.scheduled_name)
+
     async def dequeue(self) -> dict | None:
         """Dequeue a job from the Redis queue
 
@@ -30,3 +139,16 @@ class RedisQueue:
 
         job_json = await self.redis.lpop(self.queue_name)
         return json.loads(job_json) if job_json else None
+
+    async def wait(self, timeout: float) -> None:
+        """Wait before polling the ready queue again
+
+        Redis does not notify the worker of new jobs, so this simply sleeps.
+
+        Args:
+            timeout (float): the number of seconds to wait
+
+        Returns:
+            None
+        """
+        await asyncio.sleep(timeout)
@@ -1,14 +1,54 @@
+import asyncio
+import json
 import logging
+import time
 from asyncio import Lock
 from collections import defaultdict
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
+
+from config.settings import app_settings
+from infrastructure.metrics import registry
 
 logger = logging.getLogger(__name__)
 
+BROADCAST_SECONDS = registry.histogram(
+    "websocket_broadcast_seconds", "Time spent fanning a message out to all sockets."
+)
+BROADCAST_SEND_FAILURES = registry.counter(
+    "websocket_send_failures_total", "Number of failed WebSocket sends."
+)
+CONNECTIONS_REJECTED = registry.counter(
+    "websocket_connections_rejected_total",
+    "Number of WebSocket connections refused at the connection cap.",
+)
+CONNECTIONS_REAPED = registry.counter(
+    "websocket_connections_reaped_total",
+    "Number of WebSocket connections closed by the server.",
+    ("reason",),
+)
+
+# Times the initial frame is built outside the lock before it is built under it
+INITIAL_FRAME_ATTEMPTS = 3
+
 
 class ConnectionManager:
+    """
+    Tracks the open WebSocket connections of this process and fans messages
+    out to them.
+
+    Every connection has a bounded send queue drained by its own writer
+    task, so a broadcast serializes the message once and only enqueues it;
+    a slow or dead client never delays the others. A client whose queue
+    overflows is closed, as is one that has sent nothing for
+    ``WS_IDLE_TIMEOUT`` seconds (when set). At most ``WS_MAX_CONNECTIONS``
+    connections are accepted.
+
+    Protocol-level ping/pong, which detects half-open connections, is done
+    by the server; see ``WS_PING_INTERVAL`` and ``WS_PING_TIMEOUT``.
+    """
+
     _instance = None
 
     def __new__(cls):
@@ -22,34 +62,120 @@ class ConnectionManager:
             return
         self.active_connections: Dict[str, List[WebSocket]] = defaultdict(list)
         self.lock = Lock()
+        self.max_connections = app_settings.WS_MAX_CONNECTIONS
+        self.send_queue_size = app_settings.WS_SEND_QUEUE_SIZE
+        self.idle_timeout = app_settings.WS_IDLE_TIMEOUT
+        self.open_connections = 0
+        self.send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.last_received: Dict[WebSocket, float] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
         self._initialized = True
+        registry.gauge(
+            "websocket_connections",
+            "Number of open WebSocket connections.",
+            lambda: sum(len(conns) for conns in self.active_connections.values()),
+        )
 
-    async def connect(self, websocket: WebSocket, user_id: str):
+    async def accept(self, websocket: WebSocket) -> bool:
+        """
+        Accepts a WebSocket connection unless the process is at
+        ``WS_MAX_CONNECTIONS``, in which case it is closed with 1013 (try
+        again later). Every accepted connection must be given back with
+        ``release``.
+
+        Args:
+            websocket (WebSocket): The WebSocket connection to accept.
+
+        Returns:
+            bool: True if the connection was accepted.
+        """
+
+        if self.max_connections and self.open_connections >= self.max_connections:
+            await websocket.accept()
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Too many connections")
+            CONNECTIONS_REJECTED.inc()
+            return False
+        await websocket.accept()
+        self.open_connections += 1
+        return True
+
+    def release(self):
+        """Gives back a connection slot taken by ``accept``."""
+        self.open_connections -= 1
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        initial: Optional[Callable[[], Awaitable[Tuple[int, str]]]] = None,
+        initial_version: Optional[Callable[[], int]] = None,
+    ) -> bool:
         """
         Accepts a WebSocket connection and adds it to the active connections
-        list for the specified user_id. Ensures thread-safe access to the
-        active connections using a lock.
+        list for the specified user_id, starting the writer task that sends
+        it broadcasts. Ensures thread-safe access to the active connections
+        using a lock.
 
         Args:
             websocket (WebSocket): The WebSocket connection to be added.
             user_id (str): The identifier for the user associated with the
                         WebSocket connection.
+            initial (Optional[Callable[[], Awaitable[Tuple[int, str]]]]):
+                Builds a frame to send before any broadcast, returned with
+                the version of the state it shows. It is built outside the
+                lock, so broadcasts are not held up while it is serialized.
+            initial_version (Optional[Callable[[], int]]): Returns the
+                current version of that state. A frame whose version is no
+                longer current when the lock is taken may have missed a
+                broadcast, so it is rebuilt; after ``INITIAL_FRAME_ATTEMPTS``
+                tries it is built under the lock.
+
+        Returns:
+            bool: False if the connection was refused at the connection cap.
+
+        Raises:
+            Exception: Whatever building the initial frame raised; the
+                connection slot is given back first.
 
         Logs:
             Logs the successful connection of the WebSocket with the client's
             information.
         """
 
-        await websocket.accept()
-        async with self.lock:
-            self.active_connections[user_id].append(websocket)
+        if not await self.accept(websocket):
+            return False
+        attempts = 0
+        try:
+            while True:
+                attempts += 1
+                version, frame = await initial() if initial is not None else (None, None)
+                async with self.lock:
+                    stale = initial_version is not None and version != initial_version()
+                    if frame is not None and stale:
+                        if attempts < INITIAL_FRAME_ATTEMPTS:
+                            continue
+                        _, frame = await initial()
+                    self.active_connections[user_id].append(websocket)
+                    self.send_queues[websocket] = asyncio.Queue(maxsize=self.send_queue_size)
+                    if frame is not None:
+                        self.send_queues[websocket].put_nowait(frame)
+                    self.touch(websocket)
+                    self._writers[websocket] = asyncio.create_task(self._write(websocket, user_id))
+                    break
+        except BaseException:
+            # The connection never joined, so disconnect will not free its slot
+            self.release()
+            raise
         logger.info("WebSocket connected: %s", websocket.client)
+        return True
 
     async def disconnect(self, websocket: WebSocket, user_id: str):
         """
-        Closes a WebSocket connection and removes it from the active connections
-        list for the specified user_id. Ensures thread-safe access to the
-        active connections using a lock.
+        Removes a WebSocket connection from the active connections list for
+        the specified user_id and stops its writer task. Ensures thread-safe
+        access to the active connections using a lock. Disconnecting a
+        connection twice is harmless.
 
         Args:
             websocket (WebSocket): The WebSocket connection to be removed.
@@ -62,38 +188,123 @@ class ConnectionManager:
         """
 
         async with self.lock:
+            if websocket not in self.send_queues:
+                return
             if websocket in self.active_connections[user_id]:
                 self.active_connections[user_id].remove(websocket)
                 if not self.active_connections[user_id]:
                     del self.active_connections[user_id]
+            del self.send_queues[websocket]
+            self.last_received.pop(websocket, None)
+            writer = self._writers.pop(websocket, None)
+            self.release()
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info("WebSocket disconnected: %s", websocket.client)
 
+    def touch(self, websocket: WebSocket):
+        """
+        Records that a message was received from a connection, resetting its
+        idle timer.
+
+        Args:
+            websocket (WebSocket): The WebSocket connection.
+        """
+        self.last_received[websocket] = asyncio.get_running_loop().time()
+
+    def send(self, websocket: WebSocket, text: str) -> bool:
+        """
+        Queues a text frame for one connection.
+
+        Args:
+            websocket (WebSocket): The WebSocket connection.
+            text (str): The frame to send.
+
+        Returns:
+            bool: False if the connection is gone or its send queue is full.
+        """
+        queue = self.send_queues.get(websocket)
+        if queue is None:
+            return False
+        try:
+            queue.put_nowait(text)
+        except asyncio.QueueFull:
+            return False
+        return True
+
     async def broadcast(self, data: dict) -> None:
         """Broadcasts a message to all active WebSocket connections.
 
+        The message is serialized once and queued for every connection.
+        Connections whose send queue is full are closed.
+
         Args:
             data (dict): The dictionary data to be sent to the connected clients.
 
         Logs:
-            Logs any exceptions raised during the broadcast and the user_id
-            associated with the failed send.
+            Logs the user_id of every connection closed for falling behind.
         """
+        start_time = time.perf_counter()
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
         async with self.lock:
             connections_snapshot = {
                 user_id: conns[:] for user_id, conns in self.active_connections.items()
             }
 
-        failed_connections: List[tuple[str, WebSocket]] = []
-
+        slow_connections: List[tuple[str, WebSocket]] = []
         for user_id, conns in connections_snapshot.items():
             for conn in conns:
-                try:
-                    await conn.send_json(data)
-                except Exception as e:
-                    logger.warning(
-                        "WebSocket send failed for user_id=%s: %s", user_id, str(e)
-                    )
-                    failed_connections.append((user_id, conn))
-
-        for user_id, conn in failed_connections:
-            await self.disconnect(conn, user_id)
+                if not self.send(conn, text):
+                    slow_connections.append((user_id, conn))
+
+        BROADCAST_SECONDS.observe(time.perf_counter() - start_time)
+        for user_id, conn in slow_connections:
+            logger.warning("WebSocket send queue full for user_id=%s", user_id)
+            self._reap(conn, user_id, "slow", status.WS_1008_POLICY_VIOLATION, "Too slow")
+
+    def _reap(self, websocket: WebSocket, user_id: str, reason: str, code: int, message: str):
+        """
+        Disconnects a connection and closes it in the background; closing a
+        dead connection can wait for the server's close timeout.
+        """
+        if websocket not in self.send_queues:
+            return
+        CONNECTIONS_REAPED.labels(reason=reason).inc()
+        task = asyncio.create_task(self._close(websocket, user_id, code, message))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, websocket: WebSocket, user_id: str, code: int, message: str):
+        await self.disconnect(websocket, user_id)
+        try:
+            await websocket.close(code=code, reason=message)
+        except Exception as e:
+            logger.debug("WebSocket close failed for user_id=%s: %s", user_id, str(e))
+
+    async def _write(self, websocket: WebSocket, user_id: str):
+        """
+        Sends a connection its queued frames, and closes it once it has been
+        idle for ``WS_IDLE_TIMEOUT`` seconds.
+        """
+        queue = self.send_queues[websocket]
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if self.idle_timeout:
+                    remaining = self.last_received[websocket] + self.idle_timeout - loop.time()
+                    if remaining <= 0:
+                        self._reap(websocket, user_id, "idle", status.WS_1000_NORMAL_CLOSURE, "Idle")
+                        return
+                    try:
+                        text = await asyncio.wait_for(queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        continue
+                else:
+                    text = await queue.get()
+                await websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("WebSocket send failed for user_id=%s: %s", user_id, str(e))
+            BROADCAST_SEND_FAILURES.inc()
+            self._reap(websocket, user_id, "send_failed", status.WS_1011_INTERNAL_ERROR, "Send failed")
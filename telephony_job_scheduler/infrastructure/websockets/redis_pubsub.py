@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Sequence
 
 from redis.asyncio import Redis
 
@@ -11,9 +11,21 @@ from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
 
 logger = logging.getLogger(__name__)
 
+MessageListener = Callable[[Dict[str, Any]], None]
+
 
 class RedisPubSubService:
-    def __init__(self):
+    """
+    Publishes updates on the Redis channel and relays them to WebSocket
+    connections.
+
+    ``listeners`` are called with every decoded message ``redis_listener``
+    receives, before it is broadcast, so in-process state can follow the
+    channel without this service knowing about it.
+    """
+
+    def __init__(self, listeners: Sequence[MessageListener] = ()):
+        self.listeners = list(listeners)
         self.redis_conn = Redis(
             host=app_settings.REDIS_HOST,
             port=app_settings.REDIS_PORT,
@@ -23,8 +35,9 @@ class RedisPubSubService:
 
     async def redis_listener(self):
         """
-        Listens for Redis messages on the configured channel and broadcasts
-        received messages to all active WebSocket connections.
+        Listens for Redis messages on the configured channel, passes them to
+        the registered listeners and broadcasts them to all active WebSocket
+        connections.
 
         This method is intended to be run in a separate task as it runs an
         infinite loop. If the listener is stopped for any reason, it will
@@ -59,6 +72,11 @@ class RedisPubSubService:
                         continue
 
                     logger.debug("Broadcasting on %s: %s", self.channel, data)
+                    for listener in self.listeners:
+                        try:
+                            listener(data)
+                        except Exception:
+                            logger.exception("Listener %r failed on %s", listener, data)
                     await connection_manager.broadcast(data)
 
                 except asyncio.TimeoutError:
@@ -73,6 +91,39 @@ class RedisPubSubService:
             await pubsub.unsubscribe()
             await pubsub.close()
 
+    @staticmethod
+    def serialize_message(
+        data_type: WebsocketMessageTypesEnum,
+        data: Dict[str, Any],
+    ) -> str:
+        """
+        Serializes an update into the JSON message broadcast on the channel.
+
+        Enum values are serialized by value and datetimes in ISO format.
+
+        Args:
+            data_type (WebsocketMessageTypesEnum): The type of message being
+                published.
+            data (Dict[str, Any]): The data payload to be included in the message.
+
+        Returns:
+            str: The JSON encoded message.
+
+        Raises:
+            TypeError: If an object within the data is not JSON serializable.
+        """
+
+        def default_serializer(obj):
+            if hasattr(obj, "value"):  # For enum values
+                return obj.value
+            elif hasattr(obj, "isoformat"):  # For datetime
+                return obj.isoformat()
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+
+        return json.dumps({data_type.value: data}, default=default_serializer)
+
     async def publish_updates(
         self,
         data_type: WebsocketMessageTypesEnum,
@@ -81,9 +132,8 @@ class RedisPubSubService:
         """
         Publishes updates to a Redis channel with the specified data type and data.
 
-        This method serializes the given data into JSON format, using a custom
-        serializer for handling enum values and datetime objects, and publishes
-        it to the Redis channel.
+        This method serializes the given data into JSON format with
+        ``serialize_message`` and publishes it to the Redis channel.
 
         Args:
             data_type (WebsocketMessageTypesEnum): The type of message being
@@ -98,17 +148,29 @@ class RedisPubSubService:
                 which is logged with an exception message.
         """
 
-        def default_serializer(obj):
-            if hasattr(obj, "value"):  # For enum values
-                return obj.value
-            elif hasattr(obj, "isoformat"):  # For datetime
-                return obj.isoformat()
-            raise TypeError(
-                f"Object of type {type(obj).__name__} is not JSON serializable"
-            )
-
         try:
-            message = json.dumps({data_type.value: data}, default=default_serializer)
+            message = self.serialize_message(data_type, data)
             await self.redis_conn.publish(self.channel, message)
         except Exception as e:
             logger.exception("Error publishing Redis message: %s", str(e))
+
+    async def publish_many(self, messages: Sequence[str]):
+        """
+        Publishes already serialized messages to the Redis channel in a
+        single pipeline, in order.
+
+        Args:
+            messages (Sequence[str]): Messages as returned by
+                ``serialize_message``.
+
+        Raises:
+            Exception: If Redis is unavailable; the caller decides whether
+                to retry.
+        """
+
+        if not messages:
+            return
+        pipe = self.redis_conn.pipeline(transaction=False)
+        for message in messages:
+            pipe.publish(self.channel, message)
+        await pipe.execute()
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CampaignResponseDTO(BaseModel):
+    id: str
+    name: str
+    status: str
+    schedule_time: datetime
+    total: int
+    rejected: int
+    dispatched: int
+    completed: int
+    failed: int
+    created_at: datetime
+    updated_at: datetime
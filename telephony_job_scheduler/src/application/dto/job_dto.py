@@ -1,12 +1,26 @@
 from datetime import datetime
+from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain.cron import parse_cron
 
 
 class CreateJobRequestDTO(BaseModel):
     job_name: str = Field(..., example="Twilio Job")
     phone_number: str = Field(..., example="+1234567890")
-    schedule_time: datetime = Field(..., example="2025-05-20 12:00")
+    schedule_time: Optional[datetime] = Field(None, example="2025-05-20 12:00")
+    cron: Optional[str] = Field(None, example="0 9 * * MON-FRI")
+
+    @model_validator(mode="after")
+    def check_schedule(self):
+        if self.cron is None:
+            if self.schedule_time is None:
+                raise ValueError("schedule_time or cron is required")
+        else:
+            # Rejects invalid expressions and ones that never fire
+            parse_cron(self.cron).next_after(self.schedule_time or datetime.utcnow())
+        return self
 
 
 class JobResponseDTO(BaseModel):
@@ -17,3 +31,13 @@ class JobResponseDTO(BaseModel):
     schedule_time: datetime
     created_at: datetime
     updated_at: datetime
+    cron: Optional[str] = None
+    recurring_job_id: Optional[str] = None
+
+
+class JobStatsResponseDTO(BaseModel):
+    total: int
+    by_status: Dict[str, int]
+    by_hour: Dict[str, int]
+    version: int
+    reconciled_at: Optional[datetime]
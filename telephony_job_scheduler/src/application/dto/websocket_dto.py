@@ -3,3 +3,4 @@ from enum import Enum
 
 class WebsocketMessageTypesEnum(str, Enum):
     job_status = "job_status"
+    campaign_progress = "campaign_progress"
@@ -0,0 +1,693 @@
+import asyncio
+import csv
+import json
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.metrics import registry
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.dto.campaign_dto import CampaignResponseDTO
+from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
+from src.application.services.job_archiver import JobArchiverService
+from src.application.services.job_stats import job_stats
+from src.application.services.outbox_relay import (
+    OutboxRelayService,
+    publish_event,
+    schedule_event,
+)
+from src.domain.enums import FINISHED_STATUSES, CampaignStatus, JobStatus
+from src.domain.models.campaign import Campaign
+from src.domain.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_NUMBERS_INGESTED = registry.counter(
+    "campaign_numbers_ingested_total",
+    "Number of uploaded campaign lines by outcome.",
+    ("outcome",),
+)
+CAMPAIGN_JOBS_DISPATCHED = registry.counter(
+    "campaign_jobs_dispatched_total", "Number of jobs created from campaigns."
+)
+
+# Longest accepted upload line; bounds the memory held for a partial line
+MAX_LINE_BYTES = 4096
+NDJSON_CONTENT_TYPES = {
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+    "application/json-lines",
+}
+PHONE_NUMBER = re.compile(r"\+?[0-9]{6,15}")
+PHONE_SEPARATORS = re.compile(r"[ ().-]")
+
+
+def _status_value(status: Any) -> Any:
+    return status.value if hasattr(status, "value") else status
+
+
+def campaign_job_id(campaign_id: str, index: int) -> str:
+    """
+    Returns the id of the job for a campaign's ``index``-th number.
+
+    The id is derived from the position, so expanding the same numbers twice
+    collides on the primary key instead of creating duplicate jobs.
+
+    Args:
+        campaign_id (str): The ID of the campaign.
+        index (int): The position of the number in the upload.
+
+    Returns:
+        str: The job ID.
+    """
+    return f"{campaign_id}:{index}"
+
+
+def campaign_of(job_id: str) -> Optional[str]:
+    """
+    Returns the campaign a job was created for.
+
+    Args:
+        job_id (str): The ID of the job.
+
+    Returns:
+        Optional[str]: The ID of the campaign, or None for a standalone job.
+    """
+    campaign_id, separator, _ = job_id.partition(":")
+    return campaign_id if separator else None
+
+
+def numbers_path(campaign_id: str) -> str:
+    """
+    Returns the file holding a campaign's numbers, one per line.
+
+    Args:
+        campaign_id (str): The ID of the campaign.
+
+    Returns:
+        str: The path of the file under ``CAMPAIGN_STORAGE_DIR``.
+    """
+    return os.path.join(app_settings.CAMPAIGN_STORAGE_DIR, f"{campaign_id}.txt")
+
+
+def _discard_numbers(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def upload_format(content_type: str) -> str:
+    """
+    Returns the format of an upload from its ``Content-Type``.
+
+    Args:
+        content_type (str): The ``Content-Type`` header of the request.
+
+    Returns:
+        str: ``"ndjson"`` for newline-delimited JSON, otherwise ``"csv"``.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    return "ndjson" if media_type in NDJSON_CONTENT_TYPES else "csv"
+
+
+def normalize_number(value: Any) -> Optional[str]:
+    """
+    Strips separators from a phone number and validates what is left.
+
+    Args:
+        value (Any): The number as uploaded.
+
+    Returns:
+        Optional[str]: The number as an optional ``+`` followed by 6 to 15
+        digits, or None if it is not a phone number.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = str(value)
+    if not isinstance(value, str):
+        return None
+    number = value.strip()
+    if not PHONE_NUMBER.fullmatch(number):
+        number = PHONE_SEPARATORS.sub("", number)
+        if not PHONE_NUMBER.fullmatch(number):
+            return None
+    return number
+
+
+def _ndjson_number(line: str) -> Any:
+    try:
+        return json.loads(line).get("phone_number")
+    except (ValueError, AttributeError):
+        return None
+
+
+async def iter_line_batches(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[bytes]]:
+    """
+    Splits a byte stream into lines, yielding the complete lines of each chunk.
+
+    Only the trailing partial line is carried between chunks.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The request body as it arrives.
+
+    Yields:
+        List[bytes]: The lines completed by a chunk, without line endings.
+
+    Raises:
+        ValueError: If a line is longer than ``MAX_LINE_BYTES``.
+    """
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if len(pending) > MAX_LINE_BYTES:
+            raise ValueError(f"Upload lines must be at most {MAX_LINE_BYTES} bytes")
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+def _write_numbers(
+    file: BinaryIO, lines: List[bytes], upload: str, column: Optional[int]
+) -> Tuple[int, int, Optional[int]]:
+    """
+    Parses a batch of upload lines and appends the valid numbers to ``file``.
+
+    Args:
+        file (BinaryIO): The campaign's numbers file.
+        lines (List[bytes]): Complete upload lines.
+        upload (str): ``"csv"`` or ``"ndjson"``.
+        column (Optional[int]): The CSV column holding the numbers, or None
+            before the first row has been seen.
+
+    Returns:
+        Tuple[int, int, Optional[int]]: The number of accepted and rejected
+        lines, and the CSV column for the following batches.
+    """
+    text = (raw.decode("utf-8", errors="replace") for raw in lines)
+    if upload == "ndjson":
+        values = [_ndjson_number(line) for line in text if line.strip()]
+    else:
+        values = []
+        for row in csv.reader(text):
+            if not any(cell.strip() for cell in row):
+                continue
+            if column is None:
+                header = [cell.strip().lower() for cell in row]
+                if "phone_number" in header:
+                    column = header.index("phone_number")
+                    continue
+                column = 0
+            values.append(row[column] if column < len(row) else None)
+
+    numbers = [number for number in map(normalize_number, values) if number]
+    if numbers:
+        file.write(("\n".join(numbers) + "\n").encode())
+    return len(numbers), len(values) - len(numbers), column
+
+
+async def ingest_numbers(
+    chunks: AsyncIterator[bytes], upload: str, path: str
+) -> Tuple[int, int]:
+    """
+    Writes the valid phone numbers of a streamed upload to ``path``.
+
+    A CSV upload takes the ``phone_number`` column if its first line is a
+    header naming one, otherwise the first column. An NDJSON upload takes
+    the ``phone_number`` field of each object. Blank lines are skipped.
+    The body is consumed chunk by chunk, so memory use does not depend on
+    the size of the upload, and each chunk is parsed and written in a
+    thread, so the event loop is not blocked.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The request body as it arrives.
+        upload (str): ``"csv"`` or ``"ndjson"``.
+        path (str): The file to write the numbers to, one per line.
+
+    Returns:
+        Tuple[int, int]: The number of accepted and rejected lines.
+
+    Raises:
+        ValueError: If a line is longer than ``MAX_LINE_BYTES``.
+    """
+    accepted = rejected = 0
+    column: Optional[int] = None
+    with open(path, "wb") as file:
+        async for lines in iter_line_batches(chunks):
+            batch_accepted, batch_rejected, column = await asyncio.to_thread(
+                _write_numbers, file, lines, upload, column
+            )
+            accepted += batch_accepted
+            rejected += batch_rejected
+
+    CAMPAIGN_NUMBERS_INGESTED.labels(outcome="accepted").inc(accepted)
+    CAMPAIGN_NUMBERS_INGESTED.labels(outcome="rejected").inc(rejected)
+    return accepted, rejected
+
+
+def read_numbers(path: str, offset: int, limit: int) -> Tuple[List[str], int]:
+    """
+    Reads up to ``limit`` numbers from a campaign's file.
+
+    Args:
+        path (str): The campaign's numbers file.
+        offset (int): The byte offset to start reading at.
+        limit (int): The maximum number of numbers to read.
+
+    Returns:
+        Tuple[List[str], int]: The numbers and the offset just past them.
+    """
+    numbers = []
+    with open(path, "rb") as file:
+        file.seek(offset)
+        for _ in range(limit):
+            line = file.readline()
+            if not line:
+                break
+            numbers.append(line.decode().rstrip("\n"))
+        return numbers, file.tell()
+
+
+def campaign_progress(campaign: Campaign) -> Dict[str, Any]:
+    """
+    Builds the progress message published for a campaign.
+
+    Args:
+        campaign (Campaign): The campaign.
+
+    Returns:
+        Dict[str, Any]: The campaign's counters and status.
+    """
+    return {
+        "campaign_id": campaign.id,
+        "name": campaign.name,
+        "status": _status_value(campaign.status),
+        "total": campaign.total,
+        "rejected": campaign.rejected,
+        "dispatched": campaign.dispatched,
+        "in_flight": campaign.dispatched - campaign.completed - campaign.failed,
+        "completed": campaign.completed,
+        "failed": campaign.failed,
+    }
+
+
+async def record_campaign_result(
+    db: AsyncSession, job_id: str, old_status: Any, new_status: Any
+) -> bool:
+    """
+    Counts a campaign job that has just finished against its campaign.
+
+    The counter is incremented in SQL within the caller's transaction, so
+    concurrent workers never overwrite each other's counts.
+
+    Args:
+        db (AsyncSession): The session the job status is committed in.
+        job_id (str): The ID of the job.
+        old_status (Any): The job's previous status.
+        new_status (Any): The job's new status.
+
+    Returns:
+        bool: True if a campaign was updated.
+    """
+    campaign_id = campaign_of(job_id)
+    old_status, new_status = _status_value(old_status), _status_value(new_status)
+    if campaign_id is None or new_status not in FINISHED_STATUSES or old_status in FINISHED_STATUSES:
+        return False
+
+    counter = Campaign.completed if new_status == JobStatus.COMPLETED.value else Campaign.failed
+    await db.execute(
+        update(Campaign).where(Campaign.id == campaign_id).values({counter: counter + 1})
+    )
+    return True
+
+
+class CampaignService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def _to_dto(campaign: Campaign) -> CampaignResponseDTO:
+        return CampaignResponseDTO(
+            id=campaign.id,
+            name=campaign.name,
+            status=_status_value(campaign.status),
+            schedule_time=campaign.schedule_time,
+            total=campaign.total,
+            rejected=campaign.rejected,
+            dispatched=campaign.dispatched,
+            completed=campaign.completed,
+            failed=campaign.failed,
+            created_at=campaign.created_at,
+            updated_at=campaign.updated_at,
+        )
+
+    async def create_campaign(
+        self,
+        name: str,
+        schedule_time: datetime,
+        chunks: AsyncIterator[bytes],
+        upload: str,
+    ) -> CampaignResponseDTO:
+        """
+        Creates a campaign from a streamed upload of phone numbers.
+
+        The numbers are written to the campaign's file as the upload
+        arrives; no jobs are created here. The ``CampaignDispatcherService``
+        turns them into jobs as dispatch capacity frees up.
+
+        Args:
+            name (str): The job name shared by the campaign's jobs.
+            schedule_time (datetime): The schedule time shared by the
+                campaign's jobs.
+            chunks (AsyncIterator[bytes]): The request body as it arrives.
+            upload (str): ``"csv"`` or ``"ndjson"``.
+
+        Returns:
+            CampaignResponseDTO: The created campaign.
+
+        Raises:
+            HTTPException: 400 if the upload has an overlong line or no valid
+                number, 500 if the campaign cannot be stored. The numbers
+                file is removed in both cases.
+        """
+        campaign_id = str(uuid4())
+        path = numbers_path(campaign_id)
+        try:
+            os.makedirs(app_settings.CAMPAIGN_STORAGE_DIR, exist_ok=True)
+            accepted, rejected = await ingest_numbers(chunks, upload, path)
+            if not accepted:
+                raise ValueError("The upload contains no valid phone numbers")
+
+            now = datetime.utcnow()
+            campaign = Campaign(
+                id=campaign_id,
+                name=name,
+                status=CampaignStatus.RUNNING.value,
+                schedule_time=schedule_time,
+                total=accepted,
+                rejected=rejected,
+                cursor=0,
+                dispatched=0,
+                completed=0,
+                failed=0,
+                created_at=now,
+                updated_at=now,
+            )
+            self.db.add(campaign)
+            await self.db.commit()
+        except ValueError as e:
+            await asyncio.to_thread(_discard_numbers, path)
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error creating campaign: {e}")
+            await self.db.rollback()
+            await asyncio.to_thread(_discard_numbers, path)
+            raise HTTPException(status_code=500, detail=f"Error: {e}")
+
+        CampaignDispatcherService.notify()
+        return self._to_dto(campaign)
+
+    async def get_campaign(self, campaign_id: str) -> CampaignResponseDTO:
+        """
+        Returns a campaign and its progress.
+
+        Args:
+            campaign_id (str): The ID of the campaign.
+
+        Returns:
+            CampaignResponseDTO: The campaign.
+
+        Raises:
+            HTTPException: 404 if there is no such campaign.
+        """
+        campaign = await self.db.get(Campaign, campaign_id)
+        if campaign is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found"
+            )
+        return self._to_dto(campaign)
+
+
+class CampaignDispatcherService:
+    """
+    Expands running campaigns into jobs as dispatch capacity frees up.
+
+    A campaign has at most ``CAMPAIGN_DISPATCH_WINDOW`` unfinished jobs.
+    When enough of them finish, the next numbers are read from the
+    campaign's file and created as jobs, with their outbox events, in the
+    transaction that advances the campaign's cursor. Finished jobs are
+    moved to the job archive as the window advances, rather than after
+    ``JOB_ARCHIVE_AFTER_SECONDS``. Job rows, outbox rows and queue entries
+    therefore scale with the window, not with the size of the campaign,
+    unless archival is disabled. The window is refilled in batches of at
+    least a tenth of its size, so jobs are not created one transaction at a
+    time.
+
+    Campaign progress is published on the pub/sub channel when it changes,
+    at most once per ``CAMPAIGN_DISPATCH_INTERVAL`` seconds per campaign.
+
+    A campaign is only dispatched by instances that can read its numbers
+    file. With a ``CAMPAIGN_STORAGE_DIR`` local to each instance, that is
+    the instance that received the upload. With a shared directory, two
+    instances may expand the same numbers at once; the cursor is only
+    advanced from the position the expansion read from, so the later
+    transaction is rolled back.
+    """
+
+    _wakeup = asyncio.Event()
+
+    def __init__(self, pubsub: RedisPubSubService):
+        self.pubsub = pubsub
+        self.window = app_settings.CAMPAIGN_DISPATCH_WINDOW
+        self.interval = app_settings.CAMPAIGN_DISPATCH_INTERVAL
+        self.refill_batch = max(1, self.window // 10)
+        self.archiver = JobArchiverService()
+        self._published: Dict[str, Tuple[Tuple[Any, ...], float]] = {}
+        self._archived: Dict[str, int] = {}
+
+    @classmethod
+    def notify(cls):
+        """
+        Wakes the dispatcher, e.g. after a campaign is created or one of its
+        jobs finished.
+        """
+        cls._wakeup.set()
+
+    async def dispatch_once(self) -> int:
+        """
+        Refills the dispatch window of every running campaign and publishes
+        their progress.
+
+        Returns:
+            int: The number of jobs created.
+        """
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Campaign.id).where(Campaign.status == CampaignStatus.RUNNING.value)
+            )
+            campaign_ids = result.scalars().all()
+
+        dispatched = 0
+        for campaign_id in campaign_ids:
+            try:
+                dispatched += await self._advance(campaign_id)
+            except Exception as e:
+                logger.exception("Dispatching campaign %s failed: %s", campaign_id, str(e))
+        return dispatched
+
+    async def _advance(self, campaign_id: str) -> int:
+        """
+        Creates the next jobs of a campaign if its window has room, and
+        completes the campaign once every job has finished. Campaigns whose
+        numbers file is not on this instance are left to the one it is on.
+
+        Args:
+            campaign_id (str): The ID of the campaign.
+
+        Returns:
+            int: The number of jobs created.
+        """
+        if not await asyncio.to_thread(os.path.exists, numbers_path(campaign_id)):
+            logger.debug("Numbers of campaign %s are not stored on this instance", campaign_id)
+            return 0
+
+        async with AsyncSessionLocal() as db:
+            campaign = await db.get(Campaign, campaign_id)
+            in_flight = campaign.dispatched - campaign.completed - campaign.failed
+            room = self.window - in_flight
+            numbers: List[str] = []
+            if campaign.dispatched < campaign.total and (
+                room >= self.refill_batch or (room > 0 and not in_flight)
+            ):
+                numbers, cursor = await asyncio.to_thread(
+                    read_numbers, numbers_path(campaign.id), campaign.cursor, room
+                )
+                # Job ids of archived jobs no longer collide, so the cursor
+                # guards against another instance expanding the same numbers
+                first = campaign.dispatched
+                advanced = await db.execute(
+                    update(Campaign)
+                    .where(
+                        Campaign.id == campaign.id,
+                        Campaign.cursor == campaign.cursor,
+                        Campaign.dispatched == first,
+                    )
+                    .values(cursor=cursor, dispatched=first + len(numbers))
+                )
+                if not advanced.rowcount:
+                    await db.rollback()
+                    logger.info("Campaign %s was advanced by another instance", campaign_id)
+                    return 0
+                now = datetime.utcnow()
+                for offset, number in enumerate(numbers):
+                    job_id = campaign_job_id(campaign.id, first + offset)
+                    job = Job(
+                        id=job_id,
+                        job_name=campaign.name,
+                        phone_number=number,
+                        status=JobStatus.SCHEDULED.value,
+                        schedule_time=campaign.schedule_time,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    db.add(job)
+                    db.add(
+                        schedule_event(
+                            {
+                                "id": job_id,
+                                "job_name": campaign.name,
+                                "schedule_time": campaign.schedule_time.isoformat(),
+                            },
+                            run_at=campaign.schedule_time,
+                        )
+                    )
+                    db.add(publish_event(self._scheduled_message(job)))
+
+            finished = (
+                campaign.dispatched >= campaign.total
+                and campaign.completed + campaign.failed >= campaign.total
+            )
+            if finished:
+                campaign.status = CampaignStatus.COMPLETED.value
+            if numbers or finished:
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    logger.info("Campaign %s was advanced by another instance", campaign_id)
+                    return 0
+            progress = campaign_progress(campaign)
+            done = campaign.completed + campaign.failed
+
+        if done > self._archived.get(campaign_id, 0):
+            await self._archive_finished(campaign_id, done)
+        if numbers:
+            OutboxRelayService.notify()
+            CAMPAIGN_JOBS_DISPATCHED.inc(len(numbers))
+            for _ in numbers:
+                job_stats.record(None, JobStatus.SCHEDULED, campaign.schedule_time)
+        if finished:
+            await asyncio.to_thread(_discard_numbers, numbers_path(campaign_id))
+            logger.info("Campaign %s completed", campaign_id)
+        await self._publish_progress(progress, force=finished)
+        if finished:
+            self._published.pop(campaign_id, None)
+            self._archived.pop(campaign_id, None)
+        return len(numbers)
+
+    async def _archive_finished(self, campaign_id: str, done: int):
+        """
+        Moves a campaign's finished jobs to the job archive, so its rows in
+        ``jobs`` stay within the dispatch window. Jobs finished within the
+        last ``CAMPAIGN_DISPATCH_INTERVAL`` seconds are left for the next
+        pass, so the worker is done with them.
+
+        Args:
+            campaign_id (str): The ID of the campaign.
+            done (int): The number of the campaign's jobs that have finished.
+        """
+        if not self.archiver.archive_after:
+            return
+        cutoff = datetime.utcnow() - timedelta(seconds=self.interval)
+        while True:
+            archived = await self.archiver.archive_once(
+                Job.id.startswith(f"{campaign_id}:"), cutoff=cutoff
+            )
+            if archived < self.archiver.batch_size:
+                break
+        self._archived[campaign_id] = done
+
+    def _scheduled_message(self, job: Job) -> str:
+        """
+        Serializes the ``job_status`` message announcing a campaign job, in
+        the shape the worker publishes, so WebSocket clients and the job
+        state cache see campaign jobs as soon as they are created.
+
+        Args:
+            job (Job): The job that was created.
+
+        Returns:
+            str: The serialized message.
+        """
+        return self.pubsub.serialize_message(
+            data_type=WebsocketMessageTypesEnum.job_status,
+            data={
+                "job_id": job.id,
+                "status": "scheduled",
+                "message": f"Twilio Job {job.job_name} scheduled for {job.schedule_time}",
+                "job_details": {
+                    "id": job.id,
+                    "job_name": job.job_name,
+                    "status": job.status,
+                    "schedule_time": job.schedule_time.isoformat(),
+                },
+            },
+        )
+
+    async def _publish_progress(self, progress: Dict[str, Any], force: bool = False):
+        """
+        Publishes a campaign's progress if it changed and was not published
+        within the last ``interval`` seconds.
+
+        Args:
+            progress (Dict[str, Any]): The message built by ``campaign_progress``.
+            force (bool): Publish a change regardless of the interval.
+        """
+        now = asyncio.get_running_loop().time()
+        state = tuple(progress.values())
+        last = self._published.get(progress["campaign_id"])
+        if last is not None and (
+            last[0] == state or (not force and now - last[1] < self.interval)
+        ):
+            return
+        self._published[progress["campaign_id"]] = (state, now)
+        await self.pubsub.publish_updates(
+            WebsocketMessageTypesEnum.campaign_progress, progress
+        )
+
+    async def run(self):
+        """
+        Dispatches campaigns whenever ``notify`` is called, and at least every
+        ``CAMPAIGN_DISPATCH_INTERVAL`` seconds, until cancelled.
+        """
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.dispatch_once()
+            except Exception as e:
+                logger.exception("Campaign dispatch failed: %s", str(e))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
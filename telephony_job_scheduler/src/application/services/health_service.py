@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from sqlalchemy import text
+
+from config.settings import app_settings
+from infrastructure.database.db import engine
+from infrastructure.queue.factory import get_queue
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.middleware.admission_middleware import AdmissionController
+
+
+async def check_dependency(check: Callable[[], Awaitable[Any]]) -> str:
+    """
+    Run a dependency check, bounded by ``READINESS_CHECK_TIMEOUT``.
+
+    Args:
+        check (Callable[[], Awaitable[Any]]): Raises if the dependency is unavailable.
+
+    Returns:
+        str: ``"ok"``, or ``"error: <reason>"`` if the check failed or timed out.
+    """
+    try:
+        await asyncio.wait_for(check(), timeout=app_settings.READINESS_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return "error: timeout"
+    except Exception as e:
+        return f"error: {type(e).__name__}"
+    return "ok"
+
+
+async def _ping_database():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def readiness_report(
+    admission: AdmissionController, pubsub: Optional[RedisPubSubService] = None
+) -> Tuple[bool, dict]:
+    """
+    Report whether this instance should receive traffic.
+
+    The instance is ready when admission control would admit a request and
+    both the job queue and the database answer within
+    ``READINESS_CHECK_TIMEOUT``. With the in-process queue, Redis only
+    carries status messages, so it is reported separately but does not make
+    the instance unready: jobs keep running and their messages wait in the
+    outbox until Redis is back.
+
+    Args:
+        admission (AdmissionController): The admission controller of the app.
+        pubsub (Optional[RedisPubSubService]): The pub/sub service, checked
+            when ``QUEUE_BACKEND`` is ``memory``.
+
+    Returns:
+        Tuple[bool, dict]: Whether the instance is ready, and the report.
+    """
+    queue = get_queue()
+    dependencies = [check_dependency(queue.ping), check_dependency(_ping_database)]
+    if app_settings.QUEUE_BACKEND == "memory" and pubsub is not None:
+        dependencies.append(check_dependency(pubsub.redis_conn.ping))
+    queue_status, db_status, *redis_status = await asyncio.gather(*dependencies)
+    queue_depth = None
+    if queue_status == "ok":
+        ready_depth, scheduled_depth = await asyncio.gather(
+            queue.ready_depth(), queue.scheduled_depth()
+        )
+        queue_depth = {"ready": ready_depth, "scheduled": scheduled_depth}
+
+    stats = admission.stats()
+    ready = stats["shedding"] is None and queue_status == db_status == "ok"
+    return ready, {
+        "status": "ready" if ready else "not_ready",
+        **stats,
+        "queue_depth": queue_depth,
+        "dependencies": {
+            "queue": queue_status,
+            "database": db_status,
+            **({"redis": redis_status[0]} if redis_status else {}),
+        },
+    }
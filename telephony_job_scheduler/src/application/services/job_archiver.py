@@ -0,0 +1,236 @@
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import Column, ColumnElement, MetaData, Table, delete, inspect, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.schema import CreateTable
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal, engine
+from infrastructure.metrics import registry
+from src.application.services.job_stats import hour_bucket, job_stats
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+from src.domain.models.job_archive import JobArchiveCount
+
+logger = logging.getLogger(__name__)
+
+JOBS_ARCHIVED = registry.counter(
+    "jobs_archived_total", "Number of finished jobs moved to archive tables."
+)
+ARCHIVE_BATCH_SECONDS = registry.histogram(
+    "job_archive_batch_seconds", "Time spent moving one batch of jobs to the archive."
+)
+
+ARCHIVE_TABLE_PREFIX = "jobs_archive_"
+ARCHIVED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+# Archive tables are created on demand, not by ``Base.metadata.create_all``
+archive_metadata = MetaData()
+
+
+def archive_table(bucket: str) -> Table:
+    """
+    Returns the archive table for a month of ``schedule_time``.
+
+    The table has the same columns as ``jobs``.
+
+    Args:
+        bucket (str): The month, e.g. ``"202505"``.
+
+    Returns:
+        Table: The ``jobs_archive_<bucket>`` table.
+    """
+    name = f"{ARCHIVE_TABLE_PREFIX}{bucket}"
+    table = archive_metadata.tables.get(name)
+    if table is None:
+        table = Table(
+            name,
+            archive_metadata,
+            *(
+                Column(column.name, column.type, primary_key=column.primary_key)
+                for column in Job.__table__.columns
+            ),
+        )
+    return table
+
+
+class JobArchiverService:
+    """
+    Moves finished jobs out of the ``jobs`` table.
+
+    Jobs that are COMPLETED or FAILED and were last updated more than
+    ``JOB_ARCHIVE_AFTER_SECONDS`` ago are moved, in batches of
+    ``JOB_ARCHIVE_BATCH_SIZE``, into one archive table per month of
+    ``schedule_time``. Each batch is its own short transaction, so the
+    database write lock is never held for long. Archived jobs stay in the
+    job statistics through the ``job_archive_counts`` table.
+
+    With ``JOB_ARCHIVE_RETENTION_DAYS`` set, an archive table is dropped
+    once its whole month is older than the retention period.
+    """
+
+    def __init__(self):
+        self.archive_after = app_settings.JOB_ARCHIVE_AFTER_SECONDS
+        self.batch_size = app_settings.JOB_ARCHIVE_BATCH_SIZE
+        self.interval = app_settings.JOB_ARCHIVE_INTERVAL
+        self.retention_days = app_settings.JOB_ARCHIVE_RETENTION_DAYS
+        self._created: Set[str] = set()
+
+    async def _ensure_table(self, table: Table):
+        if table.name not in self._created:
+            # Other instances may create the same table at the same time
+            async with engine.begin() as conn:
+                await conn.execute(CreateTable(table, if_not_exists=True))
+            self._created.add(table.name)
+
+    async def ensure_index(self):
+        """
+        Creates the ``jobs`` indexes missing from databases created before
+        they were declared; ``create_all`` skips tables that already exist.
+        """
+        async with engine.begin() as conn:
+            for index in Job.__table__.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
+
+    async def archive_once(
+        self, *criteria: ColumnElement, cutoff: Optional[datetime] = None
+    ) -> int:
+        """
+        Moves one batch of finished jobs to the archive tables.
+
+        The move starts by deleting the batch from ``jobs``, which returns
+        the deleted rows; they are then copied and the archived counts
+        updated in the same transaction. Only rows this transaction deleted
+        are copied and counted, so an instance archiving the same batch
+        concurrently cannot count a job twice.
+
+        Args:
+            *criteria (ColumnElement): Further conditions on the jobs to
+                archive, e.g. to archive the jobs of one campaign.
+            cutoff (Optional[datetime]): Archive jobs last updated before
+                this time instead of ``JOB_ARCHIVE_AFTER_SECONDS`` ago.
+
+        Returns:
+            int: The number of jobs archived.
+        """
+        if cutoff is None:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.archive_after)
+        archivable = (Job.status.in_(ARCHIVED_STATUSES), Job.updated_at < cutoff, *criteria)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Job.id, Job.schedule_time).where(*archivable).limit(self.batch_size)
+            )
+            candidates = result.all()
+        if not candidates:
+            return 0
+
+        # DDL needs the write lock, so create tables before the move begins
+        for bucket in {schedule_time.strftime("%Y%m") for _, schedule_time in candidates}:
+            await self._ensure_table(archive_table(bucket))
+
+        columns = list(Job.__table__.columns)
+        with ARCHIVE_BATCH_SECONDS.time():
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    delete(Job)
+                    .where(Job.id.in_([job_id for job_id, _ in candidates]), *archivable)
+                    .returning(*columns)
+                )
+                rows = [dict(row._mapping) for row in result.all()]
+                if not rows:
+                    return 0
+
+                buckets: Dict[str, List[dict]] = defaultdict(list)
+                counts: Counter = Counter()
+                for row in rows:
+                    buckets[row["schedule_time"].strftime("%Y%m")].append(row)
+                    counts[(hour_bucket(row["schedule_time"]), row["status"])] += 1
+                for bucket, bucket_rows in buckets.items():
+                    await db.execute(archive_table(bucket).insert(), bucket_rows)
+
+                upsert = insert(JobArchiveCount)
+                await db.execute(
+                    upsert.on_conflict_do_update(
+                        index_elements=[JobArchiveCount.hour, JobArchiveCount.status],
+                        set_={"count": JobArchiveCount.count + upsert.excluded.count},
+                    ),
+                    [
+                        {"hour": hour, "status": status, "count": count}
+                        for (hour, status), count in counts.items()
+                    ],
+                )
+                await db.commit()
+
+        JOBS_ARCHIVED.inc(len(rows))
+        return len(rows)
+
+    async def drop_expired(self) -> List[str]:
+        """
+        Drops archive tables whose month ended before the retention period.
+
+        Their jobs are removed from the archived counts and the job
+        statistics are reconciled.
+
+        Returns:
+            List[str]: The names of the dropped tables.
+        """
+        if not self.retention_days:
+            return []
+
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        async with engine.connect() as conn:
+            names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+
+        dropped = []
+        for name in sorted(names):
+            if not name.startswith(ARCHIVE_TABLE_PREFIX):
+                continue
+            month = datetime.strptime(name[len(ARCHIVE_TABLE_PREFIX) :], "%Y%m")
+            month_end = (month + timedelta(days=32)).replace(day=1)
+            if month_end > cutoff:
+                continue
+
+            table = archive_table(month.strftime("%Y%m"))
+            async with engine.begin() as conn:
+                await conn.execute(
+                    delete(JobArchiveCount).where(
+                        JobArchiveCount.hour.startswith(month.strftime("%Y-%m-"))
+                    )
+                )
+                await conn.run_sync(table.drop, checkfirst=True)
+            self._created.discard(name)
+            dropped.append(name)
+            logger.info("Dropped expired job archive %s", name)
+
+        if dropped:
+            await job_stats.reconcile()
+        return dropped
+
+    async def run(self):
+        """
+        Archives finished jobs and applies retention every
+        ``JOB_ARCHIVE_INTERVAL`` seconds, until cancelled.
+
+        Full batches are archived back to back, yielding to other tasks in
+        between.
+        """
+        await self.ensure_index()
+        while True:
+            try:
+                total = 0
+                while True:
+                    archived = await self.archive_once()
+                    total += archived
+                    if archived < self.batch_size:
+                        break
+                    await asyncio.sleep(0)
+                if total:
+                    logger.info("Archived %s finished jobs", total)
+                await self.drop_expired()
+            except Exception as e:
+                logger.exception("Job archival failed: %s", str(e))
+            await asyncio.sleep(self.interval)
@@ -5,25 +5,37 @@ from uuid import uuid4
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.redis.redis_queue import RedisQueue
+from infrastructure.queue.job_queue import JobQueue
 from infrastructure.websockets.redis_pubsub import RedisPubSubService
 from src.application.dto.job_dto import CreateJobRequestDTO, JobResponseDTO
 from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
+from src.application.services.job_stats import job_stats
+from src.application.services.outbox_relay import (
+    OutboxRelayService,
+    publish_event,
+    schedule_event,
+)
+from src.application.services.recurring_jobs import stage_occurrence
+from src.domain.cron import parse_cron
 from src.domain.enums import JobStatus
 from src.domain.models.job import Job
+from src.domain.models.recurring_job import RecurringJob
 
 logger = logging.getLogger(__name__)
 
 
 class JobSchedulerService:
-    def __init__(self, db: AsyncSession, queue: RedisQueue):
+    def __init__(self, db: AsyncSession, queue: JobQueue):
         self.db = db
         self.queue = queue
         self.pubsub = RedisPubSubService()
 
-    async def _publish_job_status(self, job: Job, status: str, message: str):
+    def _stage_job_status(self, job: Job, status: str, message: str):
         """
-        Publishes the status of a job to connected websocket clients.
+        Stages the status of a job for connected websocket clients.
+
+        The update is written to the outbox in the current transaction and
+        published by the outbox relay once committed.
 
         Args:
             job (Job): The job to publish the status of.
@@ -33,7 +45,7 @@ class JobSchedulerService:
         Returns:
             None
         """
-        await self.pubsub.publish_updates(
+        update = self.pubsub.serialize_message(
             data_type=WebsocketMessageTypesEnum.job_status,
             data={
                 "job_id": job.id,
@@ -54,18 +66,29 @@ class JobSchedulerService:
                 },
             },
         )
+        self.db.add(publish_event(update))
 
     async def schedule_job(self, job_data: CreateJobRequestDTO) -> JobResponseDTO:
         """
-        Schedules a new job by storing it in the database, publishing its initial status,
-        and adding it to the processing queue.
+        Schedules a new job by storing it in the database together with outbox
+        events for its initial status and for adding it to the scheduled set.
+
+        With ``cron`` set, a recurring job is stored instead, and only its
+        first occurrence, at or after ``schedule_time`` (or now), is
+        scheduled; the worker creates each following occurrence when the
+        previous one finishes.
+
+        The job and its outbox events are committed in a single transaction;
+        the outbox relay then delivers them to Redis, so no Redis round trip
+        happens on the request path.
 
         Args:
             job_data (CreateJobRequestDTO): The data required to create a new job,
-            including job name, phone number, and schedule time.
+            including job name, phone number, and schedule time or cron expression.
 
         Returns:
-            JobResponseDTO: A data transfer object containing the details of the scheduled job.
+            JobResponseDTO: A data transfer object containing the details of the
+            scheduled job, or of the first occurrence of a recurring job.
 
         Raises:
             Exception: If an error occurs during the job scheduling process,
@@ -73,34 +96,58 @@ class JobSchedulerService:
         """
 
         try:
-            job = Job(
-                id=str(uuid4()),
-                job_name=job_data.job_name,
-                phone_number=job_data.phone_number,
-                status=JobStatus.SCHEDULED.value,
-                schedule_time=job_data.schedule_time,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.db.add(job)
-            await self.db.commit()
-            await self.db.refresh(job)
-
-            # Publish initial status
-            await self._publish_job_status(
+            now = datetime.utcnow()
+            recurring = None
+            if job_data.cron:
+                recurring = RecurringJob(
+                    id=str(uuid4()),
+                    job_name=job_data.job_name,
+                    phone_number=job_data.phone_number,
+                    cron=job_data.cron,
+                    active=True,
+                    created_at=now,
+                    updated_at=now,
+                )
+                self.db.add(recurring)
+                job = stage_occurrence(
+                    self.db,
+                    recurring,
+                    parse_cron(job_data.cron).at_or_after(job_data.schedule_time or now),
+                )
+            else:
+                job = Job(
+                    id=str(uuid4()),
+                    job_name=job_data.job_name,
+                    phone_number=job_data.phone_number,
+                    status=JobStatus.SCHEDULED.value,
+                    schedule_time=job_data.schedule_time,
+                    created_at=now,
+                    updated_at=now,
+                )
+                self.db.add(job)
+
+                # Park in the scheduled set until it is due
+                self.db.add(
+                    schedule_event(
+                        {
+                            "id": job.id,
+                            "job_name": job.job_name,
+                            "schedule_time": job.schedule_time.isoformat(),
+                        },
+                        run_at=job.schedule_time,
+                    )
+                )
+
+            # Initial status
+            self._stage_job_status(
                 job=job,
                 status="scheduled",
                 message=f"Twilio Job {job.job_name} scheduled for {job.schedule_time}",
             )
 
-            # Add to processing queue
-            await self.queue.enqueue(
-                {
-                    "id": job.id,
-                    "job_name": job.job_name,
-                    "schedule_time": job.schedule_time.isoformat(),
-                }
-            )
+            await self.db.commit()
+            OutboxRelayService.notify()
+            job_stats.record(None, job.status, job.schedule_time)
 
             return JobResponseDTO(
                 id=job.id,
@@ -110,8 +157,29 @@ class JobSchedulerService:
                 schedule_time=job.schedule_time,
                 created_at=job.created_at,
                 updated_at=job.updated_at,
+                cron=job_data.cron,
+                recurring_job_id=recurring.id if recurring else None,
             )
         except Exception as e:
             logger.error(f"Error scheduling job: {e}")
             await self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Error: {e}")
+
+    async def stop_recurring_job(self, recurring_id: str):
+        """
+        Stops a recurring job from creating further occurrences.
+
+        An occurrence that is already scheduled still runs.
+
+        Args:
+            recurring_id (str): The ID of the recurring job.
+
+        Raises:
+            HTTPException: 404 if there is no such recurring job.
+        """
+        recurring = await self.db.get(RecurringJob, recurring_id)
+        if recurring is None:
+            raise HTTPException(status_code=404, detail="Recurring job not found")
+        recurring.active = False
+        recurring.next_run_at = None
+        await self.db.commit()
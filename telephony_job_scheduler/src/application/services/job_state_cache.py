@@ -0,0 +1,209 @@
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.metrics import registry
+from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_EVICTIONS = registry.counter(
+    "job_state_cache_evictions_total",
+    "Number of live jobs dropped from the WebSocket job state cache at its size limit.",
+)
+
+# Columns of each job in a snapshot
+SNAPSHOT_FIELDS = ("id", "job_name", "status", "schedule_time", "updated_at")
+
+# Status labels of job_status messages
+STATUS_LABELS = {
+    "scheduled": JobStatus.SCHEDULED.value,
+    "processing": JobStatus.IN_PROGRESS.value,
+    "completed": JobStatus.COMPLETED.value,
+    "failed": JobStatus.FAILED.value,
+    "cancelled": JobStatus.CANCELLED.value,
+}
+TERMINAL_STATUSES = {
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value,
+}
+
+
+class JobStateCache:
+    """
+    The current state of live jobs and of recently finished ones, kept from
+    the ``job_status`` messages broadcast to WebSocket clients.
+
+    Jobs that are scheduled or in progress are kept until they finish, up
+    to ``max_active`` of them; past that the least recently updated is
+    dropped, so jobs whose final update never arrives cannot grow the cache
+    without bound. The last ``recent_size`` finished jobs are kept for
+    ``recent_seconds``. ``snapshot_message`` serializes the cache for a new
+    WebSocket client in a worker thread, reusing the serialization until the
+    cache next changes, so dashboards can be opened without querying the
+    database or blocking the event loop.
+    """
+
+    def __init__(self, recent_size: int, recent_seconds: float, max_active: int = 0):
+        self.recent_size = recent_size
+        self.recent_seconds = recent_seconds
+        self.max_active = max_active
+        self.active: Dict[str, Dict[str, Any]] = {}
+        self.finished: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.version = 0
+        self._snapshot: Optional[Tuple[int, str]] = None
+
+    def __len__(self):
+        return len(self.active) + len(self.finished)
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def apply(self, data: Dict[str, Any]):
+        """
+        Updates the cache from a message broadcast to WebSocket clients.
+
+        Messages other than ``job_status`` are ignored. A failure that will
+        be retried leaves the job scheduled.
+
+        Args:
+            data (Dict[str, Any]): The decoded message.
+        """
+        update = data.get(WebsocketMessageTypesEnum.job_status.value)
+        if not isinstance(update, dict) or not update.get("job_id"):
+            return
+        status = STATUS_LABELS.get(update.get("status"))
+        if status is None:
+            return
+        if update.get("retrying"):
+            status = JobStatus.SCHEDULED.value
+
+        job_id = update["job_id"]
+        state = self.active.pop(job_id, None)
+        if state is None:
+            state = self.finished.pop(job_id, (0.0, {"id": job_id}))[1]
+        details = update.get("job_details") or {}
+        for field in ("job_name", "schedule_time"):
+            if field in details:
+                state[field] = details[field]
+        state["status"] = status
+        state["updated_at"] = details.get("updated_at") or datetime.utcnow().isoformat()
+
+        if status in TERMINAL_STATUSES:
+            self.finished[job_id] = (self._now(), state)
+        else:
+            self.active[job_id] = state
+        self.version += 1
+        self._trim()
+
+    def _trim(self):
+        while self.max_active and len(self.active) > self.max_active:
+            del self.active[next(iter(self.active))]
+            ACTIVE_EVICTIONS.inc()
+            self.version += 1
+        cutoff = self._now() - self.recent_seconds
+        while self.finished and (
+            len(self.finished) > self.recent_size
+            or next(iter(self.finished.values()))[0] < cutoff
+        ):
+            self.finished.popitem(last=False)
+            self.version += 1
+
+    async def snapshot_message(self) -> Tuple[int, str]:
+        """
+        Returns the cache as a serialized ``snapshot`` message.
+
+        Jobs are sent as rows of ``fields``, live jobs first, then finished
+        jobs from oldest to newest. The rows are taken on the event loop and
+        serialized in a worker thread.
+
+        Returns:
+            Tuple[int, str]: The cache version the message shows, and
+            ``{"snapshot": {"fields": [...], "jobs": [[...], ...]}}``.
+        """
+        self._trim()
+        version = self.version
+        if self._snapshot is None or self._snapshot[0] != version:
+            jobs = [
+                [state.get(field) for field in SNAPSHOT_FIELDS]
+                for state in chain(
+                    self.active.values(), (state for _, state in self.finished.values())
+                )
+            ]
+            text = await asyncio.to_thread(
+                json.dumps,
+                {"snapshot": {"fields": SNAPSHOT_FIELDS, "jobs": jobs}},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+            if self._snapshot is not None and self._snapshot[0] >= version:
+                return version, text
+            self._snapshot = (version, text)
+        return self._snapshot
+
+    async def warm(self):
+        """
+        Loads live and recently finished jobs from the database, once at
+        startup. Jobs already updated by a message are left as they are.
+        """
+        since = datetime.utcnow() - timedelta(seconds=self.recent_seconds)
+        columns = (Job.id, Job.job_name, Job.status, Job.schedule_time, Job.updated_at)
+        async with AsyncSessionLocal() as db:
+            live = await db.execute(
+                select(*columns).where(
+                    Job.status.in_((JobStatus.SCHEDULED.value, JobStatus.IN_PROGRESS.value))
+                )
+            )
+            live_rows = live.all()
+            recent = await db.execute(
+                select(*columns)
+                .where(Job.status.in_(TERMINAL_STATUSES), Job.updated_at >= since)
+                .order_by(Job.updated_at.desc())
+                .limit(self.recent_size)
+            )
+            recent_rows = recent.all()
+
+        now = self._now()
+        for rows, terminal in ((live_rows, False), (reversed(recent_rows), True)):
+            for job_id, job_name, status, schedule_time, updated_at in rows:
+                if job_id in self.active or job_id in self.finished:
+                    continue
+                state = {
+                    "id": job_id,
+                    "job_name": job_name,
+                    "status": status.value if hasattr(status, "value") else status,
+                    "schedule_time": schedule_time.isoformat(),
+                    "updated_at": updated_at.isoformat() if updated_at else None,
+                }
+                if terminal:
+                    age = (datetime.utcnow() - updated_at).total_seconds()
+                    self.finished[job_id] = (now - age, state)
+                else:
+                    self.active[job_id] = state
+        self.version += 1
+        self._trim()
+        logger.info("Job state cache warmed with %s jobs", len(self))
+
+
+job_state_cache = JobStateCache(
+    recent_size=app_settings.JOB_STATE_RECENT_SIZE,
+    recent_seconds=app_settings.JOB_STATE_RECENT_SECONDS,
+    max_active=app_settings.JOB_STATE_MAX_ACTIVE,
+)
+registry.gauge(
+    "job_state_cache_jobs",
+    "Number of jobs held in the WebSocket job state cache.",
+    lambda: len(job_state_cache),
+)
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.metrics import registry
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+from src.domain.models.job_archive import JobArchiveCount
+
+logger = logging.getLogger(__name__)
+
+STATS_RECONCILE_DRIFT = registry.counter(
+    "job_stats_reconcile_drift_total",
+    "Sum of absolute corrections applied to the job counters by reconciliation.",
+)
+
+
+def hour_bucket(schedule_time: datetime) -> str:
+    """
+    Returns the hour of a schedule time as used by the per-hour counters.
+
+    Args:
+        schedule_time (datetime): The job's schedule time (naive UTC).
+
+    Returns:
+        str: The hour, e.g. ``"2025-05-20T12:00"``.
+    """
+    return schedule_time.strftime("%Y-%m-%dT%H:00")
+
+
+def _status_value(status: Any) -> Optional[str]:
+    return status.value if hasattr(status, "value") else status
+
+
+class JobStatsService:
+    """
+    Counts of jobs by status and by hour of ``schedule_time``.
+
+    The counters are updated in memory as jobs are created and change status,
+    so reading them does not touch the database. A periodic reconciliation
+    replaces them with ``GROUP BY`` counts from the ``jobs`` table plus the
+    archived counts, correcting drift from transitions made by other
+    instances or lost on a crash.
+
+    Changes are accumulated and published as one delta every
+    ``stream_interval`` seconds for ``wait_for_delta`` callers, such as the
+    stats WebSocket stream.
+    """
+
+    def __init__(self, reconcile_interval: float, stream_interval: float):
+        self.reconcile_interval = reconcile_interval
+        self.stream_interval = stream_interval
+        self.by_status: Counter = Counter()
+        self.by_hour: Counter = Counter()
+        self.reconciled_at: Optional[datetime] = None
+        self.version = 0
+        self.last_delta: Dict[str, Dict[str, int]] = {}
+        self._pending_status: Counter = Counter()
+        self._pending_hour: Counter = Counter()
+        self._published = asyncio.Event()
+
+    def record(self, old_status: Any, new_status: Any, schedule_time: datetime):
+        """
+        Records a job being created or moving between statuses.
+
+        Args:
+            old_status (Any): The previous status, or None for a new job.
+            new_status (Any): The new status.
+            schedule_time (datetime): The job's schedule time.
+        """
+        old_status, new_status = _status_value(old_status), _status_value(new_status)
+        if old_status == new_status:
+            return
+        if old_status is None:
+            hour = hour_bucket(schedule_time)
+            self.by_hour[hour] += 1
+            self._pending_hour[hour] += 1
+        else:
+            self.by_status[old_status] -= 1
+            self._pending_status[old_status] -= 1
+        self.by_status[new_status] += 1
+        self._pending_status[new_status] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current counters.
+
+        Returns:
+            dict: Counts by status and by hour, the total, the version of the
+            last published delta and the time of the last reconciliation.
+        """
+        by_status = {status.value: self.by_status.get(status.value, 0) for status in JobStatus}
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_hour": dict(sorted((hour, n) for hour, n in self.by_hour.items() if n)),
+            "version": self.version,
+            "reconciled_at": self.reconciled_at,
+        }
+
+    async def reconcile(self):
+        """
+        Replaces the counters with counts from the ``jobs`` table and the
+        ``job_archive_counts`` table.
+
+        The correction is published as part of the next delta. Transitions
+        committed while the query runs may be counted twice or not at all
+        until the next reconciliation.
+        """
+        hour = func.strftime("%Y-%m-%dT%H:00", Job.schedule_time)
+        async with AsyncSessionLocal() as db:
+            status_rows = await db.execute(
+                select(Job.status, func.count()).group_by(Job.status)
+            )
+            hour_rows = await db.execute(select(hour, func.count()).group_by(hour))
+            archived_rows = await db.execute(
+                select(JobArchiveCount.hour, JobArchiveCount.status, JobArchiveCount.count)
+            )
+            by_status = Counter({_status_value(status): n for status, n in status_rows.all()})
+            by_hour = Counter(dict(hour_rows.all()))
+            for hour_key, status, n in archived_rows.all():
+                by_status[_status_value(status)] += n
+                by_hour[hour_key] += n
+
+        drift = 0
+        for current, actual, pending in (
+            (self.by_status, by_status, self._pending_status),
+            (self.by_hour, by_hour, self._pending_hour),
+        ):
+            for key in set(current) | set(actual):
+                correction = actual.get(key, 0) - current.get(key, 0)
+                if correction:
+                    pending[key] += correction
+                    drift += abs(correction)
+            current.clear()
+            current.update(actual)
+        self.reconciled_at = datetime.utcnow()
+        STATS_RECONCILE_DRIFT.inc(drift)
+        if drift:
+            logger.info("Job stats reconciled with a drift of %s", drift)
+
+    def _publish(self):
+        delta = {
+            "by_status": {key: n for key, n in self._pending_status.items() if n},
+            "by_hour": {key: n for key, n in self._pending_hour.items() if n},
+        }
+        self._pending_status.clear()
+        self._pending_hour.clear()
+        if not delta["by_status"] and not delta["by_hour"]:
+            return
+        self.version += 1
+        self.last_delta = delta
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+    async def wait_for_delta(self) -> Tuple[int, Dict[str, Dict[str, int]]]:
+        """
+        Waits for the next published delta.
+
+        Returns:
+            Tuple[int, Dict[str, Dict[str, int]]]: The version the delta
+            brings the counters to, and the change in counts by status and
+            by hour. A caller that already holds ``version - 1`` can apply it;
+            one that missed a version should take a new ``snapshot``.
+        """
+        await self._published.wait()
+        return self.version, self.last_delta
+
+    async def run(self):
+        """
+        Publishes deltas every ``stream_interval`` seconds and reconciles
+        every ``reconcile_interval`` seconds, until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        next_reconcile = loop.time() + self.reconcile_interval
+        while True:
+            await asyncio.sleep(self.stream_interval)
+            if self.reconcile_interval and loop.time() >= next_reconcile:
+                next_reconcile = loop.time() + self.reconcile_interval
+                try:
+                    await self.reconcile()
+                except Exception as e:
+                    logger.exception("Job stats reconciliation failed: %s", str(e))
+            self._publish()
+
+
+job_stats = JobStatsService(
+    reconcile_interval=app_settings.JOB_STATS_RECONCILE_INTERVAL,
+    stream_interval=app_settings.JOB_STATS_STREAM_INTERVAL,
+)
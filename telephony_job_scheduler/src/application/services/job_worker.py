@@ -1,32 +1,71 @@
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, List, Set
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.redis.redis_queue import RedisQueue
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.metrics import registry
+from infrastructure.queue.job_queue import JobQueue
 from infrastructure.websockets.redis_pubsub import RedisPubSubService
 from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
+from src.application.services.campaign_service import (
+    CampaignDispatcherService,
+    record_campaign_result,
+)
+from src.application.services.job_stats import job_stats
+from src.application.services.outbox_relay import (
+    OutboxRelayService,
+    enqueue_event,
+    publish_event,
+)
+from src.application.services.recurring_jobs import schedule_next_occurrence
 from src.domain.enums import JobStatus
 from src.domain.models.job import Job
 
 logger = logging.getLogger(__name__)
 
+JOBS_PROCESSED = registry.counter(
+    "jobs_processed_total", "Number of job runs by outcome.", ("outcome",)
+)
+JOB_RUN_SECONDS = registry.histogram(
+    "job_run_seconds",
+    "Time spent running a job once it is due.",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOBS_REQUEUED = registry.counter(
+    "worker_jobs_requeued_total", "Number of unfinished jobs requeued on worker shutdown."
+)
+
+# Job ids per status query when requeueing, below SQLite's bound-parameter limit
+REQUEUE_QUERY_CHUNK = 500
+
 
 class JobWorkerService:
-    def __init__(self, db: AsyncSession, queue: RedisQueue):
+    def __init__(self, db: AsyncSession, queue: JobQueue):
         self.db = db
         self.queue = queue
         self.pubsub = RedisPubSubService()
+        # Job tasks share one session, which does not allow concurrent use
+        self.db_lock = asyncio.Lock()
         self.active_jobs: Dict[str, asyncio.Task] = {}
+        self.calling_jobs: Set[str] = set()
         self.completed_jobs: List[str] = []
         self.failed_jobs: Dict[str, int] = {}
+        self.draining = False
+        self._running = False
+        self._stopped = asyncio.Event()
+        self._undispatched: List[dict] = []
 
-    async def _publish_status(self, message: dict):
+    def _stage_status(self, message: dict):
         """
-        Publishes a job status message to all connected websocket clients.
+        Stages a job status message for all connected websocket clients.
+
+        The message is written to the outbox in the current transaction and
+        published by the outbox relay once committed.
 
         Args:
             message (dict): A dictionary containing the job status message to be
@@ -43,32 +82,96 @@ class JobWorkerService:
         Returns:
             None
         """
-        await self.pubsub.publish_updates(
-            data_type=WebsocketMessageTypesEnum.job_status, data=message
+        self.db.add(
+            publish_event(
+                self.pubsub.serialize_message(
+                    data_type=WebsocketMessageTypesEnum.job_status, data=message
+                )
+            )
         )
 
-    async def _update_job_status(self, job_id: str, status: str):
+    @staticmethod
+    def _job_status_message(job: Job, status: str, message: str) -> dict:
+        """
+        Builds the status message published for a job transition.
+
+        Args:
+            job (Job): The job whose status changed.
+            status (str): The status label sent to websocket clients.
+            message (str): A message to include with the job status update.
+
+        Returns:
+            dict: The job status message.
+        """
+        return {
+            "job_id": job.id,
+            "status": status,
+            "message": message,
+            "job_details": {
+                "id": job.id,
+                "job_name": job.job_name,
+                "status": job.status,
+                "schedule_time": job.schedule_time.isoformat(),
+            },
+        }
+
+    async def _update_job_status(
+        self,
+        job_id: str,
+        status: str,
+        event: Callable[[Job], dict] | None = None,
+    ):
         """
         Update the status of a job in the database.
 
+        If ``event`` is given, the status message it builds from the updated
+        job is staged in the outbox and committed together with the status.
+        A campaign job that finishes is counted against its campaign, and a
+        finished occurrence of a recurring job gets its next occurrence, in
+        the same transaction.
+
         Args:
             job_id (str): The ID of the job to update.
             status (str): The new status to set for the job.
+            event (Callable[[Job], dict] | None): Builds the status message to
+                publish for the updated job.
 
         Returns:
             Job: The updated job object, if the job was found, otherwise None.
         """
 
-        result = await self.db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalars().first()
+        async with self.db_lock:
+            result = await self.db.execute(select(Job).where(Job.id == job_id))
+            job = result.scalars().first()
 
-        if job:
-            job.status = status
-            job.updated_at = datetime.utcnow()
-            await self.db.commit()
-            await self.db.refresh(job)
-            return job
-        return None
+            if job:
+                old_status = job.status
+                job.status = status
+                job.updated_at = datetime.utcnow()
+                if event:
+                    self._stage_status(event(job))
+                campaign_updated = await record_campaign_result(
+                    self.db, job.id, old_status, status
+                )
+                next_job = await schedule_next_occurrence(self.db, job, old_status, status)
+                if next_job:
+                    self._stage_status(
+                        self._job_status_message(
+                            next_job,
+                            "scheduled",
+                            f"Twilio Job {next_job.job_name} scheduled for {next_job.schedule_time}",
+                        )
+                    )
+                await self.db.commit()
+                OutboxRelayService.notify()
+                if campaign_updated:
+                    CampaignDispatcherService.notify()
+                job_stats.record(old_status, status, job.schedule_time)
+                if next_job:
+                    job_stats.record(None, next_job.status, next_job.schedule_time)
+                await self.db.refresh(job)
+                return job
+            return None
 
     async def _process_job(self, job_data: dict):
         """
@@ -91,8 +194,9 @@ class JobWorkerService:
 
         job_id = job_data["id"]
         try:
-            result = await self.db.execute(select(Job).where(Job.id == job_id))
-            job = result.scalars().first()
+            async with self.db_lock:
+                result = await self.db.execute(select(Job).where(Job.id == job_id))
+                job = result.scalars().first()
 
             if not job:
                 self.failed_jobs.pop(job_id, None)
@@ -104,79 +208,79 @@ class JobWorkerService:
             if delay > 0:
                 await asyncio.sleep(delay)
 
+            started_at = time.perf_counter()
+            self.calling_jobs.add(job_id)
+
             # Update status to processing
-            job = await self._update_job_status(job.id, JobStatus.IN_PROGRESS.value)
-            await self._publish_status(
-                {
-                    "job_id": job.id,
-                    "status": "processing",
-                    "message": f"Processing Twilio Job {job.job_name}...",
-                    "job_details": {
-                        "id": job.id,
-                        "job_name": job.job_name,
-                        "status": job.status,
-                        "schedule_time": job.schedule_time.isoformat(),
-                    },
-                }
+            job = await self._update_job_status(
+                job.id,
+                JobStatus.IN_PROGRESS.value,
+                event=lambda job: self._job_status_message(
+                    job, "processing", f"Processing Twilio Job {job.job_name}..."
+                ),
             )
 
             # Simulate work - replace with actual job processing
             await asyncio.sleep(3)
 
             # Update status to completed
-            job = await self._update_job_status(job.id, JobStatus.COMPLETED.value)
-            await self._publish_status(
-                {
-                    "job_id": job.id,
-                    "status": "completed",
-                    "message": f"Twilio Job {job.job_name} completed successfully",
-                    "job_details": {
-                        "id": job.id,
-                        "job_name": job.job_name,
-                        "status": job.status,
-                        "schedule_time": job.schedule_time.isoformat(),
-                    },
-                }
+            job = await self._update_job_status(
+                job.id,
+                JobStatus.COMPLETED.value,
+                event=lambda job: self._job_status_message(
+                    job,
+                    "completed",
+                    f"Twilio Job {job.job_name} completed successfully",
+                ),
             )
 
             # Mark job as completed
+            JOBS_PROCESSED.labels(outcome="completed").inc()
+            JOB_RUN_SECONDS.observe(time.perf_counter() - started_at)
             self.completed_jobs.append(job_id)
             if job_id in self.failed_jobs:
                 del self.failed_jobs[job_id]
 
         except Exception as e:
+            async with self.db_lock:
+                await self.db.rollback()
             retry_count = self.failed_jobs.get(job_id, 0) + 1
+            failure_details = {
+                "id": job_id,
+                "status": "failed",
+                "retry_count": retry_count,
+            }
 
             if retry_count < 3:  # Max 3 retries
+                JOBS_PROCESSED.labels(outcome="retried").inc()
                 self.failed_jobs[job_id] = retry_count
-                await self.queue.enqueue(job_data)  # Requeue for retry
-                await self._publish_status(
-                    {
-                        "job_id": job_id,
-                        "status": "failed",
-                        "message": f"Twilio Job failed (attempt {retry_count}/3). Retrying...",
-                        "job_details": {
-                            "id": job_id,
+                async with self.db_lock:
+                    self.db.add(enqueue_event(job_data))  # Requeue for retry
+                    self._stage_status(
+                        {
+                            "job_id": job_id,
                             "status": "failed",
-                            "retry_count": retry_count,
-                        },
-                    }
-                )
+                            "message": f"Twilio Job failed (attempt {retry_count}/3). Retrying...",
+                            "retrying": True,
+                            "job_details": failure_details,
+                        }
+                    )
+                    await self.db.commit()
+                OutboxRelayService.notify()
             else:
-                await self._update_job_status(job_id, JobStatus.FAILED.value)
-                await self._publish_status(
-                    {
+                JOBS_PROCESSED.labels(outcome="failed").inc()
+                await self._update_job_status(
+                    job_id,
+                    JobStatus.FAILED.value,
+                    event=lambda job: {
                         "job_id": job_id,
                         "status": "failed",
                         "message": "Twilio Job failed after 3 attempts. Giving up.",
-                        "job_details": {
-                            "id": job_id,
-                            "status": "failed",
-                            "retry_count": retry_count,
-                        },
-                    }
+                        "job_details": failure_details,
+                    },
                 )
         finally:
+            self.calling_jobs.discard(job_id)
             if job_id in self.active_jobs:
                 del self.active_jobs[job_id]
 
@@ -195,26 +299,31 @@ class JobWorkerService:
         """
         Runs the job worker service, continuously processing jobs from the queue.
 
-        This function starts a monitoring task to handle stuck jobs and enters an
-        infinite loop to dequeue and process jobs asynchronously. Jobs are processed
-        in separate tasks and tracked in an active jobs dictionary. Completed jobs
-        are skipped. In case of cancellation, it handles graceful shutdown by
-        canceling active jobs and the monitoring task.
+        This function starts a monitoring task to handle stuck jobs and enters a
+        loop to dequeue and process jobs asynchronously until ``drain`` is
+        called. Jobs are processed in separate tasks and tracked in an active
+        jobs dictionary. Completed jobs are skipped. If the task is cancelled
+        instead, active jobs are cancelled and requeued immediately.
 
         Raises:
-            asyncio.CancelledError: If the task is cancelled, triggering shutdown.
             Exception: Propagates any unexpected errors during execution.
         """
 
         monitor_task = asyncio.create_task(self._monitor_active_jobs())
+        self._running = True
 
         try:
-            while True:
+            while not self.draining:
                 job_data = await self.queue.dequeue()
                 if not job_data:
-                    await asyncio.sleep(1)
+                    await self.queue.wait(1)
                     continue
 
+                if self.draining:
+                    # Dequeued while the drain started; hand it back
+                    self._undispatched.append(job_data)
+                    break
+
                 job_id = job_data["id"]
 
                 # Skip if already completed or being processed
@@ -226,26 +335,91 @@ class JobWorkerService:
                 self.active_jobs[job_id] = task
 
         except asyncio.CancelledError:
-            # Handle graceful shutdown
-            await self._cancel_active_jobs()
+            # Handle shutdown without a drain
+            await self._cancel_active_jobs(grace=0)
+        finally:
             monitor_task.cancel()
             try:
                 await monitor_task
             except asyncio.CancelledError:
                 pass
-        except Exception as e:
-            raise
+            self._running = False
+            self._stopped.set()
+
+    async def drain(self, timeout: float):
+        """
+        Gracefully stops the worker.
+
+        Stops dequeuing, cancels jobs that are still waiting for their
+        schedule time, and gives jobs whose call is in progress up to
+        ``timeout`` seconds to finish. Whatever is left is cancelled
+        concurrently and requeued. Shutdown therefore takes at most about
+        ``timeout`` seconds however many jobs are held.
+
+        Args:
+            timeout (float): Seconds to let in-progress calls finish.
+        """
 
-    async def _cancel_active_jobs(self):
-        """Cancel all active jobs and requeue them"""
-        for job_id, task in self.active_jobs.items():
-            if not task.done():
+        started_at = time.perf_counter()
+        self.draining = True
+        if self._running:
+            await self._stopped.wait()
+        requeued = await self._cancel_active_jobs(grace=timeout)
+        logger.info(
+            "Worker drained in %.2fs; %s jobs requeued",
+            time.perf_counter() - started_at,
+            requeued,
+        )
+
+    async def _cancel_active_jobs(self, grace: float) -> int:
+        """
+        Cancels all active jobs concurrently and requeues them.
+
+        Jobs waiting for their schedule time are cancelled at once; jobs in
+        the middle of a call get ``grace`` seconds to finish first. The
+        cancelled jobs that are not completed, together with any job that
+        was dequeued but never started, are requeued with one status query
+        (chunked for very large batches) and one queue push: due jobs onto
+        the ready queue, the rest back into the scheduled set.
+
+        Args:
+            grace (float): Seconds to let in-progress calls finish.
+
+        Returns:
+            int: The number of jobs requeued.
+        """
+
+        tasks = {job_id: task for job_id, task in self.active_jobs.items() if not task.done()}
+        calling = [task for job_id, task in tasks.items() if job_id in self.calling_jobs]
+        for job_id, task in tasks.items():
+            if job_id not in self.calling_jobs:
                 task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    # Requeue the job
-                    result = await self.db.execute(select(Job).where(Job.id == job_id))
-                    job = result.scalars().first()
-                    if job and job.status != JobStatus.COMPLETED.value:
-                        await self.queue.enqueue({"id": job_id})
+        if calling and grace > 0:
+            await asyncio.wait(calling, timeout=grace)
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        cancelled = [job_id for job_id, task in tasks.items() if task.cancelled()]
+        rows = []
+        # Cancellation may have interrupted the worker's session mid-query
+        async with AsyncSessionLocal() as db:
+            for start in range(0, len(cancelled), REQUEUE_QUERY_CHUNK):
+                result = await db.execute(
+                    select(Job.id, Job.schedule_time).where(
+                        Job.id.in_(cancelled[start : start + REQUEUE_QUERY_CHUNK]),
+                        Job.status != JobStatus.COMPLETED.value,
+                    )
+                )
+                rows.extend(result.all())
+
+        now = datetime.utcnow()
+        ready = [{"id": job_id} for job_id, schedule_time in rows if schedule_time <= now]
+        ready.extend(self._undispatched)
+        scheduled = [
+            ({"id": job_id}, schedule_time) for job_id, schedule_time in rows if schedule_time > now
+        ]
+        await self.queue.push_many(ready, scheduled)
+        self._undispatched = []
+        JOBS_REQUEUED.inc(len(ready) + len(scheduled))
+        return len(ready) + len(scheduled)
@@ -0,0 +1,269 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import ColumnElement, delete, inspect, or_, select, text, update
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal, engine
+from infrastructure.metrics import registry
+from infrastructure.queue.job_queue import JobQueue
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.domain.enums import OutboxTopic
+from src.domain.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_DISPATCHED = registry.counter(
+    "outbox_events_dispatched_total",
+    "Number of outbox events delivered to the queue and pub/sub.",
+)
+OUTBOX_BATCH_SECONDS = registry.histogram(
+    "outbox_batch_seconds", "Time spent delivering one outbox batch."
+)
+
+
+def schedule_event(job_data: Dict[str, Any], run_at: datetime) -> OutboxEvent:
+    """
+    Builds an outbox event that parks a job in the scheduled set.
+
+    Args:
+        job_data (Dict[str, Any]): The job data to be queued.
+        run_at (datetime): The time at which the job becomes due.
+
+    Returns:
+        OutboxEvent: The unsaved outbox event.
+    """
+    return OutboxEvent(
+        topic=OutboxTopic.SCHEDULE,
+        payload=json.dumps({"job": job_data, "run_at": run_at.isoformat()}),
+    )
+
+
+def enqueue_event(job_data: Dict[str, Any]) -> OutboxEvent:
+    """
+    Builds an outbox event that pushes a job onto the ready queue.
+
+    Args:
+        job_data (Dict[str, Any]): The job data to be queued.
+
+    Returns:
+        OutboxEvent: The unsaved outbox event.
+    """
+    return OutboxEvent(topic=OutboxTopic.ENQUEUE, payload=json.dumps(job_data))
+
+
+def publish_event(message: str) -> OutboxEvent:
+    """
+    Builds an outbox event that publishes a serialized pub/sub message.
+
+    Args:
+        message (str): The message as returned by
+            ``RedisPubSubService.serialize_message``.
+
+    Returns:
+        OutboxEvent: The unsaved outbox event.
+    """
+    return OutboxEvent(topic=OutboxTopic.PUBLISH, payload=message)
+
+
+class OutboxRelayService:
+    """
+    Delivers committed outbox events to the job queue and to pub/sub.
+
+    Every instance runs a relay. A relay claims a batch of events in one
+    UPDATE before dispatching them, so concurrent relays never push or
+    publish the same event. A claim expires after ``OUTBOX_CLAIM_SECONDS``,
+    so events claimed by a relay that died are picked up by another one.
+    Queue events and pub/sub events are claimed as separate batches, so
+    while one sink is down the other keeps draining.
+    """
+
+    _wakeup = asyncio.Event()
+
+    def __init__(self, queue: JobQueue, pubsub: RedisPubSubService):
+        self.queue = queue
+        self.pubsub = pubsub
+        self.batch_size = app_settings.OUTBOX_BATCH_SIZE
+        self.poll_interval = app_settings.OUTBOX_POLL_INTERVAL
+        self.claim_seconds = app_settings.OUTBOX_CLAIM_SECONDS
+
+    @classmethod
+    def notify(cls):
+        """
+        Wakes the relay after new outbox events were committed, so they are
+        dispatched without waiting for the next poll.
+        """
+        cls._wakeup.set()
+
+    async def ensure_columns(self):
+        """
+        Adds the claim columns to outbox tables created before they were
+        declared; ``create_all`` skips tables that already exist.
+        """
+        table = OutboxEvent.__table__
+        async with engine.begin() as conn:
+            existing = await conn.run_sync(
+                lambda sync_conn: {
+                    column["name"] for column in inspect(sync_conn).get_columns(table.name)
+                }
+            )
+            for column in (table.c.claimed_by, table.c.claimed_until):
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=conn.dialect)
+                    await conn.execute(
+                        text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+                    )
+
+    async def _claim(self, db, sink: ColumnElement) -> List[OutboxEvent]:
+        """
+        Claims the oldest unclaimed events of one sink for this relay.
+
+        The ids are picked and claimed in a single UPDATE, so two relays
+        never claim the same event.
+
+        Args:
+            sink (ColumnElement): A filter on ``OutboxEvent.topic`` selecting
+                the sink's events.
+
+        Returns:
+            List[OutboxEvent]: The claimed events, oldest first.
+        """
+        now = datetime.utcnow()
+        claim = uuid4().hex
+        claimable = or_(OutboxEvent.claimed_until.is_(None), OutboxEvent.claimed_until < now)
+        oldest = (
+            select(OutboxEvent.id)
+            .where(sink, claimable)
+            .order_by(OutboxEvent.id)
+            .limit(self.batch_size)
+            .scalar_subquery()
+        )
+        await db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(oldest), claimable)
+            .values(claimed_by=claim, claimed_until=now + timedelta(seconds=self.claim_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        result = await db.execute(
+            select(OutboxEvent).where(OutboxEvent.claimed_by == claim).order_by(OutboxEvent.id)
+        )
+        return list(result.scalars().all())
+
+    async def _dispatch(self, events: List[OutboxEvent]) -> List[int]:
+        """
+        Delivers a batch of outbox events.
+
+        Queue pushes go to the queue backend in one batch and status
+        messages to pub/sub in one pipeline; both are sent concurrently.
+        Each side succeeds or fails on its own, so a pub/sub outage does
+        not cause jobs to be pushed again on every retry.
+
+        Args:
+            events (List[OutboxEvent]): The events to dispatch, oldest first.
+
+        Returns:
+            List[int]: The ids of the events that were delivered.
+        """
+        ready: List[dict] = []
+        scheduled: List[Tuple[dict, datetime]] = []
+        messages: List[str] = []
+        queue_ids: List[int] = []
+        message_ids: List[int] = []
+        for event in events:
+            if event.topic == OutboxTopic.SCHEDULE:
+                payload = json.loads(event.payload)
+                scheduled.append((payload["job"], datetime.fromisoformat(payload["run_at"])))
+                queue_ids.append(event.id)
+            elif event.topic == OutboxTopic.ENQUEUE:
+                ready.append(json.loads(event.payload))
+                queue_ids.append(event.id)
+            elif event.topic == OutboxTopic.PUBLISH:
+                messages.append(event.payload)
+                message_ids.append(event.id)
+            else:
+                logger.warning("Dropping outbox event %s with unknown topic", event.id)
+                queue_ids.append(event.id)
+
+        results = await asyncio.gather(
+            self.queue.push_many(ready, scheduled),
+            self.pubsub.publish_many(messages),
+            return_exceptions=True,
+        )
+        delivered: List[int] = []
+        for name, ids, result in zip(("queue", "pub/sub"), (queue_ids, message_ids), results):
+            if isinstance(result, Exception):
+                logger.warning("Outbox delivery to %s failed: %s", name, str(result))
+            else:
+                delivered.extend(ids)
+        return delivered
+
+    async def drain_once(self) -> int:
+        """
+        Dispatches one batch of outbox events.
+
+        The oldest unclaimed queue events and the oldest unclaimed pub/sub
+        events are claimed, up to ``batch_size`` of each, dispatched together
+        and each deleted once delivered. Events whose delivery failed are
+        released and retried, so delivery is at-least-once.
+
+        Returns:
+            int: The number of events dispatched.
+
+        Raises:
+            RuntimeError: If events were claimed but none could be delivered.
+        """
+        async with AsyncSessionLocal() as db:
+            events = await self._claim(db, OutboxEvent.topic != OutboxTopic.PUBLISH)
+            events += await self._claim(db, OutboxEvent.topic == OutboxTopic.PUBLISH)
+            if not events:
+                return 0
+
+            with OUTBOX_BATCH_SECONDS.time():
+                delivered = await self._dispatch(events)
+
+            delivered_ids = set(delivered)
+            failed = [event.id for event in events if event.id not in delivered_ids]
+            if delivered:
+                await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(delivered)))
+            if failed:
+                await db.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_(failed))
+                    .values(claimed_by=None, claimed_until=None)
+                )
+            await db.commit()
+            if delivered:
+                OUTBOX_DISPATCHED.inc(len(delivered))
+            if failed and not delivered:
+                raise RuntimeError(f"{len(failed)} outbox events not delivered")
+            return len(delivered)
+
+    async def run(self):
+        """
+        Runs the relay loop until cancelled.
+
+        Full batches are drained back to back; otherwise the relay waits for
+        a ``notify`` call or the poll interval, whichever comes first.
+        """
+        await self.ensure_columns()
+        while True:
+            self._wakeup.clear()
+            try:
+                dispatched = await self.drain_once()
+            except Exception as e:
+                logger.exception("Outbox relay failed: %s", str(e))
+                await asyncio.sleep(1)
+                continue
+
+            if dispatched >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,57 @@
+import json
+import logging
+from datetime import datetime
+from typing import List, Set, Tuple
+
+from sqlalchemy import select
+
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.queue.memory_queue import InMemoryQueue
+from src.domain.enums import JobStatus, OutboxTopic
+from src.domain.models.job import Job
+from src.domain.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_memory_queue(queue: InMemoryQueue) -> int:
+    """
+    Rebuilds the in-process queue from the jobs table on startup.
+
+    The snapshot the queue restored may predate a crash: jobs accepted
+    after it would be lost and jobs finished after it would run again.
+    Every scheduled or interrupted job is queued exactly once, except jobs
+    whose queue push is still waiting in the outbox, which the relay
+    delivers. Must run before the relay and the worker start.
+
+    Args:
+        queue (InMemoryQueue): The queue to rebuild.
+
+    Returns:
+        int: The number of jobs that were missing from the queue.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(OutboxEvent.topic, OutboxEvent.payload).where(
+                OutboxEvent.topic.in_([OutboxTopic.SCHEDULE, OutboxTopic.ENQUEUE])
+            )
+        )
+        pending: Set[str] = set()
+        for topic, payload in result.all():
+            data = json.loads(payload)
+            pending.add(data["job"]["id"] if topic == OutboxTopic.SCHEDULE else data["id"])
+
+        result = await db.execute(
+            select(Job.id, Job.schedule_time).where(
+                Job.status.in_([JobStatus.SCHEDULED.value, JobStatus.IN_PROGRESS.value])
+            )
+        )
+        jobs: List[Tuple[dict, datetime]] = [
+            ({"id": job_id}, schedule_time)
+            for job_id, schedule_time in result.all()
+            if job_id not in pending
+        ]
+
+    added = queue.reconcile(jobs)
+    logger.info("Rebuilt the job queue with %s jobs, %s missing from it", len(jobs), added)
+    return added
@@ -0,0 +1,119 @@
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.outbox_relay import schedule_event
+from src.domain.cron import parse_cron
+from src.domain.enums import FINISHED_STATUSES, JobStatus
+from src.domain.models.job import Job
+from src.domain.models.recurring_job import RecurringJob
+
+logger = logging.getLogger(__name__)
+
+
+def occurrence_id(recurring_id: str, run_at: datetime) -> str:
+    """
+    Returns the id of the job for one occurrence of a recurring job.
+
+    The id is derived from the fire time, so an occurrence can only be
+    created once.
+
+    Args:
+        recurring_id (str): The ID of the recurring job.
+        run_at (datetime): The fire time of the occurrence.
+
+    Returns:
+        str: The job ID.
+    """
+    return f"{recurring_id}@{run_at:%Y%m%dT%H%M}"
+
+
+def recurrence_of(job_id: str) -> Optional[str]:
+    """
+    Returns the recurring job a job is an occurrence of.
+
+    Args:
+        job_id (str): The ID of the job.
+
+    Returns:
+        Optional[str]: The ID of the recurring job, or None for a one-off job.
+    """
+    recurring_id, separator, _ = job_id.partition("@")
+    return recurring_id if separator else None
+
+
+def stage_occurrence(db: AsyncSession, recurring: RecurringJob, run_at: datetime) -> Job:
+    """
+    Adds the job for the next occurrence of a recurring job, and the outbox
+    event that schedules it, to the current transaction.
+
+    Args:
+        db (AsyncSession): The session to add the job to.
+        recurring (RecurringJob): The recurring job.
+        run_at (datetime): The fire time of the occurrence.
+
+    Returns:
+        Job: The unsaved job.
+    """
+    now = datetime.utcnow()
+    job = Job(
+        id=occurrence_id(recurring.id, run_at),
+        job_name=recurring.job_name,
+        phone_number=recurring.phone_number,
+        status=JobStatus.SCHEDULED.value,
+        schedule_time=run_at,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(job)
+    db.add(
+        schedule_event(
+            {
+                "id": job.id,
+                "job_name": job.job_name,
+                "schedule_time": job.schedule_time.isoformat(),
+            },
+            run_at=job.schedule_time,
+        )
+    )
+    recurring.next_run_at = run_at
+    return job
+
+
+async def schedule_next_occurrence(
+    db: AsyncSession, job: Job, old_status: Any, new_status: Any
+) -> Optional[Job]:
+    """
+    Creates the next occurrence of a recurring job once the current one has
+    finished, in the caller's transaction.
+
+    Fire times missed while the occurrence ran, or while the service was
+    down, are skipped: the next occurrence is the first fire time after both
+    the finished occurrence and the current time.
+
+    Args:
+        db (AsyncSession): The session the job status is committed in.
+        job (Job): The job that changed status.
+        old_status (Any): The job's previous status.
+        new_status (Any): The job's new status.
+
+    Returns:
+        Optional[Job]: The job for the next occurrence, or None if ``job`` is
+        not a finished occurrence of an active recurring job.
+    """
+    recurring_id = recurrence_of(job.id)
+    old_status = old_status.value if hasattr(old_status, "value") else old_status
+    new_status = new_status.value if hasattr(new_status, "value") else new_status
+    if recurring_id is None or new_status not in FINISHED_STATUSES or old_status in FINISHED_STATUSES:
+        return None
+
+    recurring = await db.get(RecurringJob, recurring_id)
+    if recurring is None or not recurring.active:
+        return None
+
+    run_at = parse_cron(recurring.cron).next_after(max(job.schedule_time, datetime.utcnow()))
+    if await db.get(Job, occurrence_id(recurring.id, run_at)) is not None:
+        return None
+    return stage_occurrence(db, recurring, run_at)
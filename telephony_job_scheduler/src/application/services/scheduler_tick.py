@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from config.settings import app_settings
+from infrastructure.metrics import registry
+from infrastructure.redis.redis_lease import RedisLease
+from infrastructure.redis.redis_queue import RedisQueue
+
+logger = logging.getLogger(__name__)
+
+JOBS_PROMOTED = registry.counter(
+    "scheduler_jobs_promoted_total", "Number of due jobs promoted to the ready queue."
+)
+SCHEDULER_TICK_SECONDS = registry.histogram(
+    "scheduler_tick_seconds", "Time spent in a leader scheduler tick."
+)
+
+
+class SchedulerTickService:
+    def __init__(self, queue: RedisQueue, lease: RedisLease | None = None):
+        self.queue = queue
+        self.lease = lease or RedisLease(
+            queue.redis,
+            name=f"{queue.queue_name}:scheduler_leader",
+            ttl_ms=app_settings.SCHEDULER_LEASE_TTL_MS,
+        )
+        self.interval = app_settings.SCHEDULER_TICK_INTERVAL
+        self.batch_size = app_settings.SCHEDULER_BATCH_SIZE
+        self.is_leader = False
+
+    async def tick(self) -> int:
+        """
+        Runs a single scheduler tick.
+
+        Acquires or renews the leader lease and, if this instance is the
+        leader, promotes every due job from the scheduled set onto the ready
+        queue in batches. Followers do nothing but contend for the lease, so
+        only one instance touches the scheduled set per tick.
+
+        Returns:
+            int: The number of jobs promoted during this tick.
+        """
+
+        leader = await self.lease.acquire()
+        if leader != self.is_leader:
+            logger.info(
+                "Scheduler tick %s leadership (lease=%s)",
+                "acquired" if leader else "lost",
+                self.lease.token,
+            )
+            self.is_leader = leader
+        if not leader:
+            return 0
+
+        now = datetime.utcnow()
+        total = 0
+        with SCHEDULER_TICK_SECONDS.time():
+            while True:
+                promoted = await self.queue.promote_due(now, self.batch_size)
+                total += promoted
+                if promoted < self.batch_size:
+                    break
+        JOBS_PROMOTED.inc(total)
+
+        if total:
+            logger.info("Promoted %s due jobs", total)
+        return total
+
+    async def run(self):
+        """
+        Runs the scheduler tick loop until cancelled.
+
+        Errors in a single tick are logged and retried on the next tick. On
+        cancellation the lease is released so a follower can take over
+        without waiting for it to expire.
+
+        Raises:
+            asyncio.CancelledError: If the task is cancelled.
+        """
+
+        try:
+            while True:
+                try:
+                    await self.tick()
+                except Exception as e:
+                    logger.exception("Scheduler tick failed: %s", str(e))
+                    self.is_leader = False
+                await asyncio.sleep(self.interval)
+        finally:
+            if self.is_leader:
+                try:
+                    await self.lease.release()
+                except Exception as e:
+                    logger.warning("Failed to release scheduler lease: %s", str(e))
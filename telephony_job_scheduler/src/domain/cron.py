@@ -0,0 +1,185 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"),
+        start=1,
+    )
+}
+DAY_NAMES = {
+    name: number
+    for number, name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"))
+}
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# Long enough for expressions that only fire on 29 February
+MAX_SEARCH_YEARS = 10
+
+
+def _parse_field(
+    text: str, low: int, high: int, names: Optional[Dict[str, int]] = None
+) -> Tuple[int, ...]:
+    def value(token: str) -> int:
+        if names and token.upper() in names:
+            return names[token.upper()]
+        if not token.isdigit():
+            raise ValueError(f"invalid value {token!r}")
+        return int(token)
+
+    values = set()
+    for part in text.split(","):
+        expression, slash, step_text = part.partition("/")
+        step = int(step_text) if step_text.isdigit() else 0
+        if slash and step < 1:
+            raise ValueError(f"invalid step in {part!r}")
+        if expression == "*":
+            start, end = low, high
+        elif "-" in expression:
+            first, last = expression.split("-", 1)
+            start, end = value(first), value(last)
+        else:
+            start = value(expression)
+            end = high if slash else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"{part!r} is outside {low}-{high}")
+        values.update(range(start, end + 1, step or 1))
+    return tuple(sorted(values))
+
+
+class CronExpression:
+    """
+    A standard five-field cron expression: minute, hour, day of month, month
+    and day of week.
+
+    Fields accept ``*``, values, ranges, lists and steps (``*/15``,
+    ``1-5``, ``0,30``), month and weekday names, and the ``@hourly`` style
+    macros. As in cron, when both day fields are restricted a day matching
+    either one fires. Times are naive UTC.
+
+    The allowed values of each field are computed once, so ``next_after``
+    jumps straight to the next allowed month, hour and minute instead of
+    testing every minute.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression {expression!r} must have five fields")
+        try:
+            self.minutes = _parse_field(fields[0], 0, 59)
+            self.hours = _parse_field(fields[1], 0, 23)
+            self.days = _parse_field(fields[2], 1, 31)
+            self.months = _parse_field(fields[3], 1, 12, MONTH_NAMES)
+            weekdays = _parse_field(fields[4], 0, 7, DAY_NAMES)
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression {expression!r}: {e}") from None
+        # Both 0 and 7 mean Sunday
+        self.weekdays = tuple(sorted({day % 7 for day in weekdays}))
+        self._day_set = frozenset(self.days)
+        self._weekday_set = frozenset(self.weekdays)
+        # A day fires if it matches both day fields, or either one when
+        # neither is a wildcard
+        self._either_day = not fields[2].startswith("*") and not fields[4].startswith("*")
+
+    def __repr__(self):
+        return f"<CronExpression({self.expression!r})>"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_month = moment.day in self._day_set
+        in_week = (moment.weekday() + 1) % 7 in self._weekday_set
+        return in_month or in_week if self._either_day else in_month and in_week
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Returns the first time the expression fires strictly after ``after``.
+
+        Args:
+            after (datetime): The time to search from; an aware datetime is
+                converted to naive UTC.
+
+        Returns:
+            datetime: The next fire time, as naive UTC with whole minutes.
+
+        Raises:
+            ValueError: If the expression does not fire within
+                ``MAX_SEARCH_YEARS`` years, e.g. ``0 0 30 2 *``.
+        """
+        if after.tzinfo is not None:
+            after = after.astimezone(timezone.utc).replace(tzinfo=None)
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        last_year = moment.year + MAX_SEARCH_YEARS
+
+        while moment.year <= last_year:
+            if moment.month not in self.months:
+                index = bisect_right(self.months, moment.month)
+                if index < len(self.months):
+                    moment = datetime(moment.year, self.months[index], 1)
+                else:
+                    moment = datetime(moment.year + 1, self.months[0], 1)
+                continue
+
+            if not self._day_matches(moment):
+                moment = datetime(moment.year, moment.month, moment.day) + timedelta(days=1)
+                continue
+
+            if moment.hour not in self.hours:
+                index = bisect_right(self.hours, moment.hour)
+                if index < len(self.hours):
+                    moment = moment.replace(hour=self.hours[index], minute=0)
+                else:
+                    moment = datetime(moment.year, moment.month, moment.day) + timedelta(days=1)
+                continue
+
+            if moment.minute not in self.minutes:
+                index = bisect_right(self.minutes, moment.minute)
+                if index < len(self.minutes):
+                    moment = moment.replace(minute=self.minutes[index])
+                else:
+                    moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return moment
+
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
+
+    def at_or_after(self, start: datetime) -> datetime:
+        """
+        Returns the first time the expression fires at or after ``start``.
+
+        Args:
+            start (datetime): The earliest acceptable fire time.
+
+        Returns:
+            datetime: The fire time, as naive UTC with whole minutes.
+        """
+        return self.next_after(start - timedelta(microseconds=1))
+
+
+@lru_cache(maxsize=1024)
+def parse_cron(expression: str) -> CronExpression:
+    """
+    Parses a cron expression, reusing earlier parses of the same text.
+
+    Args:
+        expression (str): The cron expression.
+
+    Returns:
+        CronExpression: The parsed expression.
+
+    Raises:
+        ValueError: If the expression is invalid.
+    """
+    return CronExpression(expression)
@@ -7,3 +7,18 @@ class JobStatus(Enum):
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
     CANCELLED = "CANCELLED"
+
+
+# Statuses a job never leaves, as stored in ``Job.status``
+FINISHED_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+
+
+class OutboxTopic(Enum):
+    SCHEDULE = "SCHEDULE"
+    ENQUEUE = "ENQUEUE"
+    PUBLISH = "PUBLISH"
+
+
+class CampaignStatus(Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, Integer, String
+
+from infrastructure.database.db import Base
+from src.domain.enums import CampaignStatus
+
+
+class Campaign(Base):
+    """
+    Job settings shared by every number of an uploaded call list.
+
+    The numbers themselves are kept in a file under ``CAMPAIGN_STORAGE_DIR``;
+    ``cursor`` is the byte offset of the first number not yet turned into a
+    job, and ``dispatched`` the number of jobs created so far.
+    """
+
+    __tablename__ = "campaigns"
+
+    id = Column(String, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    status = Column(
+        Enum(CampaignStatus), nullable=False, default=CampaignStatus.RUNNING.value
+    )
+    schedule_time = Column(DateTime, nullable=False)
+    total = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+    cursor = Column(Integer, nullable=False, default=0)
+    dispatched = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Campaign(id={self.id}, name={self.name}, status={self.status})>"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, String
+from sqlalchemy import Column, DateTime, Enum, Index, String
 
 from infrastructure.database.db import Base
 from src.domain.enums import JobStatus
@@ -17,6 +17,9 @@ class Job(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Lets the archiver find finished jobs without scanning the table
+    __table_args__ = (Index("ix_jobs_status_updated_at", "status", "updated_at"),)
+
     def __repr__(self):
         return f"<Job(id={self.id}, job_name={self.job_name}, status={self.status})>"
 
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Enum, Integer, String
+
+from infrastructure.database.db import Base
+from src.domain.enums import JobStatus
+
+
+class JobArchiveCount(Base):
+    """Number of archived jobs per hour of ``schedule_time`` and status."""
+
+    __tablename__ = "job_archive_counts"
+
+    hour = Column(String, primary_key=True)
+    status = Column(Enum(JobStatus), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<JobArchiveCount(hour={self.hour}, status={self.status}, count={self.count})>"
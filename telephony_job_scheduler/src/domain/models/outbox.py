@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, Integer, String, Text
+
+from infrastructure.database.db import Base
+from src.domain.enums import OutboxTopic
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    topic = Column(Enum(OutboxTopic), nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Set by the relay that is dispatching the event; other relays skip it
+    # until the claim expires
+    claimed_by = Column(String, nullable=True)
+    claimed_until = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, topic={self.topic})>"
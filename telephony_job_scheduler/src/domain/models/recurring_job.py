@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, String
+
+from infrastructure.database.db import Base
+
+
+class RecurringJob(Base):
+    """
+    A job that runs on a cron schedule.
+
+    Only the next occurrence exists as a row in ``jobs``; the one after it
+    is created when that occurrence finishes.
+    """
+
+    __tablename__ = "recurring_jobs"
+
+    id = Column(String, primary_key=True, index=True)
+    job_name = Column(String, nullable=False)
+    phone_number = Column(String, nullable=False)
+    cron = Column(String, nullable=False)
+    active = Column(Boolean, nullable=False, default=True)
+    next_run_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<RecurringJob(id={self.id}, job_name={self.job_name}, cron={self.cron})>"
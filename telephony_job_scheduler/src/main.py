@@ -1,18 +1,32 @@
 import asyncio
 import logging
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.logging import setup_logging
 from config.settings import app_settings
 from infrastructure.database.db import Base, engine, get_db
-from infrastructure.redis.redis_queue import RedisQueue
+from infrastructure.loop_monitor import loop_monitor
+from infrastructure.metrics import CONTENT_TYPE_LATEST, registry
+from infrastructure.queue.factory import get_queue
 from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.services.campaign_service import CampaignDispatcherService
+from src.application.services.health_service import readiness_report
+from src.application.services.job_archiver import JobArchiverService
 from src.application.services.job_scheduler import JobSchedulerService
+from src.application.services.job_state_cache import job_state_cache
+from src.application.services.job_stats import job_stats
 from src.application.services.job_worker import JobWorkerService
-from src.routers import jobs, websocket
+from src.application.services.outbox_relay import OutboxRelayService
+from src.application.services.queue_recovery import rebuild_memory_queue
+from src.application.services.scheduler_tick import SchedulerTickService
+from src.dependencies.admin import require_admin_token
+from src.middleware.admission_middleware import AdmissionControlMiddleware, AdmissionController
+from src.middleware.request_middleware import RequestLoggerMiddleware
+from src.routers import campaigns, jobs, websocket
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -26,6 +40,35 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+# The background job worker, drained on shutdown
+job_worker: JobWorkerService | None = None
+# The pub/sub service, created on startup
+redis_pubsub: RedisPubSubService | None = None
+registry.gauge(
+    "worker_active_jobs",
+    "Number of jobs currently held by the worker.",
+    lambda: len(job_worker.active_jobs) if job_worker else 0,
+)
+
+admission = AdmissionController(
+    max_in_flight=app_settings.ADMISSION_MAX_IN_FLIGHT,
+    max_latency_ms=app_settings.ADMISSION_MAX_LATENCY_MS,
+    max_loop_lag_ms=app_settings.ADMISSION_MAX_LOOP_LAG_MS,
+    loop_monitor=loop_monitor,
+    retry_after_seconds=app_settings.ADMISSION_RETRY_AFTER_SECONDS,
+)
+registry.gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being handled.",
+    lambda: admission.in_flight,
+)
+
+# Add request logging middleware
+app.add_middleware(RequestLoggerMiddleware)
+
+# Shed requests with 503 under overload, before they are logged or routed
+app.add_middleware(AdmissionControlMiddleware, controller=admission)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -34,6 +77,7 @@ app.add_middleware(
 )
 
 app.include_router(jobs.router)
+app.include_router(campaigns.router)
 app.include_router(websocket.router)
 
 
@@ -46,29 +90,135 @@ async def startup_event():
     Performs the following tasks:
 
     1. Creates all database tables.
-    2. Starts the Redis listener.
-    3. Starts the job worker.
+    2. Starts the Redis listener and loads the job state cache that gives
+       new WebSocket clients a snapshot.
+    3. Starts the job queue selected by ``QUEUE_BACKEND``. The in-process
+       queue is rebuilt from the jobs table.
+    4. Starts the outbox relay that delivers committed events to the queue
+       and Redis.
+    5. Starts the scheduler tick that promotes due jobs (Redis backend only;
+       the in-process queue promotes due jobs itself).
+    6. Starts the job worker.
+    7. Loads job statistics and starts publishing and reconciling them.
+    8. Starts archiving finished jobs, unless ``JOB_ARCHIVE_AFTER_SECONDS``
+       is 0.
+    9. Starts expanding running campaigns into jobs.
+    10. Starts the event-loop lag monitor used by admission control.
     """
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Start Redis listener
-    redis_pubsub = RedisPubSubService()
+    # Start Redis listener, then load the job state it keeps up to date
+    global redis_pubsub
+    redis_pubsub = RedisPubSubService(listeners=[job_state_cache.apply])
     asyncio.create_task(redis_pubsub.redis_listener())
+    await job_state_cache.warm()
+
+    # Start the job queue and expose its depth on /metrics
+    queue = get_queue()
+    await queue.start()
+    if app_settings.QUEUE_BACKEND == "memory":
+        await rebuild_memory_queue(queue)
+    registry.gauge(
+        "job_queue_ready_depth",
+        "Number of due jobs waiting on the ready queue.",
+        queue.ready_depth,
+    )
+    registry.gauge(
+        "job_queue_scheduled_depth",
+        "Number of jobs parked until their schedule time.",
+        queue.scheduled_depth,
+    )
+
+    # Start outbox relay
+    outbox_relay = OutboxRelayService(queue, redis_pubsub)
+    asyncio.create_task(outbox_relay.run())
+
+    # Start scheduler tick (only the lease holder promotes due jobs)
+    if app_settings.QUEUE_BACKEND == "redis":
+        scheduler_tick = SchedulerTickService(queue)
+        asyncio.create_task(scheduler_tick.run())
 
     # Start job worker
     async def run_worker():
-        queue = RedisQueue()
+        global job_worker
         async for db in get_db():
-            worker = JobWorkerService(db, queue)
-            await worker.run()
+            job_worker = JobWorkerService(db, queue)
+            await job_worker.run()
 
     asyncio.create_task(run_worker())
 
+    # Start job statistics
+    await job_stats.reconcile()
+    asyncio.create_task(job_stats.run())
+
+    # Start archiving finished jobs
+    if app_settings.JOB_ARCHIVE_AFTER_SECONDS:
+        job_archiver = JobArchiverService()
+        asyncio.create_task(job_archiver.run())
+
+    # Start expanding campaigns into jobs
+    campaign_dispatcher = CampaignDispatcherService(redis_pubsub)
+    asyncio.create_task(campaign_dispatcher.run())
+
+    loop_monitor.start()
+
+
+@app.get("/health")
+async def health_check():
+    """
+    Liveness check: the process is up and serving requests.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Report whether this instance should receive traffic.
+
+    Includes in-flight requests, queue depth, event-loop lag, request
+    latency and the status of Redis and the database. Responds with 503 when
+    a dependency is down or admission control is shedding load.
+    """
+    ready, report = await readiness_report(admission, redis_pubsub)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=report,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Expose process metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(await registry.render(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/admin/loop", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def loop_report(limit: int = Query(10, ge=1, le=100)):
+    """
+    Report event-loop lag percentiles and the code that blocked the loop
+    for longest, with the stack of each offender's longest stall. Only
+    available with ``ADMIN_TOKEN`` set, to requests that send it.
+    """
+    return loop_monitor.report(limit)
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    """
+    Called on application shutdown.
+
+    Drains the job worker within ``WORKER_DRAIN_TIMEOUT`` seconds, requeueing
+    unfinished jobs, before the queue is closed.
+    """
+    if job_worker is not None:
+        await job_worker.drain(app_settings.WORKER_DRAIN_TIMEOUT)
+    await loop_monitor.stop()
+    await get_queue().close()
     logger.info("Application shutdown.")
 
 
@@ -78,8 +228,8 @@ async def get_job_scheduler_service(db: AsyncSession = Depends(get_db)):
     Dependency to get an instance of JobSchedulerService.
 
     This dependency will be used in path operations that require an instance of JobSchedulerService.
-    It creates a RedisQueue instance and returns an instance of JobSchedulerService with the current database session
-    and the RedisQueue instance.
+    It returns an instance of JobSchedulerService with the current database session
+    and the job queue selected by ``QUEUE_BACKEND``.
 
     Args:
         db (AsyncSession): The current database session. Defaults to Depends(get_db).
@@ -87,11 +237,17 @@ async def get_job_scheduler_service(db: AsyncSession = Depends(get_db)):
     Returns:
         JobSchedulerService: An instance of JobSchedulerService.
     """
-    queue = RedisQueue()
-    return JobSchedulerService(db, queue)
+    return JobSchedulerService(db, get_queue())
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        ws_ping_interval=app_settings.WS_PING_INTERVAL or None,
+        ws_ping_timeout=app_settings.WS_PING_TIMEOUT or None,
+        ws_per_message_deflate=app_settings.WS_PER_MESSAGE_DEFLATE,
+    )
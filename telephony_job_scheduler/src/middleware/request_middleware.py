@@ -0,0 +1,73 @@
+import time
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "Time spent handling HTTP requests."
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "Number of HTTP requests handled.", ("method", "status")
+)
+
+
+class RequestLoggerMiddleware:
+    """
+    Pure ASGI middleware that writes one access-log record per HTTP request.
+
+    The status code is captured from the ``http.response.start`` message, so
+    the response body is streamed through untouched and no extra task is
+    spawned per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """
+        Log request and response details including method, URL path, status code,
+        and duration of request processing.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_time
+            HTTP_REQUEST_SECONDS.observe(elapsed_ns / 1_000_000_000)
+            HTTP_REQUESTS.labels(method=scope["method"], status=status_code).inc()
+            if logger.isEnabledFor(logging.INFO):
+                duration_ms = elapsed_ns / 1_000_000
+                logger.info(
+                    "%s %s - %s - %.2fms",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration_ms,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round(duration_ms, 3),
+                    },
+                )
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from config.response_handler import ResponseHandler
+from infrastructure.database.db import get_db
+from src.application.dto.campaign_dto import CampaignResponseDTO
+from src.application.services.campaign_service import CampaignService, upload_format
+
+router = APIRouter(prefix="/campaigns", tags=["campaigns"])
+
+
+@router.post("", response_model=CampaignResponseDTO, status_code=status.HTTP_201_CREATED)
+async def create_campaign(
+    request: Request,
+    name: str = Query(..., example="Twilio Campaign"),
+    schedule_time: datetime = Query(..., example="2025-05-20 12:00"),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a campaign that calls every phone number in the request body.
+
+    The body is a CSV file (a ``phone_number`` column, or numbers in the first
+    column) or, with ``Content-Type: application/x-ndjson``, one JSON object
+    with a ``phone_number`` field per line. It is streamed to disk as it
+    arrives, and the campaign's jobs are created gradually as earlier ones
+    finish.
+
+    Args:
+        name (str): The job name shared by the campaign's jobs.
+        schedule_time (datetime): The time the campaign's calls start.
+
+    Returns:
+        CampaignResponseDTO: The created campaign, with the number of
+            accepted (``total``) and rejected lines.
+
+    Raises:
+        HTTPException: If ``schedule_time`` is not in the future, the upload
+            contains no valid phone number, or the campaign cannot be stored.
+    """
+    if schedule_time <= datetime.utcnow():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="schedule_time must be in the future",
+        )
+
+    service = CampaignService(db)
+    campaign = await service.create_campaign(
+        name,
+        schedule_time,
+        request.stream(),
+        upload_format(request.headers.get("content-type", "")),
+    )
+    return ResponseHandler.success(data=campaign)
+
+
+@router.get("/{campaign_id}", response_model=CampaignResponseDTO)
+async def get_campaign(campaign_id: str, db: Session = Depends(get_db)):
+    """
+    Return a campaign and its progress.
+
+    Args:
+        campaign_id (str): The ID of the campaign.
+
+    Returns:
+        CampaignResponseDTO: The campaign, with the number of jobs created,
+            completed and failed so far.
+
+    Raises:
+        HTTPException: If there is no such campaign.
+    """
+    service = CampaignService(db)
+    return ResponseHandler.success(data=await service.get_campaign(campaign_id))
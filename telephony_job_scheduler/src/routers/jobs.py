@@ -5,9 +5,14 @@ from sqlalchemy.orm import Session
 
 from config.response_handler import ResponseHandler
 from infrastructure.database.db import get_db
-from infrastructure.redis.redis_queue import RedisQueue
-from src.application.dto.job_dto import CreateJobRequestDTO, JobResponseDTO
+from infrastructure.queue.factory import get_queue
+from src.application.dto.job_dto import (
+    CreateJobRequestDTO,
+    JobResponseDTO,
+    JobStatsResponseDTO,
+)
 from src.application.services.job_scheduler import JobSchedulerService
+from src.application.services.job_stats import job_stats
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -21,9 +26,13 @@ async def schedule_job(
     Schedule a new job by storing it in the database, publishing its initial status,
     and adding it to the processing queue.
 
+    With ``cron`` set, the job recurs: only its next occurrence is queued, and
+    the one after it is scheduled when it finishes. ``schedule_time`` is then
+    optional and delays the first occurrence.
+
     Args:
         job_request (CreateJobRequestDTO): The data required to create a new job,
-            including job name, phone number, and schedule time.
+            including job name, phone number, and schedule time or cron expression.
 
     Returns:
         JobResponseDTO: A data transfer object containing the details of the scheduled job.
@@ -33,14 +42,48 @@ async def schedule_job(
             the transaction is rolled back and the exception is raised.
     """
     # Validate schedule_time is in the future
-    if job_request.schedule_time <= datetime.utcnow():
+    if job_request.schedule_time is not None and job_request.schedule_time <= datetime.utcnow():
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="schedule_time must be in the future",
         )
 
-    queue = RedisQueue()
-    service = JobSchedulerService(db, queue)
+    service = JobSchedulerService(db, get_queue())
     job_response = await service.schedule_job(job_request)
     return ResponseHandler.success(data=job_response)
+
+
+@router.get("/stats", response_model=JobStatsResponseDTO)
+async def get_job_stats():
+    """
+    Return live counts of jobs by status and by hour of ``schedule_time``.
+
+    The counts are kept in memory as jobs change status and reconciled with
+    the ``jobs`` table every ``JOB_STATS_RECONCILE_INTERVAL`` seconds, so the
+    database is not queried.
+
+    Returns:
+        JobStatsResponseDTO: The total, counts by status and by hour, the
+            stats version and the time of the last reconciliation.
+    """
+    return ResponseHandler.success(data=JobStatsResponseDTO(**job_stats.snapshot()))
+
+
+@router.delete("/recurring/{recurring_id}")
+async def stop_recurring_job(recurring_id: str, db: Session = Depends(get_db)):
+    """
+    Stop a recurring job from scheduling further occurrences.
+
+    An occurrence that is already scheduled still runs.
+
+    Args:
+        recurring_id (str): The ID returned as ``recurring_job_id`` when the
+            job was scheduled.
+
+    Raises:
+        HTTPException: If there is no such recurring job.
+    """
+    service = JobSchedulerService(db, get_queue())
+    await service.stop_recurring_job(recurring_id)
+    return ResponseHandler.success(message="Recurring job stopped")
@@ -1,6 +1,14 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import asyncio
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
 
 from infrastructure.websockets.connection_manager import ConnectionManager
+from src.application.services.job_state_cache import job_state_cache
+from src.application.services.job_stats import job_stats
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
 connection_manager = ConnectionManager()
@@ -17,6 +25,17 @@ async def websocket_endpoint(websocket: WebSocket):
     remains open to continuously listen for incoming messages, and is closed
     when a WebSocket disconnection event occurs.
 
+    The client first receives ``{"snapshot": {"fields": [...], "jobs":
+    [[...], ...]}}`` with the current state of live and recently finished
+    jobs, served from memory, then the live ``job_status`` messages. An
+    event may appear in both, so clients should apply updates idempotently.
+
+    The server pings the client every ``WS_PING_INTERVAL`` seconds at the
+    protocol level. Clients that cannot see protocol pings may send the text
+    ``ping`` and receive ``pong``; any message resets the
+    ``WS_IDLE_TIMEOUT`` idle timer. Connections beyond
+    ``WS_MAX_CONNECTIONS`` are closed with code 1013.
+
     Args:
         websocket (WebSocket): The WebSocket connection instance for the client.
 
@@ -26,9 +45,74 @@ async def websocket_endpoint(websocket: WebSocket):
     """
 
     user_id = "public"
-    await connection_manager.connect(websocket, user_id)
+    if not await connection_manager.connect(
+        websocket,
+        user_id,
+        initial=job_state_cache.snapshot_message,
+        initial_version=lambda: job_state_cache.version,
+    ):
+        return
     try:
         while True:
-            await websocket.receive_text()
+            message = await websocket.receive_text()
+            connection_manager.touch(websocket)
+            if message == "ping":
+                connection_manager.send(websocket, "pong")
     except WebSocketDisconnect:
+        pass
+    finally:
         await connection_manager.disconnect(websocket, user_id)
+
+
+async def _send_job_stats(websocket: WebSocket):
+    try:
+        snapshot = job_stats.snapshot()
+        await websocket.send_json(jsonable_encoder({"snapshot": snapshot}))
+        version = snapshot["version"]
+        while True:
+            latest, delta = await job_stats.wait_for_delta()
+            if latest == version + 1:
+                await websocket.send_json({"delta": {"version": latest, **delta}})
+            else:
+                snapshot = job_stats.snapshot()
+                latest = snapshot["version"]
+                await websocket.send_json(jsonable_encoder({"snapshot": snapshot}))
+            version = latest
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        # Close the socket so the receiving endpoint returns and frees its slot
+        logger.warning("Sending job stats failed: %s", str(e))
+        try:
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        except Exception:
+            pass
+
+
+@router.websocket("/ws/jobs/stats")
+async def job_stats_stream(websocket: WebSocket):
+    """
+    Streams job statistics.
+
+    The client first receives ``{"snapshot": ...}`` with the same content as
+    ``GET /jobs/stats``, then ``{"delta": {"version": ..., "by_status": ...,
+    "by_hour": ...}}`` with the change in counts each time the stats are
+    published (at most every ``JOB_STATS_STREAM_INTERVAL`` seconds). A
+    client that falls behind by more than one version is sent a fresh
+    snapshot instead of a delta.
+
+    Args:
+        websocket (WebSocket): The WebSocket connection instance for the client.
+    """
+
+    if not await connection_manager.accept(websocket):
+        return
+    sender = asyncio.create_task(_send_job_stats(websocket))
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        connection_manager.release()
@@ -0,0 +1,24 @@
+import asyncio
+import os
+import tempfile
+
+# Settings are read on import, so point the app at a scratch database first
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/jobs.db"
+os.environ["QUEUE_BACKEND"] = "memory"
+
+import pytest  # noqa: E402
+
+from infrastructure.database.db import Base, engine  # noqa: E402
+from src.domain.models import campaign, job, job_archive, outbox, recurring_job  # noqa: E402,F401
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Give every test empty tables."""
+
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(reset())
@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+from config.settings import app_settings
+from src.main import app
+
+
+def test_loop_report_is_off_without_an_admin_token(monkeypatch):
+    """Test /admin/loop does not exist while ADMIN_TOKEN is unset."""
+    monkeypatch.setattr(app_settings, "ADMIN_TOKEN", "")
+    response = TestClient(app).get("/admin/loop", headers={"Authorization": "Bearer "})
+    assert response.status_code == 404
+
+
+def test_loop_report_requires_the_admin_token(monkeypatch):
+    """Test /admin/loop reports lag percentiles only to callers sending ADMIN_TOKEN."""
+    monkeypatch.setattr(app_settings, "ADMIN_TOKEN", "secret")
+    client = TestClient(app)
+    missing = client.get("/admin/loop")
+    wrong = client.get("/admin/loop", headers={"Authorization": "Bearer guess"})
+    response = client.get("/admin/loop?limit=5", headers={"Authorization": "Bearer secret"})
+
+    assert missing.status_code == wrong.status_code == 401
+    assert response.status_code == 200
+    assert set(response.json()["lag_ms"]) >= {"p50", "p90", "p99", "max"}
@@ -0,0 +1,325 @@
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from config.settings import app_settings
+from infrastructure.database.db import AsyncSessionLocal, engine
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.services import campaign_service
+from src.application.services.campaign_service import (
+    MAX_LINE_BYTES,
+    CampaignDispatcherService,
+    CampaignService,
+    _write_numbers,
+    iter_line_batches,
+    numbers_path,
+    read_numbers,
+    record_campaign_result,
+)
+from src.application.services.job_archiver import archive_metadata
+from src.application.services.job_state_cache import JobStateCache
+from src.domain.enums import CampaignStatus, JobStatus, OutboxTopic
+from src.domain.models.campaign import Campaign
+from src.domain.models.job import Job
+from src.domain.models.job_archive import JobArchiveCount
+from src.domain.models.outbox import OutboxEvent
+
+SCHEDULED_AT = datetime(2025, 5, 20, 12, 30)
+
+
+class RecordingPubSub:
+    """Pub/sub stand-in that records published messages."""
+
+    serialize_message = staticmethod(RedisPubSubService.serialize_message)
+
+    def __init__(self):
+        self.messages = []
+
+    async def publish_updates(self, data_type, data):
+        self.messages.append(data)
+
+
+@pytest.fixture(autouse=True)
+def archive_tables():
+    """Drop the archive tables, which the database fixture does not know about."""
+
+    async def drop():
+        async with engine.begin() as conn:
+            await conn.run_sync(archive_metadata.drop_all)
+
+    asyncio.run(drop())
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    """Keep campaign files in a scratch directory."""
+    monkeypatch.setattr(app_settings, "CAMPAIGN_STORAGE_DIR", str(tmp_path))
+    return tmp_path
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(chunks):
+    return [lines async for lines in iter_line_batches(chunks)]
+
+
+def test_lines_split_across_chunks_are_joined():
+    """Test a line split between chunks is yielded once, whole, with the chunk that completes it."""
+    batches = asyncio.run(collect(stream(b"+15550100\n+1555", b"0101\n+15550102\n", b"+15550103")))
+    assert batches == [[b"+15550100"], [b"+15550101", b"+15550102"], [b"+15550103"]]
+
+
+def test_overlong_lines_are_rejected():
+    """Test a line longer than MAX_LINE_BYTES raises instead of being buffered."""
+    with pytest.raises(ValueError):
+        asyncio.run(collect(stream(b"1" * (MAX_LINE_BYTES + 1))))
+
+
+def test_csv_header_selects_the_phone_number_column():
+    """Test a phone_number header picks its column and is carried to later batches."""
+    file = io.BytesIO()
+    accepted, rejected, column = _write_numbers(
+        file, [b"name,phone_number", b"Ann,+1 (555) 010-0100", b"Bob,not a number"], "csv", None
+    )
+    more = _write_numbers(file, [b"Cid,+15550101", b""], "csv", column)
+
+    assert (accepted, rejected, column) == (1, 1, 1)
+    assert more == (1, 0, 1)
+    assert file.getvalue() == b"+15550100100\n+15550101\n"
+
+
+def test_csv_without_header_uses_the_first_column():
+    """Test an upload without a phone_number header reads numbers from the first column."""
+    file = io.BytesIO()
+    assert _write_numbers(file, [b"+15550100,Ann", b"+15550101"], "csv", None) == (2, 0, 0)
+    assert file.getvalue() == b"+15550100\n+15550101\n"
+
+
+def test_ndjson_takes_the_phone_number_field():
+    """Test NDJSON lines are read by their phone_number field and invalid lines rejected."""
+    file = io.BytesIO()
+    lines = [b'{"phone_number": "+15550100"}', b'{"phone_number": 15550101}', b"{oops", b"[]"]
+    assert _write_numbers(file, lines, "ndjson", None) == (2, 2, None)
+    assert file.getvalue() == b"+15550100\n15550101\n"
+
+
+def test_overlong_upload_line_is_a_bad_request(storage_dir):
+    """Test an upload with an overlong line gets a 400 and leaves no numbers file."""
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            await CampaignService(db).create_campaign(
+                "campaign", SCHEDULED_AT, stream(b"+15550100\n", b"1" * (MAX_LINE_BYTES + 1)), "csv"
+            )
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(run())
+    assert error.value.status_code == 400
+    assert os.listdir(storage_dir) == []
+
+
+async def create_campaign(count: int) -> str:
+    body = "".join(f"+1555{n:07d}\n" for n in range(count)).encode()
+    async with AsyncSessionLocal() as db:
+        campaign = await CampaignService(db).create_campaign(
+            "campaign", SCHEDULED_AT, stream(body), "csv"
+        )
+    return campaign.id
+
+
+async def finish_jobs(campaign_id: str, count: int, status: JobStatus = JobStatus.COMPLETED):
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Job)
+            .where(Job.id.startswith(f"{campaign_id}:"), Job.status == JobStatus.SCHEDULED.value)
+            .limit(count)
+        )
+        for job in result.scalars().all():
+            await record_campaign_result(db, job.id, job.status, status.value)
+            job.status = status.value
+        await db.commit()
+
+
+async def campaign_state(campaign_id: str):
+    async with AsyncSessionLocal() as db:
+        campaign = await db.get(Campaign, campaign_id)
+        jobs = await db.scalar(select(func.count()).select_from(Job))
+        return campaign, jobs
+
+
+def build_dispatcher(window: int) -> CampaignDispatcherService:
+    dispatcher = CampaignDispatcherService(RecordingPubSub())
+    dispatcher.window = window
+    dispatcher.refill_batch = max(1, window // 10)
+    return dispatcher
+
+
+def test_window_is_refilled_in_batches_until_the_campaign_completes(storage_dir):
+    """Test a campaign keeps at most a window of unfinished jobs and completes when all finish."""
+    dispatcher = build_dispatcher(window=20)
+
+    async def run():
+        campaign_id = await create_campaign(25)
+        steps = [await dispatcher._advance(campaign_id), await dispatcher._advance(campaign_id)]
+        await finish_jobs(campaign_id, 1)
+        steps.append(await dispatcher._advance(campaign_id))
+        await finish_jobs(campaign_id, 1, JobStatus.FAILED)
+        steps.append(await dispatcher._advance(campaign_id))
+        campaign, jobs = await campaign_state(campaign_id)
+        async with AsyncSessionLocal() as db:
+            last = await db.get(Job, f"{campaign_id}:21")
+
+        await finish_jobs(campaign_id, 25)
+        steps.append(await dispatcher._advance(campaign_id))
+        await finish_jobs(campaign_id, 25)
+        steps.append(await dispatcher._advance(campaign_id))
+        done, _ = await campaign_state(campaign_id)
+        return campaign_id, steps, campaign, jobs, last, done
+
+    campaign_id, steps, campaign, jobs, last, done = asyncio.run(run())
+    assert steps == [20, 0, 0, 2, 3, 0]
+    assert (campaign.dispatched, campaign.completed, campaign.failed, jobs) == (22, 1, 1, 22)
+    assert campaign.cursor == 22 * len("+15550000000\n")
+    assert last.phone_number == "+15550000021"
+    assert done.status == CampaignStatus.COMPLETED and done.completed + done.failed == 25
+    assert not os.path.exists(numbers_path(campaign_id))
+    assert dispatcher.pubsub.messages[-1]["status"] == "COMPLETED"
+
+
+def test_re_expanding_numbers_collides_on_the_job_ids(storage_dir):
+    """Test a stale expansion of numbers already dispatched is rolled back, not duplicated."""
+    dispatcher = build_dispatcher(window=10)
+
+    async def run():
+        campaign_id = await create_campaign(5)
+        first = await dispatcher._advance(campaign_id)
+        async with AsyncSessionLocal() as db:
+            campaign = await db.get(Campaign, campaign_id)
+            campaign.cursor, campaign.dispatched = 0, 0
+            await db.commit()
+        again = await dispatcher._advance(campaign_id)
+        return first, again, await campaign_state(campaign_id)
+
+    first, again, (campaign, jobs) = asyncio.run(run())
+    assert (first, again, jobs) == (5, 0, 5)
+    assert campaign.dispatched == 0
+
+
+def test_campaign_jobs_are_announced_as_scheduled(storage_dir):
+    """Test every job a campaign creates stages a scheduled status message for the job state cache."""
+    dispatcher = build_dispatcher(window=10)
+
+    async def run():
+        campaign_id = await create_campaign(3)
+        await dispatcher._advance(campaign_id)
+        async with AsyncSessionLocal() as db:
+            payloads = await db.scalars(
+                select(OutboxEvent.payload).where(OutboxEvent.topic == OutboxTopic.PUBLISH)
+            )
+            payloads = payloads.all()
+        cache = JobStateCache(recent_size=10, recent_seconds=60)
+        for payload in payloads:
+            cache.apply(json.loads(payload))
+        return campaign_id, cache.active
+
+    campaign_id, active = asyncio.run(run())
+    assert sorted(active) == [f"{campaign_id}:{n}" for n in range(3)]
+    assert {job["status"] for job in active.values()} == {JobStatus.SCHEDULED.value}
+    assert {job["schedule_time"] for job in active.values()} == {SCHEDULED_AT.isoformat()}
+
+
+def test_finished_jobs_are_archived_as_the_window_advances(storage_dir):
+    """Test a campaign's finished jobs leave the jobs table as its window is refilled."""
+    dispatcher = build_dispatcher(window=10)
+    dispatcher.interval = 0
+
+    async def run():
+        campaign_id = await create_campaign(25)
+        await dispatcher._advance(campaign_id)
+        await finish_jobs(campaign_id, 10)
+        await dispatcher._advance(campaign_id)
+        campaign, jobs = await campaign_state(campaign_id)
+        async with AsyncSessionLocal() as db:
+            archived = await db.scalar(select(func.sum(JobArchiveCount.count)))
+        return campaign, jobs, archived
+
+    campaign, jobs, archived = asyncio.run(run())
+    assert (campaign.dispatched, campaign.completed) == (20, 10)
+    assert (jobs, archived) == (10, 10)
+
+
+def test_stale_expansion_does_not_recreate_archived_jobs(storage_dir, monkeypatch):
+    """Test an expansion that read an old cursor is rolled back after its jobs were archived."""
+    stale, current = build_dispatcher(window=10), build_dispatcher(window=10)
+    current.interval = 0
+    read_started, reads = threading.Event(), []
+
+    def slow_first_read(path, offset, limit):
+        reads.append(offset)
+        if len(reads) == 1:
+            read_started.set()
+            time.sleep(0.5)
+        return read_numbers(path, offset, limit)
+
+    monkeypatch.setattr(campaign_service, "read_numbers", slow_first_read)
+
+    async def run():
+        campaign_id = await create_campaign(25)
+        expanding = asyncio.create_task(stale._advance(campaign_id))
+        await asyncio.to_thread(read_started.wait, 5)
+        await current._advance(campaign_id)
+        await finish_jobs(campaign_id, 10)
+        await current._advance(campaign_id)
+        return await expanding, await campaign_state(campaign_id)
+
+    created, (campaign, jobs) = asyncio.run(run())
+    assert created == 0
+    assert campaign.dispatched == 20 and jobs == 10
+
+
+def test_campaigns_stored_on_another_instance_are_skipped(storage_dir):
+    """Test an instance without a campaign's numbers file leaves the campaign alone."""
+    dispatcher = build_dispatcher(window=10)
+
+    async def run():
+        campaign_id = await create_campaign(5)
+        os.remove(numbers_path(campaign_id))
+        return await dispatcher.dispatch_once(), await campaign_state(campaign_id)
+
+    dispatched, (campaign, jobs) = asyncio.run(run())
+    assert (dispatched, jobs, campaign.dispatched) == (0, 0, 0)
+    assert dispatcher.pubsub.messages == []
+
+
+def test_finished_campaign_jobs_are_counted_once():
+    """Test a campaign job is counted when it first finishes, and other jobs are ignored."""
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            db.add(Campaign(id="c1", name="campaign", schedule_time=SCHEDULED_AT, total=3))
+            await db.commit()
+            results = [
+                await record_campaign_result(db, "c1:0", JobStatus.IN_PROGRESS, JobStatus.COMPLETED),
+                await record_campaign_result(db, "c1:1", "IN_PROGRESS", "FAILED"),
+                await record_campaign_result(db, "c1:0", JobStatus.COMPLETED, JobStatus.FAILED),
+                await record_campaign_result(db, "c1:2", JobStatus.SCHEDULED, JobStatus.IN_PROGRESS),
+                await record_campaign_result(db, "standalone", "IN_PROGRESS", "COMPLETED"),
+            ]
+            await db.commit()
+        campaign, _ = await campaign_state("c1")
+        return results, campaign
+
+    results, campaign = asyncio.run(run())
+    assert results == [True, True, False, False, False]
+    assert (campaign.completed, campaign.failed) == (1, 1)
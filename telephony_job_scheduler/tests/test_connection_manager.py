@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from config.settings import app_settings
+from infrastructure.websockets import connection_manager as connection_manager_module
+from infrastructure.websockets.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """WebSocket that records frames, or never finishes sending when stalled."""
+
+    def __init__(self, name: str, stalled: bool = False):
+        self.client = name
+        self.stalled = stalled
+        self.frames = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.frames.append(text)
+
+    async def close(self, code, reason=""):
+        self.closed_with = code
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A fresh connection manager with a small send queue and connection cap."""
+    monkeypatch.setattr(ConnectionManager, "_instance", None)
+    monkeypatch.setattr(app_settings, "WS_SEND_QUEUE_SIZE", 2)
+    monkeypatch.setattr(app_settings, "WS_MAX_CONNECTIONS", 2)
+    monkeypatch.setattr(app_settings, "WS_IDLE_TIMEOUT", 0)
+    return ConnectionManager()
+
+
+def test_overflowing_connections_are_reaped(manager):
+    """Test a client whose send queue overflows is closed while others get every message."""
+    fast, stalled = FakeWebSocket("fast"), FakeWebSocket("stalled", stalled=True)
+    reaped = connection_manager_module.CONNECTIONS_REAPED.labels(reason="slow")
+    reaped_before = reaped.value()
+
+    async def run():
+        await manager.connect(fast, "public")
+        await manager.connect(stalled, "public")
+        for n in range(4):
+            await manager.broadcast({"n": n})
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert fast.frames == ['{"n":0}', '{"n":1}', '{"n":2}', '{"n":3}']
+    assert stalled.closed_with == 1008
+    assert stalled not in manager.send_queues and manager.open_connections == 1
+    assert reaped.value() == reaped_before + 1
+
+
+def test_connections_over_the_cap_are_closed_with_1013(manager):
+    """Test connections beyond WS_MAX_CONNECTIONS are refused with 1013 and free slots are reused."""
+    sockets = [FakeWebSocket(f"client-{n}") for n in range(4)]
+
+    async def run():
+        accepted = [await manager.connect(socket, "public") for socket in sockets[:3]]
+        await manager.disconnect(sockets[0], "public")
+        accepted.append(await manager.connect(sockets[3], "public"))
+        return accepted
+
+    assert asyncio.run(run()) == [True, True, False, True]
+    assert sockets[2].closed_with == 1013
+    assert manager.open_connections == 2
+
+
+def test_initial_frame_is_rebuilt_when_the_state_moves_on(manager):
+    """Test a connect frame built outside the lock is rebuilt if the state changed meanwhile."""
+    client = FakeWebSocket("client")
+    state = {"version": 0}
+    builds = []
+
+    async def initial():
+        version = state["version"]
+        builds.append(version)
+        if len(builds) == 1:
+            state["version"] += 1  # An update lands while the first frame is built
+        return version, f"state {version}"
+
+    async def run():
+        await manager.connect(
+            client, "public", initial=initial, initial_version=lambda: state["version"]
+        )
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert builds == [0, 1]
+    assert client.frames == ["state 1"]
+
+
+def test_initial_frame_is_built_under_the_lock_when_it_keeps_going_stale(manager):
+    """Test a connect frame that never settles is built once more while broadcasts wait."""
+    client = FakeWebSocket("client")
+    state = {"version": 0}
+
+    async def initial():
+        state["version"] += 1
+        return state["version"] - 1, f"state {state['version'] - 1}"
+
+    async def run():
+        await manager.connect(
+            client, "public", initial=initial, initial_version=lambda: state["version"]
+        )
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert state["version"] == connection_manager_module.INITIAL_FRAME_ATTEMPTS + 1
+    assert client.frames == [f"state {connection_manager_module.INITIAL_FRAME_ATTEMPTS}"]
+
+
+def test_failed_initial_frame_gives_back_the_slot(manager):
+    """Test a connection whose initial frame cannot be built does not keep a connection slot."""
+    client = FakeWebSocket("client")
+
+    async def initial():
+        raise RuntimeError("snapshot failed")
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await manager.connect(client, "public", initial=initial)
+
+    asyncio.run(run())
+    assert manager.open_connections == 0
+    assert client not in manager.send_queues
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from infrastructure.database.db import AsyncSessionLocal
+from src.application.services.recurring_jobs import occurrence_id, schedule_next_occurrence
+from src.domain.cron import CronExpression
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+from src.domain.models.recurring_job import RecurringJob
+from src.main import app
+
+
+@pytest.mark.parametrize(
+    "expression, after, expected",
+    [
+        ("*/15 * * * *", datetime(2025, 5, 20, 12, 7), datetime(2025, 5, 20, 12, 15)),
+        ("*/15 * * * *", datetime(2025, 5, 20, 12, 45, 30), datetime(2025, 5, 20, 13, 0)),
+        ("0 9-17/4 * * *", datetime(2025, 5, 20, 13, 0), datetime(2025, 5, 20, 17, 0)),
+        ("0,30 8 * * *", datetime(2025, 5, 20, 8, 0), datetime(2025, 5, 20, 8, 30)),
+        ("0 9 * * MON-FRI", datetime(2025, 5, 23, 10, 0), datetime(2025, 5, 26, 9, 0)),
+        ("0 0 1 jan,Jul *", datetime(2025, 2, 1), datetime(2025, 7, 1)),
+        ("0 0 * * 7", datetime(2025, 5, 20), datetime(2025, 5, 25)),
+        ("@hourly", datetime(2025, 12, 31, 23, 59), datetime(2026, 1, 1, 0, 0)),
+        ("0 0 13 * FRI", datetime(2025, 5, 20), datetime(2025, 5, 23)),
+        ("0 0 13 * FRI", datetime(2025, 5, 31), datetime(2025, 6, 6)),
+        ("0 0 13 * *", datetime(2025, 5, 20), datetime(2025, 6, 13)),
+        ("0 0 29 2 *", datetime(2025, 3, 1), datetime(2028, 2, 29)),
+        ("0 0 29 2 MON", datetime(2025, 3, 1), datetime(2026, 2, 2)),
+    ],
+)
+def test_next_after(expression, after, expected):
+    """Test steps, ranges, names, macros, the day-of-month or day-of-week rule and leap days."""
+    assert CronExpression(expression).next_after(after) == expected
+
+
+def test_next_after_converts_aware_times_to_utc():
+    """Test an aware start time is searched from in UTC."""
+    after = datetime(2025, 5, 20, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert CronExpression("30 12 * * *").next_after(after) == datetime(2025, 5, 20, 12, 30)
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "*/0 * * * *", "0 0 * FOO *", "5-1 * * * *"]
+)
+def test_invalid_expressions_are_rejected(expression):
+    """Test malformed fields raise a ValueError naming the expression."""
+    with pytest.raises(ValueError, match="expression"):
+        CronExpression(expression)
+
+
+def test_expressions_that_never_fire_are_rejected():
+    """Test next_after raises for a date that does not exist instead of searching forever."""
+    with pytest.raises(ValueError, match="never fires"):
+        CronExpression("0 0 30 2 *").next_after(datetime(2025, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"job_name": "call", "phone_number": "+15550100", "cron": "not a cron"},
+        {"job_name": "call", "phone_number": "+15550100", "cron": "0 0 31 4 *"},
+        {"job_name": "call", "phone_number": "+15550100"},
+    ],
+)
+def test_job_requests_with_bad_schedules_are_unprocessable(body):
+    """Test job requests with an invalid or never-firing cron, or no schedule, get a 422."""
+    response = TestClient(app).post("/jobs", json=body)
+    assert response.status_code == 422
+
+
+def occurrence(recurring: RecurringJob, run_at: datetime, status: JobStatus) -> Job:
+    return Job(
+        id=occurrence_id(recurring.id, run_at),
+        job_name=recurring.job_name,
+        phone_number=recurring.phone_number,
+        status=status.value,
+        schedule_time=run_at,
+    )
+
+
+def test_next_occurrence_skips_missed_fire_times():
+    """Test the next occurrence of a late-finishing job is the first fire time after now."""
+    recurring = RecurringJob(
+        id="daily", job_name="call", phone_number="+15550100", cron="*/5 * * * *", active=True
+    )
+    finished = datetime.utcnow() - timedelta(hours=1)
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            job = occurrence(recurring, finished, JobStatus.IN_PROGRESS)
+            db.add_all([recurring, job])
+            await db.commit()
+            next_job = await schedule_next_occurrence(
+                db, job, JobStatus.IN_PROGRESS, JobStatus.COMPLETED
+            )
+            await db.commit()
+            return next_job.id, next_job.schedule_time
+
+    job_id, schedule_time = asyncio.run(run())
+    now = datetime.utcnow()
+    assert now < schedule_time <= now + timedelta(minutes=5)
+    assert schedule_time.minute % 5 == 0
+    assert job_id == occurrence_id("daily", schedule_time)
+
+
+def test_next_occurrence_is_created_once():
+    """Test an occurrence that already exists, or an unfinished transition, creates no new job."""
+    recurring = RecurringJob(
+        id="weekly", job_name="call", phone_number="+15550100", cron="0 9 * * MON", active=True
+    )
+    first = CronExpression(recurring.cron).next_after(datetime.utcnow())
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            job = occurrence(recurring, first, JobStatus.IN_PROGRESS)
+            db.add_all([recurring, job])
+            await db.commit()
+            created = await schedule_next_occurrence(
+                db, job, JobStatus.IN_PROGRESS, JobStatus.COMPLETED
+            )
+            await db.commit()
+            again = await schedule_next_occurrence(
+                db, job, JobStatus.IN_PROGRESS, JobStatus.FAILED
+            )
+            unfinished = await schedule_next_occurrence(
+                db, job, JobStatus.SCHEDULED, JobStatus.IN_PROGRESS
+            )
+            return created, again, unfinished
+
+    created, again, unfinished = asyncio.run(run())
+    assert created.schedule_time == first + timedelta(weeks=1)
+    assert again is None and unfinished is None
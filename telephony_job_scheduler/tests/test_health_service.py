@@ -0,0 +1,37 @@
+import asyncio
+
+import fakeredis
+
+from infrastructure.loop_monitor import LoopLagMonitor
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.services.health_service import readiness_report
+from src.middleware.admission_middleware import AdmissionController
+
+
+def build_admission() -> AdmissionController:
+    return AdmissionController(
+        max_in_flight=0, max_latency_ms=0, max_loop_lag_ms=0, loop_monitor=LoopLagMonitor()
+    )
+
+
+def test_ready_reports_redis_with_the_memory_queue():
+    """Test /ready reports Redis in memory mode without failing readiness when it is down."""
+
+    class DownRedis:
+        async def ping(self):
+            raise ConnectionError("Redis is down")
+
+    up, down = RedisPubSubService(), RedisPubSubService()
+    up.redis_conn = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    down.redis_conn = DownRedis()
+
+    async def run():
+        return (
+            await readiness_report(build_admission(), up),
+            await readiness_report(build_admission(), down),
+        )
+
+    (up_ready, up_report), (down_ready, down_report) = asyncio.run(run())
+    assert up_ready and up_report["dependencies"]["redis"] == "ok"
+    assert down_ready and down_report["dependencies"]["redis"] == "error: ConnectionError"
+    assert down_report["dependencies"]["queue"] == down_report["dependencies"]["database"] == "ok"
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from infrastructure.database.db import AsyncSessionLocal, engine
+from src.application.services.job_archiver import (
+    JobArchiverService,
+    archive_metadata,
+    archive_table,
+)
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+from src.domain.models.job_archive import JobArchiveCount
+
+SCHEDULED_AT = datetime(2025, 5, 20, 12, 30)
+
+
+@pytest.fixture(autouse=True)
+def archive_tables():
+    """Drop the archive tables, which the database fixture does not know about."""
+
+    async def drop():
+        async with engine.begin() as conn:
+            await conn.run_sync(archive_metadata.drop_all)
+
+    asyncio.run(drop())
+
+
+async def add_jobs(count: int, status: JobStatus, updated_at: datetime, prefix: str):
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                Job(
+                    id=f"{prefix}-{i}",
+                    job_name="job",
+                    phone_number="+15550100",
+                    status=status.value,
+                    schedule_time=SCHEDULED_AT,
+                    updated_at=updated_at,
+                )
+                for i in range(count)
+            ]
+        )
+        await db.commit()
+
+
+async def archived_state():
+    async with AsyncSessionLocal() as db:
+        counts = await db.execute(
+            select(JobArchiveCount.hour, JobArchiveCount.status, JobArchiveCount.count)
+        )
+        archived = await db.scalar(select(func.count()).select_from(archive_table("202505")))
+        remaining = await db.execute(select(Job.id))
+        return counts.all(), archived, sorted(job_id for (job_id,) in remaining.all())
+
+
+def build_archiver(batch_size: int) -> JobArchiverService:
+    archiver = JobArchiverService()
+    archiver.archive_after = 60
+    archiver.batch_size = batch_size
+    return archiver
+
+
+def test_only_old_finished_jobs_are_archived():
+    """Test finished jobs past the cutoff move to the month's archive table and are counted."""
+    old = datetime.utcnow() - timedelta(hours=1)
+
+    async def run():
+        await add_jobs(2, JobStatus.COMPLETED, old, "done")
+        await add_jobs(1, JobStatus.FAILED, old, "failed")
+        await add_jobs(1, JobStatus.COMPLETED, datetime.utcnow(), "recent")
+        await add_jobs(1, JobStatus.SCHEDULED, old, "pending")
+        archived = await build_archiver(batch_size=10).archive_once()
+        return archived, await archived_state()
+
+    archived, (counts, rows, remaining) = asyncio.run(run())
+    assert archived == rows == 3
+    assert sorted(counts, key=lambda row: row[1].value) == [
+        ("2025-05-20T12:00", JobStatus.COMPLETED, 2),
+        ("2025-05-20T12:00", JobStatus.FAILED, 1),
+    ]
+    assert remaining == ["pending-0", "recent-0"]
+
+
+def test_concurrent_archivers_count_each_job_once():
+    """Test instances archiving the same batch at once count and copy every job once."""
+    old = datetime.utcnow() - timedelta(hours=1)
+
+    async def run():
+        await add_jobs(20, JobStatus.COMPLETED, old, "done")
+        archivers = [build_archiver(batch_size=20) for _ in range(3)]
+        archived = await asyncio.gather(*(archiver.archive_once() for archiver in archivers))
+        return archived, await archived_state()
+
+    archived, (counts, rows, remaining) = asyncio.run(run())
+    assert sum(archived) == rows == 20
+    assert counts == [("2025-05-20T12:00", JobStatus.COMPLETED, 20)]
+    assert remaining == []
@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+from src.application.services.job_state_cache import ACTIVE_EVICTIONS, JobStateCache
+
+
+def status(job_id: str, label: str) -> dict:
+    return {"job_status": {"job_id": job_id, "status": label, "job_details": {"job_name": "call"}}}
+
+
+def test_live_jobs_are_capped():
+    """Test the least recently updated live job is dropped once the cache is full."""
+    cache = JobStateCache(recent_size=10, recent_seconds=60, max_active=2)
+    evicted = ACTIVE_EVICTIONS.labels().value()
+
+    async def run():
+        for job_id in ("a", "b"):
+            cache.apply(status(job_id, "scheduled"))
+        cache.apply(status("a", "processing"))
+        cache.apply(status("c", "scheduled"))
+        cache.apply(status("a", "completed"))
+        return list(cache.active), list(cache.finished)
+
+    assert asyncio.run(run()) == (["c"], ["a"])
+    assert ACTIVE_EVICTIONS.labels().value() == evicted + 1
+
+
+def test_snapshot_is_reused_until_the_cache_changes():
+    """Test the snapshot is serialized once per cache version and reports that version."""
+    cache = JobStateCache(recent_size=10, recent_seconds=60)
+
+    async def run():
+        cache.apply(status("a", "scheduled"))
+        first = await cache.snapshot_message()
+        again = await cache.snapshot_message()
+        cache.apply(status("a", "completed"))
+        return first, again, await cache.snapshot_message()
+
+    first, again, changed = asyncio.run(run())
+    assert again is first
+    assert changed[0] == first[0] + 1
+    jobs = json.loads(changed[1])["snapshot"]["jobs"]
+    assert [(job[0], job[2]) for job in jobs] == [("a", "COMPLETED")]
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime
+
+from infrastructure.database.db import AsyncSessionLocal
+from src.application.services.job_stats import JobStatsService
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+from src.domain.models.job_archive import JobArchiveCount
+from src.routers import websocket as websocket_router
+
+NOON = datetime(2025, 5, 20, 12, 30)
+
+
+def build_stats() -> JobStatsService:
+    return JobStatsService(reconcile_interval=0, stream_interval=0)
+
+
+def test_record_counts_new_jobs_and_transitions():
+    """Test new jobs are counted by status and hour, and transitions move them between statuses."""
+    stats = build_stats()
+    stats.record(None, JobStatus.SCHEDULED, NOON)
+    stats.record(None, JobStatus.SCHEDULED, NOON)
+    stats.record(JobStatus.SCHEDULED, JobStatus.IN_PROGRESS, NOON)
+    stats.record(JobStatus.IN_PROGRESS.value, JobStatus.IN_PROGRESS.value, NOON)
+
+    snapshot = stats.snapshot()
+    assert snapshot["total"] == 2
+    assert snapshot["by_status"]["SCHEDULED"] == snapshot["by_status"]["IN_PROGRESS"] == 1
+    assert snapshot["by_hour"] == {"2025-05-20T12:00": 2}
+
+
+def test_reconcile_corrects_drift_and_publishes_the_correction():
+    """Test reconciliation replaces the counters with table counts and publishes the difference."""
+    stats = build_stats()
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            db.add_all(
+                [
+                    Job(
+                        id=f"job-{i}",
+                        job_name="job",
+                        phone_number="+15550100",
+                        status=JobStatus.COMPLETED.value,
+                        schedule_time=NOON,
+                    )
+                    for i in range(3)
+                ]
+            )
+            db.add(JobArchiveCount(hour="2025-05-20T11:00", status=JobStatus.FAILED, count=2))
+            await db.commit()
+        stats.record(None, JobStatus.SCHEDULED, NOON)
+        stats._publish()
+        await stats.reconcile()
+        stats._publish()
+        return stats.snapshot(), stats.last_delta
+
+    snapshot, delta = asyncio.run(run())
+    assert snapshot["by_status"]["COMPLETED"] == 3 and snapshot["by_status"]["FAILED"] == 2
+    assert snapshot["by_status"]["SCHEDULED"] == 0 and snapshot["total"] == 5
+    assert snapshot["by_hour"] == {"2025-05-20T11:00": 2, "2025-05-20T12:00": 3}
+    assert delta == {
+        "by_status": {"SCHEDULED": -1, "COMPLETED": 3, "FAILED": 2},
+        "by_hour": {"2025-05-20T11:00": 2, "2025-05-20T12:00": 2},
+    }
+    assert snapshot["version"] == 2 and snapshot["reconciled_at"] is not None
+
+
+def test_deltas_are_versioned_and_empty_ones_skipped():
+    """Test each published delta bumps the version and a publish with no changes does not."""
+    stats = build_stats()
+
+    async def run():
+        waiter = asyncio.ensure_future(stats.wait_for_delta())
+        await asyncio.sleep(0)
+        stats.record(None, JobStatus.SCHEDULED, NOON)
+        stats._publish()
+        first = await waiter
+        stats._publish()
+        return first, stats.version
+
+    (version, delta), after_empty = asyncio.run(run())
+    assert version == after_empty == 1
+    assert delta == {"by_status": {"SCHEDULED": 1}, "by_hour": {"2025-05-20T12:00": 1}}
+
+
+def test_stream_falls_back_to_a_snapshot_after_a_missed_version(monkeypatch):
+    """Test the stats stream sends deltas in sequence and a snapshot when it fell behind."""
+    stats = build_stats()
+    monkeypatch.setattr(websocket_router, "job_stats", stats)
+
+    class RecordingWebSocket:
+        def __init__(self):
+            self.frames = []
+
+        async def send_json(self, data):
+            self.frames.append(data)
+
+    websocket = RecordingWebSocket()
+
+    async def run():
+        sender = asyncio.ensure_future(websocket_router._send_job_stats(websocket))
+        await asyncio.sleep(0)
+        stats.record(None, JobStatus.SCHEDULED, NOON)
+        stats._publish()
+        await asyncio.sleep(0)
+        for _ in range(2):
+            stats.record(JobStatus.SCHEDULED, JobStatus.IN_PROGRESS, NOON)
+            stats.record(JobStatus.IN_PROGRESS, JobStatus.SCHEDULED, NOON)
+            stats.record(None, JobStatus.SCHEDULED, NOON)
+            stats._publish()
+        await asyncio.sleep(0)
+        sender.cancel()
+
+    asyncio.run(run())
+    kinds = [next(iter(frame)) for frame in websocket.frames]
+    assert kinds == ["snapshot", "delta", "snapshot"]
+    assert websocket.frames[1]["delta"]["version"] == 1
+    assert websocket.frames[2]["snapshot"]["version"] == 3
+    assert websocket.frames[2]["snapshot"]["by_status"]["SCHEDULED"] == 3
+
+
+def test_stream_send_errors_close_the_socket():
+    """Test a send that fails with an error other than a disconnect closes the socket quietly."""
+
+    class BrokenWebSocket:
+        closed_with = None
+
+        async def send_json(self, data):
+            raise RuntimeError("Cannot call send once a close message has been sent")
+
+        async def close(self, code=1000):
+            self.closed_with = code
+
+    websocket = BrokenWebSocket()
+    asyncio.run(websocket_router._send_job_stats(websocket))
+    assert websocket.closed_with == 1011
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from infrastructure.database.db import AsyncSessionLocal, engine
+from infrastructure.queue.memory_queue import InMemoryQueue
+from src.application.services import job_worker as job_worker_module
+from src.application.services.job_worker import JobWorkerService
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+
+
+class RecordingQueue(InMemoryQueue):
+    """In-process queue that records every push_many call."""
+
+    def __init__(self):
+        super().__init__()
+        self.pushes = []
+
+    async def push_many(self, ready, scheduled):
+        self.pushes.append((list(ready), list(scheduled)))
+        await super().push_many(ready, scheduled)
+
+
+async def add_jobs(*jobs):
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                Job(
+                    id=job_id,
+                    job_name=job_id,
+                    phone_number="+15550100",
+                    status=JobStatus.SCHEDULED.value,
+                    schedule_time=schedule_time,
+                )
+                for job_id, schedule_time in jobs
+            ]
+        )
+        await db.commit()
+
+
+def count_selects():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return statements, lambda: event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+def test_drain_cancels_sleeping_jobs_and_gives_calls_grace():
+    """Test sleeping jobs are cancelled at once and calls in progress get the grace period."""
+    queue = RecordingQueue()
+    now = datetime.utcnow()
+    cancelled_at = {}
+
+    async def hold(job_id: str, seconds: float):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            cancelled_at[job_id] = time.perf_counter()
+            raise
+
+    async def run():
+        await add_jobs(
+            ("sleeping", now + timedelta(hours=1)),
+            ("quick-call", now - timedelta(seconds=1)),
+            ("slow-call", now - timedelta(seconds=1)),
+        )
+        async with AsyncSessionLocal() as db:
+            worker = JobWorkerService(db, queue)
+            for job_id, seconds in (("sleeping", 60), ("quick-call", 0.05), ("slow-call", 60)):
+                worker.active_jobs[job_id] = asyncio.create_task(hold(job_id, seconds))
+            worker.calling_jobs.update({"quick-call", "slow-call"})
+            await asyncio.sleep(0)
+
+            started = time.perf_counter()
+            await worker.drain(timeout=0.3)
+            return started, time.perf_counter() - started
+
+    started, took = asyncio.run(run())
+    assert cancelled_at["sleeping"] - started < 0.1
+    assert "quick-call" not in cancelled_at
+    assert cancelled_at["slow-call"] - started >= 0.3
+    assert took < 1
+    ((ready, scheduled),) = queue.pushes
+    assert ready == [{"id": "slow-call"}]
+    assert [job["id"] for job, _ in scheduled] == ["sleeping"]
+
+
+def test_requeue_uses_chunked_queries_and_one_push(monkeypatch):
+    """Test cancelled jobs are requeued with one status query per chunk and one queue push."""
+    monkeypatch.setattr(job_worker_module, "REQUEUE_QUERY_CHUNK", 4)
+    queue = RecordingQueue()
+    job_ids = [f"job-{i}" for i in range(10)]
+
+    async def run():
+        await add_jobs(*((job_id, datetime.utcnow() + timedelta(hours=1)) for job_id in job_ids))
+        async with AsyncSessionLocal() as db:
+            worker = JobWorkerService(db, queue)
+            for job_id in job_ids:
+                worker.active_jobs[job_id] = asyncio.create_task(asyncio.sleep(60))
+            await asyncio.sleep(0)
+
+            statements, stop = count_selects()
+            try:
+                requeued = await worker._cancel_active_jobs(grace=0)
+            finally:
+                stop()
+            return requeued, len(statements)
+
+    requeued, selects = asyncio.run(run())
+    assert requeued == 10
+    assert selects == 3
+    ((ready, scheduled),) = queue.pushes
+    assert ready == [] and sorted(job["id"] for job, _ in scheduled) == sorted(job_ids)
+
+
+def test_job_dequeued_during_the_drain_is_handed_back():
+    """Test a job dequeued just as the drain starts is requeued instead of started."""
+
+    class DrainingQueue(RecordingQueue):
+        """Queue that starts the worker's drain while handing out a job."""
+
+        worker = None
+
+        async def dequeue(self):
+            job_data = await super().dequeue()
+            if job_data is not None:
+                self.worker.draining = True
+            return job_data
+
+    queue = DrainingQueue()
+
+    async def run():
+        await queue.enqueue({"id": "late"})
+        async with AsyncSessionLocal() as db:
+            worker = queue.worker = JobWorkerService(db, queue)
+            await worker.run()
+            await worker.drain(timeout=0)
+            return worker.active_jobs
+
+    assert asyncio.run(run()) == {}
+    ((ready, scheduled),) = queue.pushes
+    assert ready == [{"id": "late"}] and scheduled == []
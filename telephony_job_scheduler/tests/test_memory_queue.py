@@ -0,0 +1,131 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from infrastructure.database.db import AsyncSessionLocal
+from infrastructure.queue.memory_queue import InMemoryQueue
+from src.application.services.outbox_relay import enqueue_event
+from src.application.services.queue_recovery import rebuild_memory_queue
+from src.domain.enums import JobStatus
+from src.domain.models.job import Job
+
+
+async def drain(queue: InMemoryQueue) -> list:
+    jobs = []
+    while (job := await queue.dequeue()) is not None:
+        jobs.append(job["id"])
+    return jobs
+
+
+def test_jobs_are_dequeued_in_due_time_order():
+    """Test scheduled jobs come out by due time, after ready jobs, and not before they are due."""
+    queue = InMemoryQueue()
+    now = datetime.utcnow()
+
+    async def run():
+        await queue.schedule({"id": "late"}, now - timedelta(seconds=1))
+        await queue.schedule({"id": "early"}, now - timedelta(seconds=5))
+        await queue.schedule({"id": "future"}, now + timedelta(hours=1))
+        await queue.enqueue({"id": "ready"})
+        return await drain(queue), await queue.scheduled_depth()
+
+    assert asyncio.run(run()) == (["ready", "early", "late"], 1)
+
+
+def test_push_many_enqueues_and_schedules_in_one_call():
+    """Test push_many appends ready jobs in order and schedules the rest."""
+    queue = InMemoryQueue()
+    now = datetime.utcnow()
+
+    async def run():
+        await queue.push_many(
+            [{"id": "a"}, {"id": "b"}],
+            [({"id": "due"}, now - timedelta(seconds=1)), ({"id": "later"}, now + timedelta(hours=1))],
+        )
+        depths = await queue.ready_depth(), await queue.scheduled_depth()
+        return depths, await drain(queue)
+
+    assert asyncio.run(run()) == ((2, 2), ["a", "b", "due"])
+
+
+def test_wait_wakes_for_new_and_newly_due_jobs():
+    """Test wait returns as soon as a job arrives or the next scheduled job is due."""
+    queue = InMemoryQueue()
+
+    async def timed_wait() -> float:
+        start = time.perf_counter()
+        await queue.wait(5)
+        return time.perf_counter() - start
+
+    async def run():
+        waiting = asyncio.create_task(timed_wait())
+        await asyncio.sleep(0.05)
+        await queue.enqueue({"id": "new"})
+        woken_by_job = await waiting
+        await drain(queue)
+
+        await queue.schedule({"id": "soon"}, datetime.utcnow() + timedelta(seconds=0.1))
+        woken_by_due = await timed_wait()
+        return woken_by_job, woken_by_due, await drain(queue)
+
+    woken_by_job, woken_by_due, jobs = asyncio.run(run())
+    assert woken_by_job < 1
+    assert 0.05 < woken_by_due < 1
+    assert jobs == ["soon"]
+
+
+def test_snapshot_is_restored_on_start(tmp_path):
+    """Test a queue started from a snapshot holds the same ready and scheduled jobs."""
+    path = str(tmp_path / "queue.json")
+    later = datetime.utcnow() + timedelta(hours=1)
+
+    async def run():
+        queue = InMemoryQueue(snapshot_path=path, snapshot_interval=60)
+        await queue.start()
+        await queue.push_many([{"id": "a"}, {"id": "b"}], [({"id": "later"}, later)])
+        await queue.close()
+
+        restored = InMemoryQueue(snapshot_path=path, snapshot_interval=60)
+        await restored.start()
+        depths = await restored.ready_depth(), await restored.scheduled_depth()
+        jobs = await drain(restored)
+        await restored.close()
+        return depths, jobs
+
+    assert asyncio.run(run()) == ((2, 1), ["a", "b"])
+
+
+def test_queue_is_rebuilt_from_the_jobs_table():
+    """Test startup drops finished jobs from a stale snapshot and adds jobs it missed."""
+    queue = InMemoryQueue()
+    now = datetime.utcnow()
+
+    def job(job_id: str, status: JobStatus) -> Job:
+        return Job(
+            id=job_id,
+            job_name=job_id,
+            phone_number="+15550100",
+            status=status.value,
+            schedule_time=now - timedelta(seconds=1),
+        )
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            db.add_all(
+                [
+                    job("kept", JobStatus.SCHEDULED),
+                    job("finished", JobStatus.COMPLETED),
+                    job("missed", JobStatus.SCHEDULED),
+                    job("interrupted", JobStatus.IN_PROGRESS),
+                    job("in-outbox", JobStatus.SCHEDULED),
+                    enqueue_event({"id": "in-outbox"}),
+                ]
+            )
+            await db.commit()
+        await queue.push_many([{"id": "kept"}, {"id": "finished"}, {"id": "kept"}], [])
+        added = await rebuild_memory_queue(queue)
+        return added, await drain(queue)
+
+    added, jobs = asyncio.run(run())
+    assert added == 2
+    assert jobs[0] == "kept" and sorted(jobs[1:]) == ["interrupted", "missed"]
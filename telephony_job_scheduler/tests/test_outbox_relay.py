@@ -0,0 +1,139 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import fakeredis
+from sqlalchemy import func, select, text, update
+
+from infrastructure.database.db import AsyncSessionLocal, engine
+from infrastructure.queue.memory_queue import InMemoryQueue
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.services.outbox_relay import (
+    OutboxRelayService,
+    enqueue_event,
+    publish_event,
+)
+from src.domain.models.outbox import OutboxEvent
+
+
+def build_relay(queue: InMemoryQueue, redis=None) -> OutboxRelayService:
+    pubsub = RedisPubSubService()
+    pubsub.redis_conn = redis or fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return OutboxRelayService(queue, pubsub)
+
+
+async def add_events(events):
+    async with AsyncSessionLocal() as db:
+        db.add_all(events)
+        await db.commit()
+
+
+async def outbox_size() -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(OutboxEvent))
+
+
+def test_concurrent_relays_deliver_each_event_once():
+    """Test relays draining the same outbox never push or publish an event twice."""
+    queue = InMemoryQueue()
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    async def run():
+        await add_events([enqueue_event({"id": f"job-{i}"}) for i in range(300)])
+        await add_events([publish_event(json.dumps({"n": i})) for i in range(300)])
+        relays = [build_relay(queue, redis) for _ in range(3)]
+        for relay in relays:
+            relay.batch_size = 50
+
+        messages = []
+        listener = redis.pubsub()
+        await listener.subscribe("public_channel")
+
+        async def listen():
+            async for message in listener.listen():
+                if message["type"] == "message":
+                    messages.append(message["data"])
+
+        listening = asyncio.create_task(listen())
+        while sum(await asyncio.gather(*(relay.drain_once() for relay in relays))):
+            pass
+        for _ in range(100):
+            if len(messages) >= 300:
+                break
+            await asyncio.sleep(0.01)
+        listening.cancel()
+        return messages, await outbox_size()
+
+    messages, remaining = asyncio.run(run())
+    assert remaining == 0
+    jobs = [job["id"] for job in queue._ready]
+    assert sorted(jobs) == sorted(f"job-{i}" for i in range(300))
+    assert len(messages) == len(set(messages)) == 300
+
+
+def test_expired_claims_are_taken_over():
+    """Test events claimed by a relay that died are dispatched once the claim expires."""
+    queue = InMemoryQueue()
+
+    async def run():
+        await add_events([enqueue_event({"id": "job-1"})])
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(OutboxEvent).values(
+                    claimed_by="dead", claimed_until=datetime.utcnow() + timedelta(seconds=30)
+                )
+            )
+            await db.commit()
+        relay = build_relay(queue)
+        skipped = await relay.drain_once()
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(OutboxEvent).values(claimed_until=datetime.utcnow() - timedelta(seconds=1))
+            )
+            await db.commit()
+        return skipped, await relay.drain_once()
+
+    assert asyncio.run(run()) == (0, 1)
+    assert [job["id"] for job in queue._ready] == ["job-1"]
+
+
+def test_claim_columns_are_added_to_old_tables():
+    """Test the relay adds the claim columns to an outbox table created without them."""
+
+    async def run():
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE outbox"))
+            await conn.execute(
+                text(
+                    "CREATE TABLE outbox (id INTEGER PRIMARY KEY, topic VARCHAR(8) NOT NULL, "
+                    "payload TEXT NOT NULL, created_at DATETIME)"
+                )
+            )
+        relay = build_relay(InMemoryQueue())
+        await relay.ensure_columns()
+        await relay.ensure_columns()
+        await add_events([enqueue_event({"id": "job-1"})])
+        return await relay.drain_once()
+
+    assert asyncio.run(run()) == 1
+
+
+def test_pubsub_outage_does_not_hold_up_queue_events():
+    """Test queue events behind a full batch of undeliverable messages are still pushed."""
+    queue = InMemoryQueue()
+
+    class DownRedis:
+        def pipeline(self, transaction=True):
+            raise ConnectionError("Redis is down")
+
+    async def run():
+        await add_events([publish_event(json.dumps({"n": i})) for i in range(5)])
+        await add_events([enqueue_event({"id": "job-1"})])
+        relay = build_relay(queue, DownRedis())
+        relay.batch_size = 5
+        dispatched = await relay.drain_once()
+        return dispatched, await outbox_size()
+
+    assert asyncio.run(run()) == (1, 5)
+    assert [job["id"] for job in queue._ready] == ["job-1"]
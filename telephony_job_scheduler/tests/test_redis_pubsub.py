@@ -0,0 +1,33 @@
+import asyncio
+
+import fakeredis
+
+from infrastructure.websockets.redis_pubsub import RedisPubSubService
+from src.application.dto.websocket_dto import WebsocketMessageTypesEnum
+
+
+def test_messages_reach_every_listener():
+    """Test each listener sees every message even when another listener fails."""
+    received = []
+
+    def broken(data):
+        raise ValueError("bad listener")
+
+    async def run():
+        pubsub = RedisPubSubService(listeners=[broken, received.append])
+        pubsub.redis_conn = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        listener = asyncio.create_task(pubsub.redis_listener())
+        await asyncio.sleep(0.05)
+        for job_id in ("a", "b"):
+            await pubsub.publish_updates(
+                WebsocketMessageTypesEnum.job_status, {"job_id": job_id}
+            )
+        for _ in range(50):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.02)
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+    asyncio.run(run())
+    assert received == [{"job_status": {"job_id": "a"}}, {"job_status": {"job_id": "b"}}]
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import fakeredis
+
+from infrastructure.redis import redis_queue
+from infrastructure.redis.redis_lease import RedisLease
+from infrastructure.redis.redis_queue import RedisQueue
+
+
+def test_lease_has_one_holder_until_released_or_expired():
+    """Test only one instance holds the lease, renews it, and a follower takes over after it."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    leader, follower = RedisLease(redis, "lease", ttl_ms=100), RedisLease(redis, "lease", ttl_ms=100)
+
+    async def run():
+        results = [await leader.acquire(), await follower.acquire(), await leader.acquire()]
+        await follower.release()
+        results.append(await follower.acquire())
+        await leader.release()
+        results.append(await follower.acquire())
+        await asyncio.sleep(0.2)
+        results.append(await leader.acquire())
+        return results
+
+    assert asyncio.run(run()) == [True, False, True, False, True, True]
+
+
+def test_promote_due_moves_due_jobs_in_batches(monkeypatch):
+    """Test the promote script moves due jobs in due-time order, at most a batch per call."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_queue, "Redis", lambda **kwargs: redis)
+    queue = RedisQueue()
+    now = datetime.utcnow()
+
+    async def run():
+        await queue.push_many(
+            [],
+            [
+                ({"id": "second"}, now - timedelta(seconds=1)),
+                ({"id": "first"}, now - timedelta(seconds=5)),
+                ({"id": "future"}, now + timedelta(hours=1)),
+            ],
+        )
+        promoted = [await queue.promote_due(now, batch_size=1) for _ in range(3)]
+        jobs = [await queue.dequeue() for _ in range(3)]
+        return promoted, jobs, await queue.scheduled_depth()
+
+    promoted, jobs, scheduled = asyncio.run(run())
+    assert promoted == [1, 1, 0]
+    assert jobs == [{"id": "first"}, {"id": "second"}, None]
+    assert scheduled == 1
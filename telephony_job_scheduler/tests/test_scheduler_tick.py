@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import fakeredis
+
+from infrastructure.redis import redis_queue
+from infrastructure.redis.redis_queue import RedisQueue
+from src.application.services.scheduler_tick import SchedulerTickService
+
+
+def build_ticks(monkeypatch, count: int, batch_size: int = 3):
+    """Scheduler tick services of ``count`` instances sharing one Redis."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_queue, "Redis", lambda **kwargs: redis)
+    ticks = [SchedulerTickService(RedisQueue()) for _ in range(count)]
+    for tick in ticks:
+        tick.batch_size = batch_size
+        tick.interval = 0.01
+        tick.lease.ttl_ms = 60000
+    return ticks
+
+
+async def schedule_due(queue: RedisQueue, count: int):
+    due = datetime.utcnow() - timedelta(seconds=1)
+    await queue.push_many([], [({"id": f"job-{i}"}, due) for i in range(count)])
+
+
+def test_only_the_lease_holder_promotes(monkeypatch):
+    """Test a follower promotes nothing while another instance holds the lease."""
+    leader, follower = build_ticks(monkeypatch, 2)
+
+    async def run():
+        await schedule_due(leader.queue, 2)
+        promoted = [await leader.tick(), await follower.tick()]
+        await schedule_due(leader.queue, 1)
+        promoted.append(await follower.tick())
+        return promoted, await leader.queue.scheduled_depth()
+
+    promoted, scheduled = asyncio.run(run())
+    assert promoted == [2, 0, 0]
+    assert (leader.is_leader, follower.is_leader) == (True, False)
+    assert scheduled == 1
+
+
+def test_tick_promotes_batches_until_a_short_one(monkeypatch):
+    """Test one tick keeps promoting full batches and stops after the first partial one."""
+    (tick,) = build_ticks(monkeypatch, 1, batch_size=3)
+    batches = []
+    promote_due = tick.queue.promote_due
+
+    async def recording_promote_due(now, batch_size):
+        batches.append(await promote_due(now, batch_size))
+        return batches[-1]
+
+    tick.queue.promote_due = recording_promote_due
+
+    async def run():
+        await schedule_due(tick.queue, 7)
+        return await tick.tick(), await tick.tick()
+
+    assert asyncio.run(run()) == (7, 0)
+    assert batches == [3, 3, 1, 0]
+
+
+def test_cancelled_leader_releases_the_lease(monkeypatch):
+    """Test a follower takes over at once when the leader's tick loop is cancelled."""
+    leader, follower = build_ticks(monkeypatch, 2)
+
+    async def run():
+        task = asyncio.create_task(leader.run())
+        while not leader.is_leader:
+            await asyncio.sleep(0.01)
+        blocked = await follower.tick()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await schedule_due(follower.queue, 1)
+        return blocked, await follower.tick()
+
+    assert asyncio.run(run()) == (0, 1)
+    assert follower.is_leader